@@ -8,6 +8,8 @@ from typing import Any
 import yaml
 from loguru import logger
 
+from .io_utils import read_yaml_file
+
 
 class AgentContextLoader:
     """Loads agent-specific context for repositories."""
@@ -42,10 +44,9 @@ class AgentContextLoader:
             return self._get_default_agent_context()
 
         try:
-            with open(context_path) as f:
-                context = yaml.safe_load(f)
-                logger.info(f"Loaded agent context for {repo_full_name}")
-                return context or {}
+            context = read_yaml_file(context_path)
+            logger.info(f"Loaded agent context for {repo_full_name}")
+            return context or {}
         except yaml.YAMLError as e:
             logger.error(f"Error parsing agent context {context_path}: {e}")
             return self._get_default_agent_context()
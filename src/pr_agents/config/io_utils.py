@@ -0,0 +1,157 @@
+"""
+File reading utilities for configuration files.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# orjson parses and serializes several times faster than the stdlib; it stays
+# optional, and its JSONDecodeError subclasses json.JSONDecodeError, so
+# callers' error handling is the same either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed loader; pure-Python PyYAML builds fall back to
+# SafeLoader, which accepts the same documents.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader
+
+
+def loads_json(data: bytes | str) -> Any:
+    """
+    Parse a JSON document, with orjson when it is installed.
+
+    Args:
+        data: JSON document as UTF-8 bytes or str
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(
+    data: Any,
+    *,
+    indent: int | None = None,
+    sort_keys: bool = False,
+    default: Any = None,
+) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, with orjson when it is installed.
+
+    ``indent=None`` gives compact output without insignificant whitespace.
+    orjson only pretty-prints with two spaces, so other indents use the
+    stdlib, as does anything orjson rejects (e.g. integers beyond 64 bits).
+    The two encoders share the layout but not every value's spelling:
+    orjson writes some floats differently (``1e16`` vs ``1e+16``) and
+    emits NaN/Infinity as ``null``.
+
+    Args:
+        data: Data to serialize
+        indent: Spaces per indentation level, or None for compact output
+        sort_keys: Whether to sort dictionary keys
+        default: Fallback for objects neither encoder handles natively
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        data,
+        indent=indent,
+        separators=(",", ":") if indent is None else None,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        default=default,
+    ).encode()
+
+
+def read_json_file(file_path: str | Path) -> Any:
+    """
+    Read and parse a JSON file.
+
+    The file is opened in binary mode and read in one call (the raw file
+    object sizes its buffer from ``fstat``), and the bytes are handed
+    straight to the parser. That parser is orjson when it is installed,
+    which expects UTF-8; otherwise the stdlib parser, which also detects
+    UTF-16/32.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(file_path, "rb") as f:
+        return loads_json(f.read())
+
+
+def read_yaml_file(file_path: str | Path) -> Any:
+    """
+    Read and parse a YAML file with the safe loader.
+
+    Uses libyaml's ``CSafeLoader`` when PyYAML was built with it, which
+    parses several times faster than the pure-Python ``SafeLoader``.
+
+    Args:
+        file_path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    with open(file_path, "rb") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def yaml_to_json(file_path: str | Path) -> Path:
+    """
+    Convert a YAML file to a compact JSON file alongside it.
+
+    One-shot migration helper for data-only YAML (mappings, lists and
+    scalars); the JSON copy is written next to the source with a ``.json``
+    suffix and the YAML file is left in place.
+
+    Args:
+        file_path: Path to the YAML file
+
+    Returns:
+        Path to the written JSON file
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+        TypeError: If the YAML holds values JSON cannot represent
+    """
+    source = Path(file_path)
+    target = source.with_suffix(".json")
+    data = read_yaml_file(source)
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+    return target
@@ -2,12 +2,26 @@
 Repository knowledge loader for loading JSON configs from prebid directory.
 """
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+from .io_utils import read_json_file
+
+# Parsed configs kept across loader instances; repository configs rarely
+# change, and keying on mtime/size makes an edited file miss the cache.
+KNOWLEDGE_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=KNOWLEDGE_CACHE_SIZE)
+def _load_json_cached(path: Path, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON config file; ``mtime_ns`` and ``size`` only key the cache."""
+    return read_json_file(path)
+
 
 class RepositoryKnowledgeLoader:
     """Loads repository configuration from JSON files in config/prebid/."""
@@ -21,6 +35,9 @@ class RepositoryKnowledgeLoader:
         """
         self.config_dir = Path(config_dir)
         self.prebid_dir = self.config_dir / "prebid"
+        # Candidate config paths per repository name, so repeated loads for
+        # the same repository skip the name normalization
+        self._path_cache: dict[str, list[Path]] = {}
 
     def load_repository_config(self, repo_full_name: str) -> dict[str, Any]:
         """
@@ -32,16 +49,19 @@ class RepositoryKnowledgeLoader:
         Returns:
             Repository configuration from JSON
         """
-        # Handle different repo name formats
-        if "/" in repo_full_name:
-            owner, repo = repo_full_name.split("/", 1)
-        else:
-            # If no owner provided, assume prebid
-            owner = "prebid"
-            repo = repo_full_name
-
-        # Try different paths based on repo name
-        possible_paths = self._get_possible_config_paths(owner, repo)
+        possible_paths = self._path_cache.get(repo_full_name)
+        if possible_paths is None:
+            # Handle different repo name formats
+            if "/" in repo_full_name:
+                owner, repo = repo_full_name.split("/", 1)
+            else:
+                # If no owner provided, assume prebid
+                owner = "prebid"
+                repo = repo_full_name
+
+            # Try different paths based on repo name
+            possible_paths = self._get_possible_config_paths(owner, repo)
+            self._path_cache[repo_full_name] = possible_paths
 
         for path in possible_paths:
             if path.exists():
@@ -82,10 +102,15 @@ class RepositoryKnowledgeLoader:
         return paths
 
     def _load_json_config(self, path: Path) -> dict[str, Any]:
-        """Load JSON configuration file."""
+        """Load JSON configuration file.
+
+        Parsed files are cached by path, modification time and size, and each
+        caller gets its own deep copy so mutations don't leak into the cache.
+        """
         try:
-            with open(path, encoding="utf-8") as f:
-                return json.load(f)
+            stat = path.stat()
+            config = _load_json_cached(path, stat.st_mtime_ns, stat.st_size)
+            return copy.deepcopy(config)
         except (OSError, json.JSONDecodeError) as e:
             logger.error(f"Error loading JSON config {path}: {e}")
             return {}
@@ -3,11 +3,16 @@ Configuration loader for repository structures with multi-file support.
 """
 
 import json
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from loguru import logger
 
 from .exceptions import ConfigurationValidationError
+from .io_utils import read_json_file
 from .models import (
     DetectionStrategy,
     FetchStrategy,
@@ -20,6 +25,88 @@ from .models import (
 )
 from .validator import ConfigurationValidator
 
+# DFS colors for extends-chain resolution
+WHITE, GREY, BLACK = 0, 1, 2
+
+# Upper bound on memoized merge results kept per loader
+MERGE_CACHE_SIZE = 256
+
+# Upper bound on parsed config files kept per loader
+LOADED_CONFIG_CACHE_SIZE = 128
+
+# Master files referencing at least this many uncached files are read in parallel
+PARALLEL_LOAD_MIN_FILES = 8
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern low-cardinality config strings that repeat across repositories.
+
+    json.loads only shares object keys within a single document, so values
+    such as pattern types, repo types and category names would otherwise be
+    separate str objects in every parsed file.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _strongly_connected_components(
+    graph: dict[Path, list[Path]],
+) -> list[list[Path]]:
+    """Tarjan's algorithm, iterative so deep extends chains cannot overflow.
+
+    Returns every strongly connected component of the graph in a single
+    O(V + E) pass.
+    """
+    index: dict[Path, int] = {}
+    lowlink: dict[Path, int] = {}
+    on_stack: set[Path] = set()
+    stack: list[Path] = []
+    components: list[list[Path]] = []
+    counter = 0
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph[root]))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, ()))))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def _read_with_mtime(file_path: Path) -> tuple[int, dict]:
+    """Read a JSON file along with the mtime it was read at."""
+    mtime_ns = file_path.stat().st_mtime_ns
+    return mtime_ns, read_json_file(file_path)
+
 
 class ConfigurationLoader:
     """Loads repository configuration from JSON files with multi-file and inheritance support."""
@@ -34,10 +121,19 @@ class ConfigurationLoader:
         """
         self.config_path = Path(config_path)
         self.strict_mode = strict_mode
-        self._loaded_configs: dict[str, dict] = {}  # Cache for loaded JSON files
+        # LRU cache of parsed JSON files: path -> (mtime_ns, data)
+        self._loaded_configs: OrderedDict[str, tuple[int, dict]] = OrderedDict()
         self._resolved_repos: dict[str, RepositoryStructure] = (
             {}
         )  # Cache for resolved repos
+        # Per-load inheritance state: DFS color and fully merged data per file
+        self._colors: dict[Path, int] = {}
+        self._resolved_configs: dict[Path, dict] = {}
+        # Files on an extends cycle, found up front and loaded without inheritance
+        self._cyclic_files: set[Path] = set()
+        # Memoized merges keyed by input identity; inputs are kept alive in
+        # the value so their ids cannot be reused while the entry exists
+        self._merge_cache: dict[tuple[int, int], tuple[dict, dict, dict]] = {}
         self._validator = self._initialize_validator()
 
     def _initialize_validator(self) -> ConfigurationValidator | None:
@@ -61,8 +157,13 @@ class ConfigurationLoader:
 
         Supports:
         1. New multi-file format with config directory
-        2. Legacy single file format (repository_structures.json)
+        2. Bundled NDJSON format (repositories.ndjson, one repo per line)
+        3. Legacy single file format (repository_structures.json)
         """
+        self._colors.clear()
+        self._resolved_configs.clear()
+        self._cyclic_files.clear()
+
         # Check for legacy single file first
         legacy_file = Path("config/repository_structures.json")
         if not self.config_path.exists() and legacy_file.exists():
@@ -75,6 +176,9 @@ class ConfigurationLoader:
             master_file = self.config_path / "repositories.json"
             if master_file.exists():
                 return self._load_from_master_file(master_file)
+            ndjson_file = self.config_path / "repositories.ndjson"
+            if ndjson_file.exists():
+                return self._load_from_ndjson_file(ndjson_file)
             else:
                 # Fall back to loading all JSON files in repositories/ subdirectory
                 return self._load_from_directory(self.config_path / "repositories")
@@ -86,20 +190,25 @@ class ConfigurationLoader:
 
     def _load_from_master_file(self, master_file: Path) -> RepositoryConfig:
         """Load configurations referenced in a master file."""
-        with open(master_file) as f:
-            master_data = json.load(f)
+        master_data = read_json_file(master_file)
 
         config = RepositoryConfig()
         base_dir = master_file.parent
+        repo_paths = [base_dir / p for p in master_data.get("repositories", [])]
+        prefetched = self._prefetch_json_files(repo_paths)
+        self._report_extends_cycles(
+            [path for path in repo_paths if path.exists()], prefetched
+        )
 
         # Load all referenced repository files
-        for repo_path in master_data.get("repositories", []):
-            full_path = base_dir / repo_path
+        for full_path in repo_paths:
             if full_path.exists():
                 try:
-                    repo_data = self._load_json_file(full_path)
+                    repo_data = self._load_json_file(
+                        full_path, prefetched.get(full_path)
+                    )
                     repo_structure = self._parse_repository_with_inheritance(
-                        repo_data, full_path.parent
+                        repo_data, full_path
                     )
                     if repo_structure and repo_structure.repo_name:
                         config.repositories[repo_structure.repo_name] = repo_structure
@@ -111,21 +220,59 @@ class ConfigurationLoader:
 
         return config
 
+    def _load_from_ndjson_file(self, ndjson_file: Path) -> RepositoryConfig:
+        """
+        Load inline repository configs from an NDJSON bundle.
+
+        Each non-blank line holds one complete repository config. The bundle
+        is meant to be generated at packaging time so a deployment does one
+        sequential read instead of opening every file listed in a master
+        file; repositories.json takes precedence when both exist, so the
+        multi-file layout stays the one to edit. ``extends`` paths resolve
+        relative to the bundle's directory.
+        """
+        config = RepositoryConfig()
+
+        with open(ndjson_file, "rb") as f:
+            lines = f.read().splitlines()
+
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            # Per-line pseudo path: a distinct inheritance cache key per entry
+            source = ndjson_file.with_name(f"{ndjson_file.name}:{line_no}")
+            try:
+                repo_data = json.loads(line)
+                self._validate_data(repo_data, source)
+                repo_structure = self._parse_repository_with_inheritance(
+                    repo_data, source
+                )
+                if repo_structure and repo_structure.repo_name:
+                    config.repositories[repo_structure.repo_name] = repo_structure
+                    logger.info(f"Loaded config for {repo_structure.repo_name}")
+            except Exception as e:
+                logger.error(f"Error loading {source}: {e}")
+
+        return config
+
     def _load_from_directory(self, directory: Path) -> RepositoryConfig:
         """Load all JSON files from a directory structure."""
         config = RepositoryConfig()
 
-        # Recursively find all JSON files
-        for json_file in directory.rglob("*.json"):
-            # Skip schema files and base configs
-            if "schema" in str(json_file) or "base" in json_file.name:
-                continue
+        # Recursively find all JSON files, skipping schema files and base configs
+        json_files = [
+            json_file
+            for json_file in directory.rglob("*.json")
+            if "schema" not in str(json_file) and "base" not in json_file.name
+        ]
+        self._report_extends_cycles(json_files)
 
+        for json_file in json_files:
             try:
                 repo_data = self._load_json_file(json_file)
                 if "repo_name" in repo_data:  # Only process if it's a repo config
                     repo_structure = self._parse_repository_with_inheritance(
-                        repo_data, json_file.parent
+                        repo_data, json_file
                     )
                     if repo_structure and repo_structure.repo_name:
                         config.repositories[repo_structure.repo_name] = repo_structure
@@ -136,18 +283,20 @@ class ConfigurationLoader:
         return config
 
     def _load_from_single_file(self, file_path: Path) -> RepositoryConfig:
-        """Load configuration from a single file (backward compatibility)."""
-        with open(file_path) as f:
-            data = json.load(f)
+        """Load configuration from a single file (backward compatibility).
+
+        The file is parsed once, through the mtime-checked file cache, and the
+        format is decided from the parsed top-level keys, so reloading an
+        unchanged legacy file does no JSON work at all.
+        """
+        data = self._load_json_file(file_path, validate=False)
 
         config = RepositoryConfig()
 
         # Check if it's a new format single repo file
         if "repo_name" in data and "repo_type" in data:
             # New format: single repository definition
-            repo_structure = self._parse_repository_with_inheritance(
-                data, file_path.parent
-            )
+            repo_structure = self._parse_repository_with_inheritance(data, file_path)
             if repo_structure:
                 config.repositories[repo_structure.repo_name] = repo_structure
         else:
@@ -159,27 +308,90 @@ class ConfigurationLoader:
 
         return config
 
-    def _load_json_file(self, file_path: Path) -> dict:
-        """Load and cache a JSON file."""
+    def _prefetch_json_files(
+        self, paths: list[Path]
+    ) -> dict[Path, Future[tuple[int, dict]]]:
+        """
+        Start parallel reads for referenced files that are not cached.
+
+        Reading and parsing is I/O bound, so a thread pool overlaps the file
+        reads for large master files. Only the raw read runs in workers;
+        validation and cache updates stay on the calling thread.
+
+        Args:
+            paths: Files referenced by the master file
+
+        Returns:
+            Mapping of path to a completed future holding (mtime_ns, data)
+        """
+        pending = [
+            path
+            for path in paths
+            if str(path) not in self._loaded_configs and path.exists()
+        ]
+        if len(pending) < PARALLEL_LOAD_MIN_FILES:
+            return {}
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(pending))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                path: executor.submit(_read_with_mtime, path) for path in pending
+            }
+        return futures
+
+    def _load_json_file(
+        self,
+        file_path: Path,
+        prefetched: Future[tuple[int, dict]] | None = None,
+        validate: bool = True,
+    ) -> dict:
+        """
+        Load and cache a JSON file.
+
+        Entries are keyed by path and tagged with the file's mtime, so an
+        edited file is re-read automatically; the least recently used entry
+        is evicted once the cache is full.
+
+        Args:
+            file_path: File to load
+            prefetched: Optional completed read from _prefetch_json_files
+            validate: Validate repository-shaped data against the schema
+        """
         str_path = str(file_path)
-        if str_path not in self._loaded_configs:
-            with open(file_path) as f:
-                data = json.load(f)
-
-            # Validate if this looks like a repository config and we have a validator
-            if self._validator and self._should_validate(data):
-                is_valid, errors = self._validator.validate_config(data)
-                if not is_valid:
-                    error_msg = f"Validation failed for {file_path}:\n" + "\n".join(
-                        errors
-                    )
-                    if self.strict_mode:
-                        raise ConfigurationValidationError(error_msg)
-                    else:
-                        logger.warning(error_msg)
+        mtime_ns = file_path.stat().st_mtime_ns
 
-            self._loaded_configs[str_path] = data
-        return self._loaded_configs[str_path]
+        cached = self._loaded_configs.get(str_path)
+        if cached is not None and cached[0] == mtime_ns:
+            self._loaded_configs.move_to_end(str_path)
+            return cached[1]
+
+        # Re-raises any parse error from the worker on this thread
+        result = prefetched.result() if prefetched is not None else None
+        if result is not None and result[0] == mtime_ns:
+            data = result[1]
+        else:
+            data = read_json_file(file_path)
+
+        if validate:
+            self._validate_data(data, file_path)
+
+        self._loaded_configs[str_path] = (mtime_ns, data)
+        self._loaded_configs.move_to_end(str_path)
+        while len(self._loaded_configs) > LOADED_CONFIG_CACHE_SIZE:
+            self._loaded_configs.popitem(last=False)
+        return data
+
+    def _validate_data(self, data: dict, source: object) -> None:
+        """Validate repository-shaped data, raising in strict mode."""
+        # Validate if this looks like a repository config and we have a validator
+        if self._validator and self._should_validate(data):
+            is_valid, errors = self._validator.validate_config(data)
+            if not is_valid:
+                error_msg = f"Validation failed for {source}:\n" + "\n".join(errors)
+                if self.strict_mode:
+                    raise ConfigurationValidationError(error_msg)
+                else:
+                    logger.warning(error_msg)
 
     def _should_validate(self, data: dict) -> bool:
         """Check if data should be validated as a repository config."""
@@ -189,19 +401,11 @@ class ConfigurationLoader:
         )
 
     def _parse_repository_with_inheritance(
-        self, data: dict, base_dir: Path
+        self, data: dict, file_path: Path
     ) -> RepositoryStructure | None:
         """Parse a repository configuration with inheritance support."""
-        # Handle inheritance
         if "extends" in data:
-            base_path = base_dir / data["extends"]
-            if base_path.exists():
-                base_data = self._load_json_file(base_path)
-                # Deep merge base data with current data
-                merged_data = self._deep_merge(base_data, data)
-                data = merged_data
-            else:
-                logger.warning(f"Base config not found: {base_path}")
+            data = self._resolve_extends(data, file_path)
 
         # Parse the repository
         repo_name = data.get("repo_name", "")
@@ -210,28 +414,152 @@ class ConfigurationLoader:
 
         return self._parse_repository(repo_name, data)
 
+    def _report_extends_cycles(
+        self,
+        files: list[Path],
+        prefetched: dict[Path, Future] | None = None,
+    ) -> None:
+        """
+        Find every circular ``extends`` chain reachable from files in one pass.
+
+        Builds the extends graph by reading each file's ``extends`` field
+        without merging anything, then runs Tarjan's SCC over it. Each cycle
+        (an SCC of two or more files, or a file extending itself) is logged
+        once, and its members are recorded so resolution loads them without
+        inheritance instead of rediscovering the cycle from every start file.
+
+        Args:
+            files: Configuration files the current load starts from
+            prefetched: Optional futures from _prefetch_json_files
+        """
+        prefetched = prefetched or {}
+        graph: dict[Path, list[Path]] = {}
+        pending = [(file_path.resolve(), file_path) for file_path in files]
+
+        while pending:
+            node, load_path = pending.pop()
+            if node in graph:
+                continue
+            graph[node] = []
+            try:
+                data = self._load_json_file(load_path, prefetched.get(load_path))
+            except Exception:
+                continue  # Reported when the file itself is loaded
+            if not isinstance(data, dict) or "extends" not in data:
+                continue
+            base_path = node.parent / data["extends"]
+            if base_path.exists():
+                base = base_path.resolve()
+                graph[node].append(base)
+                pending.append((base, base_path))
+
+        for component in _strongly_connected_components(graph):
+            if len(component) == 1 and component[0] not in graph[component[0]]:
+                continue
+            cycle = " -> ".join(path.name for path in reversed(component))
+            logger.warning(f"Circular inheritance detected: {cycle}")
+            self._cyclic_files.update(component)
+
+    def _resolve_extends(self, data: dict, file_path: Path) -> dict:
+        """
+        Merge a configuration with its full ``extends`` chain.
+
+        Walks the chain iteratively with WHITE/GREY/BLACK coloring: files on
+        the current path are GREY, fully merged files are BLACK and their
+        result is reused, so every file is resolved once per load and a
+        back-edge to a GREY file (circular inheritance) is logged and cut.
+        Files already reported by _report_extends_cycles are not followed.
+
+        Args:
+            data: Parsed contents of file_path
+            file_path: Path of the configuration file being resolved
+
+        Returns:
+            Configuration data merged over all of its bases
+        """
+        chain: list[tuple[Path, dict]] = []
+        path, node = file_path.resolve(), data
+        merged: dict | None = None
+
+        while True:
+            color = self._colors.get(path, WHITE)
+            if color == BLACK:
+                merged = self._resolved_configs[path]
+                break
+            if color == GREY:
+                logger.warning(f"Circular inheritance detected at {path}")
+                break
+
+            self._colors[path] = GREY
+            chain.append((path, node))
+
+            if "extends" not in node or path in self._cyclic_files:
+                break
+            base_path = path.parent / node["extends"]
+            if not base_path.exists():
+                logger.warning(f"Base config not found: {base_path}")
+                break
+            path, node = base_path.resolve(), self._load_json_file(base_path)
+
+        # Unwind from the root-most base, merging each override on top
+        for path, node in reversed(chain):
+            merged = node if merged is None else self._deep_merge(merged, node)
+            self._resolved_configs[path] = merged
+            self._colors[path] = BLACK
+
+        return merged
+
+    def clear_cache(self) -> None:
+        """Drop cached file contents and merge results so the next load re-reads disk."""
+        self._loaded_configs.clear()
+        self._resolved_repos.clear()
+        self._resolved_configs.clear()
+        self._colors.clear()
+        self._merge_cache.clear()
+
     def _deep_merge(self, base: dict, override: dict) -> dict:
-        """Deep merge two dictionaries, with override taking precedence."""
-        result = base.copy()
+        """
+        Deep merge two dictionaries, with override taking precedence.
 
-        for key, value in override.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                # Recursively merge dictionaries
-                result[key] = self._deep_merge(result[key], value)
-            elif (
-                key in result
-                and isinstance(result[key], list)
-                and isinstance(value, list)
-            ):
-                # For lists, override completely (don't append)
-                result[key] = value
-            else:
-                # Override value
-                result[key] = value
+        Inputs come from the parsed-file cache and are never mutated, so the
+        same (base, override) pair always merges to the same result. Repeated
+        loads therefore reuse the memoized merge; callers must treat the
+        returned dict as read-only, like any other cached config data.
+        """
+        key = (id(base), id(override))
+        cached = self._merge_cache.get(key)
+        if cached is not None and cached[0] is base and cached[1] is override:
+            return cached[2]
+
+        result = self._merge_dicts(base, override)
+        if len(self._merge_cache) >= MERGE_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del self._merge_cache[next(iter(self._merge_cache))]
+        self._merge_cache[key] = (base, override, result)
+        return result
+
+    def _merge_dicts(self, base: dict, override: dict) -> dict:
+        """
+        Merge override into a copy of base, with override taking precedence.
+
+        Nested dicts are merged with an explicit stack rather than recursion.
+        Only dicts present on both sides are copied; every other value
+        (including lists, which override completely) is shared by reference.
+        """
+        result = base.copy()
+        stack = [(result, override)]
+
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    merged = current.copy()
+                    target[key] = merged
+                    stack.append((merged, value))
+                else:
+                    # Lists and scalars override completely
+                    target[key] = value
 
         return result
 
@@ -239,7 +567,7 @@ class ConfigurationLoader:
         """Parse a single repository configuration."""
         repo = RepositoryStructure(
             repo_name=repo_name,
-            repo_type=data.get("repo_type", ""),
+            repo_type=_intern(data.get("repo_type", "")),
             description=data.get("description"),
         )
 
@@ -304,9 +632,10 @@ class ConfigurationLoader:
         categories = {}
 
         for cat_name, cat_data in categories_data.items():
+            cat_name = _intern(cat_name)
             category = ModuleCategory(
-                name=cat_data.get("name", cat_name),
-                display_name=cat_data.get("display_name", ""),
+                name=_intern(cat_data.get("name", cat_name)),
+                display_name=_intern(cat_data.get("display_name", "")),
                 paths=cat_data.get("paths", []),
                 patterns=self._parse_patterns(cat_data.get("patterns", [])),
             )
@@ -332,10 +661,10 @@ class ConfigurationLoader:
         for pattern_data in patterns_data:
             pattern = ModulePattern(
                 pattern=pattern_data.get("pattern", ""),
-                pattern_type=pattern_data.get(
-                    "type", pattern_data.get("pattern_type", "glob")
+                pattern_type=_intern(
+                    pattern_data.get("type", pattern_data.get("pattern_type", "glob"))
                 ),
-                name_extraction=pattern_data.get("name_extraction"),
+                name_extraction=_intern(pattern_data.get("name_extraction")),
                 exclude_patterns=pattern_data.get(
                     "exclude", pattern_data.get("exclude_patterns", [])
                 ),
@@ -4,6 +4,7 @@ Repository structure configuration manager.
 
 import fnmatch
 import re
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -17,12 +18,38 @@ from .models import (
     RepositoryConfig,
     RepositoryStructure,
 )
-from .pattern_matcher import PatternMatcher
+from .pattern_matcher import PathContext, PatternMatcher
 from .watcher import ConfigurationWatcher
 
+# Upper bound on memoized get_module_info results kept per manager
+MODULE_INFO_CACHE_SIZE = 4096
+
+# (plain prefixes, glob patterns) for one list of repository paths
+PathRule = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+def _compile_path_rule(paths: list[str]) -> PathRule:
+    """Split paths into prefixes, tested with one str.startswith call, and globs."""
+    return (
+        tuple(path for path in paths if "*" not in path),
+        tuple(path for path in paths if "*" in path),
+    )
+
+
+def _matches_path_rule(filepath: str, rule: PathRule) -> bool:
+    """Same result as RepositoryStructureManager._is_path_type on the raw list."""
+    prefixes, globs = rule
+    if prefixes and filepath.startswith(prefixes):
+        return True
+    return any(fnmatch.fnmatch(filepath, glob) for glob in globs)
+
 
 class RepositoryStructureManager:
-    """Manages repository structure configurations."""
+    """Manages repository structure configurations.
+
+    Configuration is loaded lazily on first use, so constructing a manager
+    is cheap for callers that never query it (or only probe invalid URLs).
+    """
 
     def __init__(self, config_path: str = "config", enable_hot_reload: bool = False):
         """
@@ -34,35 +61,106 @@ class RepositoryStructureManager:
         """
         self.config_path = config_path
         self.loader = ConfigurationLoader(config_path)
-        self.config: RepositoryConfig | None = None
+        self._config: RepositoryConfig | None = None
+        # Flat, index-aligned views of self.config, rebuilt on every (re)load
+        self._repo_index: dict[str, int] = {}
+        self._repo_names: list[str] = []
+        self._repo_types: list[str] = []
+        self._repos: list[RepositoryStructure] = []
+        self._category_rows: list[tuple[tuple[str, ModuleCategory], ...]] = []
+        self._path_rules: list[dict[str, PathRule]] = []
+        # LRU of get_module_info results: (repo_url, filepath, version) -> info
+        self._module_info_cache: OrderedDict[
+            tuple[str, str, str | None], dict[str, Any]
+        ] = OrderedDict()
         self.pattern_matcher = PatternMatcher()
         self.enable_hot_reload = enable_hot_reload
         self._watcher: ConfigurationWatcher | None = None
-        self._load_config()
 
         # Start watcher if hot reload is enabled
         if enable_hot_reload:
             self._start_watcher()
 
+    @property
+    def config(self) -> RepositoryConfig:
+        """Repository configuration, loaded on first access."""
+        if self._config is None:
+            self._load_config()
+        return self._config
+
     def _load_config(self):
         """Load configuration from file."""
         try:
-            self.config = self.loader.load_config()
+            self._set_config(self.loader.load_config())
             logger.info(
                 f"Loaded {len(self.config.repositories)} repository configurations"
             )
         except Exception as e:
             logger.error(f"Error loading repository config: {e}")
-            # Initialize with empty config but raise error
-            self.config = RepositoryConfig()
+            # Leave the config unset so every later access retries and raises
             raise ConfigurationLoadError(
                 f"Failed to load repository config: {e}"
             ) from e
 
+    def _set_config(self, config: RepositoryConfig) -> None:
+        """Install a configuration and rebuild the flat lookup tables.
+
+        Repositories are laid out as parallel lists addressed through one
+        name -> index dict, and each repository's categories are frozen into
+        a tuple of (name, category) rows so categorization scans a prebuilt
+        sequence instead of re-walking nested dicts. Core/test/doc/exclude
+        paths are split into a prefix tuple and glob tuple per repository.
+        """
+        self._config = config
+        repos = list(config.repositories.values())
+        self._repos = repos
+        self._repo_names = [repo.repo_name for repo in repos]
+        self._repo_types = [repo.repo_type for repo in repos]
+        self._repo_index = {name: i for i, name in enumerate(config.repositories)}
+        self._category_rows = [tuple(repo.module_categories.items()) for repo in repos]
+        self._path_rules = [
+            {
+                "core": _compile_path_rule(repo.core_paths),
+                "test": _compile_path_rule(repo.test_paths),
+                "doc": _compile_path_rule(repo.doc_paths),
+                "exclude": _compile_path_rule(repo.exclude_paths),
+            }
+            for repo in repos
+        ]
+        # Classifications depend on the config they were computed from
+        self._module_info_cache.clear()
+
+    def _ensure_loaded(self) -> None:
+        """Load the configuration if it has not been loaded yet."""
+        if self._config is None:
+            self._load_config()
+
+    def _lookup_index(self, repo_url: str | None) -> int | None:
+        """Resolve a repository URL to its index in the flat lookup tables.
+
+        Every supported URL form contains an owner/name slash, so empty or
+        slash-less input is rejected before loading or normalizing anything.
+        """
+        if not repo_url or "/" not in repo_url:
+            return None
+        self._ensure_loaded()
+        return self._repo_index.get(self._extract_repo_name(repo_url))
+
     def get_repository(self, repo_url: str) -> RepositoryStructure | None:
         """Get repository structure for a given URL."""
-        repo_name = self._extract_repo_name(repo_url)
-        return self.config.get_repository(repo_name)
+        index = self._lookup_index(repo_url)
+        return None if index is None else self._repos[index]
+
+    def get_repository_names(self, repo_type: str | None = None) -> list[str]:
+        """List configured repository names, optionally filtered by type."""
+        self._ensure_loaded()
+        if repo_type is None:
+            return list(self._repo_names)
+        return [
+            name
+            for name, type_ in zip(self._repo_names, self._repo_types, strict=True)
+            if type_ == repo_type
+        ]
 
     def get_config_for_url(self, repo_url: str) -> dict[str, Any]:
         """
@@ -135,7 +233,8 @@ class RepositoryStructureManager:
         self, repo_url: str, filepath: str, version: str | None = None
     ) -> dict[str, Any]:
         """Categorize a file based on repository structure."""
-        repo = self.get_repository(repo_url)
+        index = self._lookup_index(repo_url)
+        repo = None if index is None else self._repos[index]
         if not repo:
             return {
                 "categories": [],
@@ -145,22 +244,26 @@ class RepositoryStructureManager:
                 "is_doc": False,
             }
 
+        path_rules = self._path_rules[index]
         result = {
             "categories": [],
             "module_type": None,
-            "is_core": self._is_path_type(filepath, repo.core_paths),
-            "is_test": self._is_path_type(filepath, repo.test_paths),
-            "is_doc": self._is_path_type(filepath, repo.doc_paths),
+            "is_core": _matches_path_rule(filepath, path_rules["core"]),
+            "is_test": _matches_path_rule(filepath, path_rules["test"]),
+            "is_doc": _matches_path_rule(filepath, path_rules["doc"]),
             "metadata": {},
         }
 
         # Check if file should be excluded
-        if self._is_path_type(filepath, repo.exclude_paths):
+        if _matches_path_rule(filepath, path_rules["exclude"]):
             return result
 
+        # Split the path once for every pattern checked below
+        ctx = PathContext.from_path(filepath)
+
         # Find matching module categories
-        for cat_name, category in repo.module_categories.items():
-            if self._matches_category(filepath, category, repo, version):
+        for cat_name, category in self._category_rows[index]:
+            if self._matches_category(filepath, category, repo, version, ctx):
                 result["categories"].append(cat_name)
                 if not result["module_type"]:
                     result["module_type"] = category.display_name
@@ -170,7 +273,9 @@ class RepositoryStructureManager:
             for ver_config in repo.version_configs:
                 if repo._version_matches(version, ver_config):
                     for cat_name, category in ver_config.module_categories.items():
-                        if self._matches_category(filepath, category, repo, version):
+                        if self._matches_category(
+                            filepath, category, repo, version, ctx
+                        ):
                             if cat_name not in result["categories"]:
                                 result["categories"].append(cat_name)
                             if not result["module_type"]:
@@ -184,6 +289,7 @@ class RepositoryStructureManager:
         category: ModuleCategory,
         repo: RepositoryStructure,
         version: str | None = None,
+        ctx: PathContext | None = None,
     ) -> bool:
         """Check if a file matches a module category."""
         # First check if file is in one of the category paths
@@ -200,35 +306,43 @@ class RepositoryStructureManager:
         if category.detection_strategy == DetectionStrategy.METADATA_FILE:
             # File should be in metadata directory and match pattern
             for pattern in category.patterns:
-                if self._matches_pattern(filepath, pattern):
+                if self._matches_pattern(filepath, pattern, ctx):
                     return True
             return False
 
         # Check patterns
         for pattern in category.patterns:
-            if self._matches_pattern(filepath, pattern):
+            if self._matches_pattern(filepath, pattern, ctx):
                 return True
 
         return False
 
-    def _matches_pattern(self, filepath: str, pattern) -> bool:
+    def _matches_pattern(
+        self, filepath: str, pattern, ctx: PathContext | None = None
+    ) -> bool:
         """Check if filepath matches a pattern."""
         # Handle exclusions first
         for exclude in pattern.exclude_patterns:
-            if self._simple_match(filepath, exclude, pattern.pattern_type):
+            if self._simple_match(filepath, exclude, pattern.pattern_type, ctx):
                 return False
 
         # Check main pattern
-        return self._simple_match(filepath, pattern.pattern, pattern.pattern_type)
+        return self._simple_match(filepath, pattern.pattern, pattern.pattern_type, ctx)
 
-    def _simple_match(self, filepath: str, pattern_str: str, pattern_type: str) -> bool:
+    def _simple_match(
+        self,
+        filepath: str,
+        pattern_str: str,
+        pattern_type: str,
+        ctx: PathContext | None = None,
+    ) -> bool:
         """Simple pattern matching based on type."""
         if pattern_type == "suffix":
             # Extract filename and check suffix
-            filename = Path(filepath).name
+            filename = ctx.basename if ctx else Path(filepath).name
             return filename.endswith(pattern_str.replace("*", ""))
         elif pattern_type == "prefix":
-            filename = Path(filepath).name
+            filename = ctx.basename if ctx else Path(filepath).name
             return filename.startswith(pattern_str.replace("*", ""))
         elif pattern_type == "glob":
             return fnmatch.fnmatch(filepath, pattern_str)
@@ -254,7 +368,34 @@ class RepositoryStructureManager:
     def get_module_info(
         self, repo_url: str, filepath: str, version: str | None = None
     ) -> dict[str, Any]:
-        """Get detailed module information for a file."""
+        """Get detailed module information for a file.
+
+        Results are memoized per (repo_url, filepath, version) until the
+        configuration is reloaded; callers get their own copy of the mutable
+        fields.
+        """
+        key = (repo_url, filepath, version)
+        info = self._module_info_cache.get(key)
+        if info is None:
+            info = self._compute_module_info(repo_url, filepath, version)
+            self._module_info_cache[key] = info
+            if len(self._module_info_cache) > MODULE_INFO_CACHE_SIZE:
+                self._module_info_cache.popitem(last=False)
+        else:
+            self._module_info_cache.move_to_end(key)
+
+        if not info:
+            return {}
+        return {
+            **info,
+            "categories": list(info["categories"]),
+            "metadata": dict(info["metadata"]),
+        }
+
+    def _compute_module_info(
+        self, repo_url: str, filepath: str, version: str | None
+    ) -> dict[str, Any]:
+        """Classify a file and extract its module name (uncached)."""
         repo = self.get_repository(repo_url)
         if not repo:
             return {}
@@ -263,6 +404,7 @@ class RepositoryStructureManager:
 
         # Extract module name if applicable
         module_name = None
+        ctx = PathContext.from_path(filepath)
         if categorization["categories"]:
             # Check version-specific categories first
             if version and repo.version_configs:
@@ -272,7 +414,7 @@ class RepositoryStructureManager:
                             category = ver_config.module_categories.get(cat_name)
                             if category:
                                 for pattern in category.patterns:
-                                    if self._matches_pattern(filepath, pattern):
+                                    if self._matches_pattern(filepath, pattern, ctx):
                                         module_name = self._extract_module_name(
                                             filepath, pattern
                                         )
@@ -286,7 +428,7 @@ class RepositoryStructureManager:
                     category = repo.module_categories.get(cat_name)
                     if category:
                         for pattern in category.patterns:
-                            if self._matches_pattern(filepath, pattern):
+                            if self._matches_pattern(filepath, pattern, ctx):
                                 module_name = self._extract_module_name(
                                     filepath, pattern
                                 )
@@ -340,7 +482,7 @@ class RepositoryStructureManager:
 
     def _on_config_reload(self, new_config: RepositoryConfig):
         """Handle configuration reload."""
-        self.config = new_config
+        self._set_config(new_config)
         logger.info(
             f"Configuration reloaded: {len(new_config.repositories)} repositories"
         )
@@ -2,6 +2,8 @@
 Data models for repository structure configuration.
 """
 
+import fnmatch
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -24,7 +26,7 @@ class FetchStrategy(Enum):
     DIRECTORY_NAMES = "directory_names"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModulePattern:
     """Pattern for identifying a specific type of module."""
 
@@ -32,9 +34,17 @@ class ModulePattern:
     pattern_type: str  # "suffix", "prefix", "glob", "regex"
     name_extraction: str | None = None  # How to extract clean module name
     exclude_patterns: list[str] = field(default_factory=list)
+    # Regex for glob patterns, translated once at construction
+    compiled_glob: re.Pattern | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.pattern_type.lower() not in ("suffix", "prefix", "regex", "directory"):
+            self.compiled_glob = re.compile(fnmatch.translate(self.pattern))
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleCategory:
     """Definition of a module category in a repository."""
 
@@ -51,7 +61,7 @@ class ModuleCategory:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionConfig:
     """Version-specific configuration for a repository."""
 
@@ -63,7 +73,7 @@ class VersionConfig:
     notes: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryRelationship:
     """Defines relationships between repositories."""
 
@@ -72,7 +82,7 @@ class RepositoryRelationship:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryStructure:
     """Complete structure definition for a repository."""
 
@@ -134,7 +144,7 @@ class RepositoryStructure:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryConfig:
     """Container for all repository configurations."""
 
@@ -4,34 +4,29 @@ Pattern matching utilities for file categorization.
 
 import fnmatch
 import re
+from dataclasses import dataclass
 from functools import lru_cache
 
 from .exceptions import InvalidPatternError
 from .models import ModulePattern
 
 
-# Cached functions to avoid memory leaks with lru_cache on methods
-@lru_cache(maxsize=256)
-def _match_suffix_cached(filepath: str, pattern: str) -> bool:
-    """Match files with suffix pattern."""
-    if pattern.startswith("*"):
-        suffix = pattern[1:]
-        return filepath.endswith(suffix)
-    else:
-        raise InvalidPatternError(f"Suffix pattern should start with '*': {pattern}")
+@dataclass(slots=True, frozen=True)
+class PathContext:
+    """A file path decomposed once, then shared across every pattern check."""
 
+    path: str
+    basename: str
+    dirs: tuple[str, ...]  # Directory components, excluding the filename
 
-@lru_cache(maxsize=256)
-def _match_prefix_cached(filepath: str, pattern: str) -> bool:
-    """Match files with prefix pattern."""
-    if pattern.endswith("*"):
-        prefix = pattern[:-1]
-        filename = filepath.split("/")[-1]
-        return filename.startswith(prefix)
-    else:
-        raise InvalidPatternError(f"Prefix pattern should end with '*': {pattern}")
+    @classmethod
+    def from_path(cls, path: str) -> "PathContext":
+        """Split a POSIX-style path into its reusable components."""
+        parts = path.split("/")
+        return cls(path, parts[-1], tuple(parts[:-1]))
 
 
+# Cached functions to avoid memory leaks with lru_cache on methods
 @lru_cache(maxsize=256)
 def _match_directory_cached(filepath: str, pattern: str) -> bool:
     """Match directory patterns."""
@@ -47,6 +42,16 @@ def _match_directory_cached(filepath: str, pattern: str) -> bool:
         return pattern in parts[:-1]  # Exclude filename
 
 
+@lru_cache(maxsize=256)
+def _compile_bulk(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile a set of glob patterns into one alternation regex.
+
+    A path is tested against every pattern in a single regex match instead
+    of one fnmatch call per pattern.
+    """
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
 @lru_cache(maxsize=256)
 def _match_glob_cached(filepath: str, pattern: str) -> bool:
     """Match using glob pattern."""
@@ -59,13 +64,19 @@ class PatternMatcher:
     def __init__(self):
         self._compiled_patterns: dict[str, re.Pattern] = {}
 
-    def match_pattern(self, filepath: str, pattern: ModulePattern) -> bool:
+    def match_pattern(
+        self,
+        filepath: str,
+        pattern: ModulePattern,
+        ctx: PathContext | None = None,
+    ) -> bool:
         """
         Check if a filepath matches a pattern.
 
         Args:
             filepath: Path to match
             pattern: Pattern specification
+            ctx: Pre-split filepath, reused when checking many patterns
 
         Returns:
             True if pattern matches
@@ -80,13 +91,15 @@ class PatternMatcher:
         if pattern_type == "suffix":
             return self._match_suffix(filepath, pattern.pattern)
         elif pattern_type == "prefix":
-            return self._match_prefix(filepath, pattern.pattern)
+            return self._match_prefix(filepath, pattern.pattern, ctx)
         elif pattern_type == "regex":
             return self._match_regex(filepath, pattern.pattern)
         elif pattern_type == "directory":
-            return self._match_directory(filepath, pattern.pattern)
+            return self._match_directory(filepath, pattern.pattern, ctx)
+        elif pattern.compiled_glob is not None:
+            # Default to glob, using the regex translated at construction
+            return pattern.compiled_glob.match(filepath) is not None
         else:
-            # Default to glob
             return self._match_glob(filepath, pattern.pattern)
 
     def extract_name(self, filepath: str, pattern: ModulePattern) -> str | None:
@@ -132,11 +145,21 @@ class PatternMatcher:
 
     def _match_suffix(self, filepath: str, pattern: str) -> bool:
         """Match files with suffix pattern."""
-        return _match_suffix_cached(filepath, pattern)
-
-    def _match_prefix(self, filepath: str, pattern: str) -> bool:
+        # A plain endswith is cheaper than hashing the path for a cache lookup
+        if not pattern.startswith("*"):
+            raise InvalidPatternError(
+                f"Suffix pattern should start with '*': {pattern}"
+            )
+        return filepath.endswith(pattern[1:])
+
+    def _match_prefix(
+        self, filepath: str, pattern: str, ctx: PathContext | None = None
+    ) -> bool:
         """Match files with prefix pattern."""
-        return _match_prefix_cached(filepath, pattern)
+        if not pattern.endswith("*"):
+            raise InvalidPatternError(f"Prefix pattern should end with '*': {pattern}")
+        filename = ctx.basename if ctx else filepath.rpartition("/")[2]
+        return filename.startswith(pattern[:-1])
 
     def _match_regex(self, filepath: str, pattern: str) -> bool:
         """Match using regular expression."""
@@ -149,8 +172,13 @@ class PatternMatcher:
         regex = self._compiled_patterns[pattern]
         return bool(regex.search(filepath))
 
-    def _match_directory(self, filepath: str, pattern: str) -> bool:
+    def _match_directory(
+        self, filepath: str, pattern: str, ctx: PathContext | None = None
+    ) -> bool:
         """Match directory patterns."""
+        if ctx is not None and not pattern.endswith("/*"):
+            # Exact directory match against the already split components
+            return pattern in ctx.dirs
         return _match_directory_cached(filepath, pattern)
 
     def _match_glob(self, filepath: str, pattern: str) -> bool:
@@ -159,10 +187,9 @@ class PatternMatcher:
 
     def _is_excluded(self, filepath: str, exclude_patterns: list[str]) -> bool:
         """Check if filepath matches any exclusion pattern."""
-        for exclude in exclude_patterns:
-            if fnmatch.fnmatch(filepath, exclude):
-                return True
-        return False
+        if not exclude_patterns:
+            return False
+        return _compile_bulk(tuple(exclude_patterns)).match(filepath) is not None
 
     def find_best_match(
         self, filepath: str, patterns: list[ModulePattern]
@@ -178,9 +205,10 @@ class PatternMatcher:
             Tuple of (best_pattern, confidence_score)
         """
         matches = []
+        ctx = PathContext.from_path(filepath)
 
         for pattern in patterns:
-            if self.match_pattern(filepath, pattern):
+            if self.match_pattern(filepath, pattern, ctx):
                 # Calculate match score based on specificity
                 score = self._calculate_match_score(filepath, pattern)
                 matches.append((pattern, score))
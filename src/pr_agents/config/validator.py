@@ -3,11 +3,27 @@ Configuration validator for repository structures.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
 
 from jsonschema import Draft7Validator
 from loguru import logger
 
+from .io_utils import read_json_file
+
+
+@lru_cache(maxsize=16)
+def _load_compiled_schema(
+    schema_path: str, mtime_ns: int
+) -> tuple[dict, Draft7Validator]:
+    """Load a schema and build its validator, shared across instances.
+
+    Keyed by resolved path and mtime so every loader reuses one compiled
+    validator until the schema file changes on disk.
+    """
+    schema = read_json_file(schema_path)
+    return schema, Draft7Validator(schema)
+
 
 class ConfigurationValidator:
     """Validates repository configuration against schema."""
@@ -27,9 +43,9 @@ class ConfigurationValidator:
     def _load_schema(self):
         """Load the JSON schema for validation."""
         if self.schema_path.exists():
-            with open(self.schema_path) as f:
-                self.schema = json.load(f)
-                self.validator = Draft7Validator(self.schema)
+            self.schema, self.validator = _load_compiled_schema(
+                str(self.schema_path.resolve()), self.schema_path.stat().st_mtime_ns
+            )
         else:
             logger.warning(f"Schema file not found: {self.schema_path}")
 
@@ -47,8 +63,7 @@ class ConfigurationValidator:
             return True, ["No schema loaded, skipping validation"]
 
         try:
-            with open(config_file) as f:
-                config_data = json.load(f)
+            config_data = read_json_file(config_file)
 
             errors = []
             for error in self.validator.iter_errors(config_data):
@@ -148,27 +163,32 @@ class ConfigurationValidator:
                 issues.append(f"Module category '{cat_name}' has no patterns defined")
                 continue
 
-            # Check for duplicate patterns
-            patterns = [p.get("pattern", "") for p in category["patterns"]]
-            duplicates = [p for p in patterns if patterns.count(p) > 1]
-            if duplicates:
-                issues.append(f"Duplicate patterns in '{cat_name}': {set(duplicates)}")
-
-            # Check pattern type consistency
+            # Single pass: duplicates via a seen-set, plus type consistency
+            seen: set[str] = set()
+            duplicates: set[str] = set()
+            type_issues = []
             for pattern in category["patterns"]:
                 pattern_type = pattern.get("type", "glob")
                 pattern_value = pattern.get("pattern", "")
 
+                if pattern_value in seen:
+                    duplicates.add(pattern_value)
+                seen.add(pattern_value)
+
                 # Basic pattern validation
                 if pattern_type == "suffix" and not pattern_value.startswith("*"):
-                    issues.append(
+                    type_issues.append(
                         f"Suffix pattern in '{cat_name}' should start with '*': {pattern_value}"
                     )
                 elif pattern_type == "prefix" and not pattern_value.endswith("*"):
-                    issues.append(
+                    type_issues.append(
                         f"Prefix pattern in '{cat_name}' should end with '*': {pattern_value}"
                     )
 
+            if duplicates:
+                issues.append(f"Duplicate patterns in '{cat_name}': {duplicates}")
+            issues.extend(type_issues)
+
         return issues
 
     def validate_inheritance(self, config_file: Path) -> tuple[bool, list[str]]:
@@ -192,8 +212,7 @@ class ConfigurationValidator:
             visited.add(str(file_path))
 
             try:
-                with open(file_path) as f:
-                    data = json.load(f)
+                data = read_json_file(file_path)
 
                 if "extends" in data:
                     base_path = file_path.parent / data["extends"]
@@ -2,6 +2,8 @@
 Version parsing and comparison utilities.
 """
 
+import operator
+from collections.abc import Callable
 from functools import lru_cache
 
 from packaging.version import InvalidVersion, Version
@@ -32,6 +34,50 @@ def parse_version(version_str: str) -> Version:
         raise VersionParseError(f"Invalid version string: {version_str}") from e
 
 
+# Range operators, longest first so ">=" is not read as ">"
+_RANGE_COMPARATORS = (
+    (">=", operator.ge),
+    (">", operator.gt),
+    ("<=", operator.le),
+    ("<", operator.lt),
+    ("==", operator.eq),
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_range(
+    version_range: str,
+) -> tuple[tuple[Callable[[Version, Version], bool], Version], ...]:
+    """
+    Parse a range specification into cached (comparator, bound) clauses.
+
+    Clauses are comma-separated; a clause without an operator is an exact
+    match. Versions are compared with plain Version ordering, so pre-,
+    post- and local releases order as Version does (e.g. "10.0.post1" is
+    above ">10.0" and "11.0.0-rc1" below "<11.0").
+
+    Raises:
+        VersionParseError: If a clause's version cannot be parsed
+    """
+    if "," in version_range:
+        parts = [part.strip() for part in version_range.split(",")]
+    else:
+        parts = [version_range]
+
+    return tuple(_parse_clause(part) for part in parts)
+
+
+def _parse_clause(
+    range_spec: str,
+) -> tuple[Callable[[Version, Version], bool], Version]:
+    """Parse a single range clause into (comparator, bound)."""
+    for prefix, compare in _RANGE_COMPARATORS:
+        if range_spec.startswith(prefix):
+            return compare, parse_version(range_spec[len(prefix) :].strip())
+    # Assume exact match
+    return operator.eq, parse_version(range_spec)
+
+
 def version_matches_range(version: str, version_range: str) -> bool:
     """
     Check if a version matches a version range specification.
@@ -45,45 +91,15 @@ def version_matches_range(version: str, version_range: str) -> bool:
     """
     try:
         parsed_version = parse_version(version)
-
-        # Handle compound ranges
-        if "," in version_range:
-            # All parts must match
-            for part in version_range.split(","):
-                if not _check_single_range(parsed_version, part.strip()):
-                    return False
-            return True
-        else:
-            # Single range
-            return _check_single_range(parsed_version, version_range)
-
+        # All clauses must match
+        return all(
+            compare(parsed_version, bound)
+            for compare, bound in _compile_range(version_range)
+        )
     except (VersionParseError, ValueError):
         return False
 
 
-def _check_single_range(version: Version, range_spec: str) -> bool:
-    """Check if version matches a single range specification."""
-    if range_spec.startswith(">="):
-        min_version = parse_version(range_spec[2:].strip())
-        return version >= min_version
-    elif range_spec.startswith(">"):
-        min_version = parse_version(range_spec[1:].strip())
-        return version > min_version
-    elif range_spec.startswith("<="):
-        max_version = parse_version(range_spec[2:].strip())
-        return version <= max_version
-    elif range_spec.startswith("<"):
-        max_version = parse_version(range_spec[1:].strip())
-        return version < max_version
-    elif range_spec.startswith("=="):
-        exact_version = parse_version(range_spec[2:].strip())
-        return version == exact_version
-    else:
-        # Assume exact match
-        exact_version = parse_version(range_spec)
-        return version == exact_version
-
-
 def extract_version_and_range(version_key: str) -> tuple[str, str | None]:
     """
     Extract version and range from a version key.
@@ -3,6 +3,7 @@ Configuration file watcher for hot-reloading.
 """
 
 import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
 
@@ -13,61 +14,115 @@ from watchdog.observers import Observer
 from .loader import ConfigurationLoader
 from .models import RepositoryConfig
 
+# Config formats read by ConfigurationLoader (JSON files, NDJSON bundle)
+CONFIG_SUFFIXES = frozenset({".json", ".ndjson"})
+
 
 class ConfigurationChangeHandler(FileSystemEventHandler):
-    """Handle configuration file changes."""
+    """Handle configuration file changes.
+
+    Events are batched: every relevant event pushes back a quiet-period
+    deadline, and the configuration is reloaded once no further events
+    arrive for ``debounce_seconds`` or as soon as ``max_batch_events`` have
+    piled up, whichever comes first. Editors that save with several writes
+    therefore trigger a single reload, large save storms don't wait out the
+    quiet period, and the last write is never dropped. A single worker thread
+    waits on a condition for the whole batch instead of one timer per event.
+    """
 
-    def __init__(self, config_path: Path, callback: Callable[[RepositoryConfig], None]):
+    def __init__(
+        self,
+        config_path: Path,
+        callback: Callable[[RepositoryConfig], None],
+        debounce_seconds: float = 0.75,
+        max_batch_events: int = 100,
+    ):
         """
         Initialize the change handler.
 
         Args:
             config_path: Path to configuration directory or file
             callback: Function to call when configuration changes
+            debounce_seconds: Quiet period required before reloading
+            max_batch_events: Pending events that trigger a reload immediately
         """
         self.config_path = config_path
         self.callback = callback
         self.loader = ConfigurationLoader(str(config_path))
+        self.debounce_seconds = debounce_seconds
+        self.max_batch_events = max_batch_events
         self._lock = threading.Lock()
-        self._last_reload_time = 0
-        self._reload_cooldown = 1.0  # seconds
+        self._condition = threading.Condition()
+        self._pending_events = 0
+        self._deadline = 0.0
+        self._worker: threading.Thread | None = None
 
     def on_modified(self, event):
         """Handle file modification events."""
-        if event.is_directory:
-            return
-
-        # Check if the modified file is a config file
-        if not self._is_config_file(event.src_path):
-            return
-
-        # Avoid rapid reloads
-        import time
-
-        current_time = time.time()
-        if current_time - self._last_reload_time < self._reload_cooldown:
-            return
-
-        self._last_reload_time = current_time
-        self._reload_configuration()
+        if not event.is_directory and self._is_config_file(event.src_path):
+            self._schedule_reload()
 
     def on_created(self, event):
         """Handle file creation events."""
         if not event.is_directory and self._is_config_file(event.src_path):
-            self._reload_configuration()
+            self._schedule_reload()
 
     def on_deleted(self, event):
         """Handle file deletion events."""
         if not event.is_directory and self._is_config_file(event.src_path):
             logger.warning(f"Configuration file deleted: {event.src_path}")
+            self._schedule_reload()
+
+    def _schedule_reload(self):
+        """Record an event and push back the pending reload's deadline.
+
+        Events arriving while a reload runs stay pending, so the worker
+        reloads once more afterwards instead of missing the latest save.
+        """
+        with self._condition:
+            self._pending_events += 1
+            self._deadline = time.monotonic() + self.debounce_seconds
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="config-reload", daemon=True
+                )
+                self._worker.start()
+            self._condition.notify()
+
+    def cancel_pending(self):
+        """Drop a pending reload that has not fired yet and stop the worker."""
+        with self._condition:
+            self._pending_events = 0
+            self._worker = None
+            self._condition.notify_all()
+
+    def _run_worker(self):
+        """Wait for each batch of events to close, then reload once."""
+        me = threading.current_thread()
+        while True:
+            with self._condition:
+                while self._worker is me and not self._pending_events:
+                    self._condition.wait()
+                while (
+                    self._worker is me
+                    and 0 < self._pending_events < self.max_batch_events
+                ):
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._worker is not me:
+                    return
+                self._pending_events = 0
+
             self._reload_configuration()
 
     def _is_config_file(self, path: str) -> bool:
         """Check if a file is a configuration file."""
         path_obj = Path(path)
 
-        # Check if it's a JSON file
-        if path_obj.suffix != ".json":
+        # Check if it's a JSON or NDJSON file
+        if path_obj.suffix not in CONFIG_SUFFIXES:
             return False
 
         # Ignore schema files
@@ -88,8 +143,7 @@ class ConfigurationChangeHandler(FileSystemEventHandler):
                 logger.info("Reloading configuration...")
 
                 # Clear loader cache
-                self.loader._loaded_configs.clear()
-                self.loader._resolved_repos.clear()
+                self.loader.clear_cache()
 
                 # Reload configuration
                 new_config = self.loader.load_config()
@@ -165,6 +219,7 @@ class ConfigurationWatcher:
 
         self.observer.stop()
         self.observer.join()
+        self.handler.cancel_pending()
         self._started = False
 
         logger.info("Stopped configuration watcher")
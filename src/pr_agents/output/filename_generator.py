@@ -5,6 +5,26 @@ Filename generator for creating descriptive output filenames.
 import re
 from typing import Any
 
+# Base names that say nothing about the analysis and get replaced by a
+# descriptive one
+_GENERIC_NAMES = frozenset(
+    {
+        "analysis",
+        "report",
+        "output",
+        "result",
+        "summary",
+        "pr_analysis",
+        "pr_report",
+        "full_analysis",
+        "data",
+    }
+)
+
+# Characters stripped from tags/identifiers and from module names
+_TAG_UNSAFE_CHARS = re.compile(r"[^\w\.\-]")
+_NAME_UNSAFE_CHARS = re.compile(r"[^\w\-]")
+
 
 class FilenameGenerator:
     """Generate descriptive filenames based on PR/analysis data."""
@@ -58,7 +78,7 @@ class FilenameGenerator:
             return base_name
 
         # Clean release tag
-        clean_tag = re.sub(r"[^\w\.\-]", "", release_tag)
+        clean_tag = _TAG_UNSAFE_CHARS.sub("", release_tag)
         return f"release-{clean_tag}"
 
     @staticmethod
@@ -83,7 +103,7 @@ class FilenameGenerator:
 
         parts = [batch_type]
         if identifier:
-            clean_id = re.sub(r"[^\w\.\-]", "", identifier)
+            clean_id = _TAG_UNSAFE_CHARS.sub("", identifier)
             parts.append(clean_id)
 
         return "-".join(parts)
@@ -91,20 +111,9 @@ class FilenameGenerator:
     @staticmethod
     def _is_generic_name(name: str) -> bool:
         """Check if a filename is too generic."""
-        generic_names = {
-            "analysis",
-            "report",
-            "output",
-            "result",
-            "summary",
-            "pr_analysis",
-            "pr_report",
-            "full_analysis",
-            "data",
-        }
         # Remove extension if present
         base = name.rsplit(".", 1)[0].lower()
-        return base in generic_names
+        return base in _GENERIC_NAMES
 
     @staticmethod
     def _identify_main_module(data: dict[str, Any]) -> str | None:
@@ -138,7 +147,7 @@ class FilenameGenerator:
                                 names.append(str(module))
                         if all(names):
                             # Clean the names and join them
-                            clean_names = [re.sub(r"[^\w\-]", "", n) for n in names]
+                            clean_names = [_NAME_UNSAFE_CHARS.sub("", n) for n in names]
                             return "-".join(clean_names)
 
                     # Fallback to first module
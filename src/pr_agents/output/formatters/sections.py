@@ -4,6 +4,19 @@ from typing import Any
 
 from .base import SectionFormatter
 
+# AI persona summaries in display order: (summaries key, persona name used by
+# the personas filter, section title)
+_AI_PERSONAS = tuple(
+    (key, key.removesuffix("_summary"), title)
+    for key, title in (
+        ("executive_summary", "Executive Summary"),
+        ("product_summary", "Product Manager Summary"),
+        ("developer_summary", "Technical Developer Summary"),
+        ("reviewer_summary", "Code Review"),
+        ("technical_writer_summary", "Technical Writer Summary"),
+    )
+)
+
 
 class HeaderSection(SectionFormatter):
     """Formats the header section of a PR analysis."""
@@ -77,20 +90,9 @@ class AISection(SectionFormatter):
         lines = ["## 🤖 AI-Generated Summaries", ""]
         ai_summaries = data["ai_summaries"]
 
-        personas = [
-            ("executive_summary", "Executive Summary"),
-            ("product_summary", "Product Manager Summary"),
-            ("developer_summary", "Technical Developer Summary"),
-            ("reviewer_summary", "Code Review"),
-            ("technical_writer_summary", "Technical Writer Summary"),
-        ]
-
-        for persona_key, persona_title in personas:
+        for persona_key, persona_name, persona_title in _AI_PERSONAS:
             # Skip if filtering personas
-            if (
-                personas_filter
-                and persona_key.replace("_summary", "") not in personas_filter
-            ):
+            if personas_filter and persona_name not in personas_filter:
                 continue
 
             if persona_key in ai_summaries:
@@ -157,18 +159,7 @@ class ModulesSection(SectionFormatter):
             modules = modules_data["modules"]
             if isinstance(modules, list) and modules:
                 lines.append(f"### Modules Found ({len(modules)})")
-                for module in modules:
-                    if isinstance(module, dict):
-                        name = module.get("name", "Unknown")
-                        mod_type = module.get("type", "unknown")
-                        action = module.get("action", "")
-
-                        if action and action != "modified":
-                            lines.append(f"- **{name}** ({mod_type}) - {action}")
-                        else:
-                            lines.append(f"- **{name}** ({mod_type})")
-                    else:
-                        lines.append(f"- {module}")
+                lines.extend(map(self._format_module_line, modules))
                 lines.append("")
 
         # Show summary info
@@ -223,6 +214,19 @@ class ModulesSection(SectionFormatter):
         lines.append("")
         return lines
 
+    @staticmethod
+    def _format_module_line(module: Any) -> str:
+        """Format one entry of the modules list."""
+        if not isinstance(module, dict):
+            return f"- {module}"
+
+        name = module.get("name", "Unknown")
+        mod_type = module.get("type", "unknown")
+        action = module.get("action", "")
+        if action and action != "modified":
+            return f"- **{name}** ({mod_type}) - {action}"
+        return f"- **{name}** ({mod_type})"
+
     def applies_to(self, data: dict[str, Any]) -> bool:
         """Check if modules data is present."""
         return "modules" in data
@@ -276,8 +280,9 @@ class CodeChangesSection(SectionFormatter):
 
             if "changed_files" in file_analysis and file_analysis["changed_files"]:
                 lines.append("### Files")
-                for file_path in file_analysis["changed_files"]:
-                    lines.append(f"- `{file_path}`")
+                lines.extend(
+                    f"- `{file_path}`" for file_path in file_analysis["changed_files"]
+                )
                 lines.append("")
 
             if "file_types" in file_analysis and file_analysis["file_types"]:
@@ -351,34 +356,30 @@ class MetadataSection(SectionFormatter):
         lines = ["## 📋 Metadata Analysis", ""]
         metadata = data["metadata"]
 
-        # Title Quality
+        # Title and Description Quality
         if "title_quality" in metadata:
-            quality = metadata["title_quality"]
-            lines.append(
-                f"### Title Quality: {quality.get('quality_level', 'Unknown')} "
-                f"({quality.get('score', 0)}/100)"
-            )
-            if issues := quality.get("issues", []):
-                lines.append("**Issues:**")
-                for issue in issues:
-                    lines.append(f"- {issue}")
-            lines.append("")
+            lines.extend(self._format_quality("Title", metadata["title_quality"]))
 
-        # Description Quality
         if "description_quality" in metadata:
-            quality = metadata["description_quality"]
-            lines.append(
-                f"### Description Quality: {quality.get('quality_level', 'Unknown')} "
-                f"({quality.get('score', 0)}/100)"
+            lines.extend(
+                self._format_quality("Description", metadata["description_quality"])
             )
-            if issues := quality.get("issues", []):
-                lines.append("**Issues:**")
-                for issue in issues:
-                    lines.append(f"- {issue}")
-            lines.append("")
 
         return lines
 
+    @staticmethod
+    def _format_quality(label: str, quality: dict[str, Any]) -> list[str]:
+        """Format a title or description quality score and its issues."""
+        lines = [
+            f"### {label} Quality: {quality.get('quality_level', 'Unknown')} "
+            f"({quality.get('score', 0)}/100)"
+        ]
+        if issues := quality.get("issues", []):
+            lines.append("**Issues:**")
+            lines.extend(f"- {issue}" for issue in issues)
+        lines.append("")
+        return lines
+
     def applies_to(self, data: dict[str, Any]) -> bool:
         """Check if metadata quality data is present."""
         metadata = data.get("metadata", {})
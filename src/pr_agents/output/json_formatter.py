@@ -3,12 +3,38 @@ Modular JSON formatter for PR analysis output.
 """
 
 import json
+from pathlib import Path
 from typing import Any
 
+from ..config.io_utils import dumps_json
 from .base import BaseFormatter
 from .formatters.base import FormatterConfig
 from .formatters.json_transformers import TRANSFORMER_REGISTRY
 
+# Exact scalar types kept as-is; checked by type so leaves skip a recursive call
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+
+
+def _clean(obj: Any) -> Any:
+    """Drop None values and stringify non-JSON types, recursively."""
+    if isinstance(obj, dict):
+        return {
+            k: v if type(v) in _SCALAR_TYPES else _clean(v)
+            for k, v in obj.items()
+            if v is not None
+        }
+    elif isinstance(obj, list):
+        return [
+            item if type(item) in _SCALAR_TYPES else _clean(item)
+            for item in obj
+            if item is not None
+        ]
+    elif isinstance(obj, str | int | float | bool) or obj is None:
+        return obj
+    else:
+        # Convert other types to string
+        return str(obj)
+
 
 class JSONFormatter(BaseFormatter):
     """Formats PR analysis results as JSON with modular transformers."""
@@ -41,6 +67,18 @@ class JSONFormatter(BaseFormatter):
         Returns:
             JSON formatted string
         """
+        return self.format_bytes(data).decode()
+
+    def format_bytes(self, data: dict[str, Any]) -> bytes:
+        """
+        Format PR analysis data as UTF-8 encoded JSON.
+
+        Args:
+            data: PR analysis results dictionary
+
+        Returns:
+            JSON document as bytes
+        """
         # Check if this is batch results
         if "pr_results" in data and "batch_summary" in data:
             if self._is_release_data(data) and self.config.grouped_by_tag:
@@ -53,12 +91,8 @@ class JSONFormatter(BaseFormatter):
 
         # Clean and serialize
         cleaned_data = self._clean_data(output_data)
-        return json.dumps(
-            cleaned_data,
-            indent=self.indent,
-            sort_keys=self.sort_keys,
-            ensure_ascii=False,
-            default=str,
+        return dumps_json(
+            cleaned_data, indent=self.indent, sort_keys=self.sort_keys, default=str
         )
 
     def _format_single_pr_json(self, data: dict[str, Any]) -> dict[str, Any]:
@@ -305,26 +339,34 @@ class JSONFormatter(BaseFormatter):
         """
         Recursively clean data to ensure JSON serializability.
 
+        None values are dropped at every depth and values that are not JSON
+        scalars or containers are converted to strings.
+
         Args:
             obj: Object to clean
 
         Returns:
             Cleaned object
         """
-        if isinstance(obj, dict):
-            return {k: self._clean_data(v) for k, v in obj.items() if v is not None}
-        elif isinstance(obj, list):
-            return [self._clean_data(item) for item in obj if item is not None]
-        elif isinstance(obj, str | int | float | bool) or obj is None:
-            return obj
-        else:
-            # Convert other types to string
-            return str(obj)
+        return _clean(obj)
 
     def get_file_extension(self) -> str:
         """Return JSON file extension."""
         return ".json"
 
+    def save_to_file(self, data: dict[str, Any], filepath: Path) -> None:
+        """
+        Save JSON formatted data to a file.
+
+        The serialized bytes are written as-is, skipping the decode and
+        re-encode a str round trip would cost.
+
+        Args:
+            data: PR analysis results dictionary
+            filepath: Path to save the file
+        """
+        filepath.write_bytes(self.format_bytes(data))
+
     def validate_data(self, data: dict[str, Any]) -> bool:
         """
         Validate that the data can be serialized to JSON.
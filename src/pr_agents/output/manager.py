@@ -3,7 +3,9 @@ Output manager for coordinating different formatters.
 """
 
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Literal
 
 from loguru import logger
@@ -16,6 +18,27 @@ from .text import TextFormatter
 
 OutputFormat = Literal["markdown", "md", "text", "txt", "json"]
 
+# File extension (without dot) -> format type
+_EXTENSION_FORMATS = MappingProxyType(
+    {
+        "md": "markdown",
+        "markdown": "markdown",
+        "txt": "text",
+        "text": "text",
+        "json": "json",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _repo_output_dir(full_name: str) -> Path:
+    """Return the output directory for a repository's analyses.
+
+    Only the repository name is used (e.g., "owner/repo" -> "output/repo").
+    Cached since every save for a repository resolves the same directory.
+    """
+    return Path("output") / full_name.split("/")[-1]
+
 
 class OutputManager:
     """
@@ -27,11 +50,14 @@ class OutputManager:
 
     def __init__(self):
         """Initialize output manager with available formatters."""
+        # Aliases share one formatter instance
+        markdown = MarkdownFormatter()
+        text = TextFormatter()
         self.formatters = {
-            "markdown": MarkdownFormatter(),
-            "md": MarkdownFormatter(),
-            "text": TextFormatter(),
-            "txt": TextFormatter(),
+            "markdown": markdown,
+            "md": markdown,
+            "text": text,
+            "txt": text,
             "json": JSONFormatter(),
         }
         logger.info(
@@ -84,28 +110,7 @@ class OutputManager:
         Raises:
             ValueError: If format cannot be determined
         """
-        filepath = Path(filepath)
-
-        # Generate descriptive filename if enabled and name is generic
-        if auto_name and filepath.name:
-            base_name = filepath.stem  # filename without extension
-            descriptive_name = FilenameGenerator.generate_pr_filename(data, base_name)
-            if descriptive_name != base_name:
-                # Replace the filename with the descriptive one
-                filepath = filepath.parent / descriptive_name
-                if filepath.suffix == "":  # Preserve original extension if it had one
-                    filepath = filepath.with_suffix(Path(str(filepath)).suffix)
-
-        # Apply repository-based directory structure if requested
-        if repo_structure and "repository" in data:
-            repo_info = data["repository"]
-            if "full_name" in repo_info:
-                # Extract just the repo name from full_name (e.g., "owner/repo" -> "repo")
-                repo_name = repo_info["full_name"].split("/")[-1]
-                repo_path = Path("output") / repo_name
-                # If filepath is relative, prepend the repo path
-                if not filepath.is_absolute():
-                    filepath = repo_path / filepath
+        filepath = self._resolve_path(data, Path(filepath), repo_structure, auto_name)
 
         # Determine format from file extension if not specified
         if format_type is None:
@@ -118,18 +123,10 @@ class OutputManager:
 
         formatter = self._get_formatter(format_type)
 
-        # Add extension if not present
-        if not filepath.suffix:
-            filepath = filepath.with_suffix(formatter.get_file_extension())
-
         # Create parent directories if needed
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save the file
-        formatter.save_to_file(data, filepath)
-        logger.info("Saved PR analysis to: {}", filepath)
-
-        return filepath
+        return self._write(data, filepath, formatter)
 
     def save_multiple_formats(
         self,
@@ -142,6 +139,9 @@ class OutputManager:
         """
         Save data in multiple formats.
 
+        The output path is resolved and its directory created once; only the
+        formatting and the write happen per format.
+
         Args:
             data: PR analysis results dictionary
             base_path: Base path for files (without extension)
@@ -152,20 +152,88 @@ class OutputManager:
         Returns:
             List of paths to saved files
         """
-        base_path = Path(base_path)
         saved_files = []
 
+        try:
+            filepath = self._resolve_path(
+                data, Path(base_path), repo_structure, auto_name
+            )
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error("Failed to prepare output path {}: {}", base_path, e)
+            return saved_files
+
         for format_type in formats:
             try:
-                filepath = self.save(
-                    data, base_path, format_type, repo_structure, auto_name
-                )
-                saved_files.append(filepath)
+                formatter = self._get_formatter(format_type)
+                saved_files.append(self._write(data, filepath, formatter))
             except Exception as e:
                 logger.error("Failed to save {} format: {}", format_type, e)
 
         return saved_files
 
+    def _resolve_path(
+        self,
+        data: dict[str, Any],
+        filepath: Path,
+        repo_structure: bool,
+        auto_name: bool,
+    ) -> Path:
+        """
+        Apply descriptive naming and the repository directory to a save path.
+
+        Args:
+            data: PR analysis results dictionary
+            filepath: Requested path (with or without extension)
+            repo_structure: If True and data contains repo info, organize in repo subdirectory
+            auto_name: If True, generate descriptive filename for generic names
+
+        Returns:
+            Path to save to, before any format extension is added
+        """
+        # Generate descriptive filename if enabled and name is generic
+        if auto_name and filepath.name:
+            base_name = filepath.stem  # filename without extension
+            descriptive_name = FilenameGenerator.generate_pr_filename(data, base_name)
+            if descriptive_name != base_name:
+                # Replace the filename with the descriptive one; the format's
+                # extension is added when the file is written
+                filepath = filepath.with_name(descriptive_name)
+
+        # Apply repository-based directory structure if requested
+        if repo_structure and "repository" in data:
+            repo_info = data["repository"]
+            # If filepath is relative, prepend the repo path
+            if "full_name" in repo_info and not filepath.is_absolute():
+                filepath = _repo_output_dir(repo_info["full_name"]) / filepath
+
+        return filepath
+
+    def _write(
+        self, data: dict[str, Any], filepath: Path, formatter: BaseFormatter
+    ) -> Path:
+        """
+        Format data and write it to a path whose directory already exists.
+
+        Args:
+            data: PR analysis results dictionary
+            filepath: Path to save to; the formatter's extension is added if
+                it has none
+            formatter: Formatter to use
+
+        Returns:
+            Path to the saved file
+        """
+        # Add extension if not present
+        if not filepath.suffix:
+            filepath = filepath.with_suffix(formatter.get_file_extension())
+
+        # Save the file
+        formatter.save_to_file(data, filepath)
+        logger.info("Saved PR analysis to: {}", filepath)
+
+        return filepath
+
     def _get_formatter(self, format_type: OutputFormat) -> BaseFormatter:
         """
         Get formatter for the specified format type.
@@ -179,13 +247,13 @@ class OutputManager:
         Raises:
             ValueError: If format_type is not supported
         """
-        if format_type not in self.formatters:
+        try:
+            return self.formatters[format_type]
+        except KeyError:
             raise ValueError(
                 f"Unsupported format: {format_type}. "
                 f"Available formats: {list(self.formatters.keys())}"
-            )
-
-        return self.formatters[format_type]
+            ) from None
 
     def _infer_format_from_extension(self, extension: str) -> OutputFormat:
         """
@@ -201,20 +269,10 @@ class OutputManager:
             ValueError: If extension is not recognized
         """
         # Remove dot if present
-        ext = extension.lstrip(".")
-
-        extension_map = {
-            "md": "markdown",
-            "markdown": "markdown",
-            "txt": "text",
-            "text": "text",
-            "json": "json",
-        }
-
-        if ext not in extension_map:
-            raise ValueError(f"Unknown file extension: {extension}")
-
-        return extension_map[ext]
+        try:
+            return _EXTENSION_FORMATS[extension.lstrip(".")]
+        except KeyError:
+            raise ValueError(f"Unknown file extension: {extension}") from None
 
     def get_supported_formats(self) -> list[str]:
         """
@@ -5,7 +5,7 @@ Modular markdown formatter for PR analysis output.
 from typing import Any
 
 from .base import BaseFormatter
-from .formatters.base import FormatterConfig
+from .formatters.base import FormatterConfig, SectionFormatter
 from .formatters.sections import (
     AISection,
     CodeChangesSection,
@@ -18,6 +18,27 @@ from .formatters.sections import (
     ReviewsSection,
 )
 
+# Sections are stateless, so they are built and ordered once at import rather
+# than on every format() call. Each entry pairs the section with the name used
+# by FormatterConfig.sections (class name without "Section", lowercased).
+_SECTIONS: tuple[tuple[str, SectionFormatter], ...] = tuple(
+    (section.__class__.__name__.replace("Section", "").lower(), section)
+    for section in sorted(
+        (
+            HeaderSection(),
+            ModulesSection(),
+            CodeChangesSection(),
+            LabelsSection(),
+            MetadataSection(),
+            AISection(),
+            ReviewsSection(),
+            RepositorySection(),
+            MetricsSection(),
+        ),
+        key=lambda s: s.get_priority(),
+    )
+)
+
 
 class MarkdownFormatter(BaseFormatter):
     """Formats PR analysis results as Markdown with modular sections."""
@@ -58,27 +79,11 @@ class MarkdownFormatter(BaseFormatter):
             "include_metrics": self.config.include_metrics,
         }
 
-        # Define all available sections in priority order
-        sections = [
-            HeaderSection(),
-            ModulesSection(),
-            CodeChangesSection(),
-            LabelsSection(),
-            MetadataSection(),
-            AISection(),
-            ReviewsSection(),
-            RepositorySection(),
-            MetricsSection(),
-        ]
-
-        # Sort by priority
-        sections.sort(key=lambda s: s.get_priority())
-
-        # Apply each section if it has data and is enabled
-        for section in sections:
+        # Apply each section, in priority order, if it has data and is enabled
+        enabled = self.config.sections
+        for section_name, section in _SECTIONS:
             # Check if section is enabled in config
-            section_name = section.__class__.__name__.replace("Section", "").lower()
-            if self.config.sections and section_name not in self.config.sections:
+            if enabled and section_name not in enabled:
                 continue
 
             # Apply section if it has data
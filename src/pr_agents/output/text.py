@@ -2,10 +2,31 @@
 Plain text formatter for PR analysis output.
 """
 
+from types import MappingProxyType
 from typing import Any
 
 from .base import BaseFormatter
 
+_REPORT_RULE = "=" * 80
+_SECTION_RULE = "-" * 40
+
+# Header block of every report, and of each section keyed by the data field it
+# formats, built once; format() copies them into its line list.
+_REPORT_HEADER = (_REPORT_RULE, "PR ANALYSIS REPORT", _REPORT_RULE, "")
+_SECTION_HEADERS = MappingProxyType(
+    {
+        key: (_SECTION_RULE, title, _SECTION_RULE, "")
+        for key, title in (
+            ("metadata", "METADATA ANALYSIS"),
+            ("code_changes", "CODE CHANGES ANALYSIS"),
+            ("repository_info", "REPOSITORY ANALYSIS"),
+            ("reviews", "REVIEW ANALYSIS"),
+            ("ai_summaries", "AI-GENERATED SUMMARIES"),
+            ("processing_metrics", "PROCESSING METRICS"),
+        )
+    }
+)
+
 
 class TextFormatter(BaseFormatter):
     """Formats PR analysis results as plain text."""
@@ -20,13 +41,8 @@ class TextFormatter(BaseFormatter):
         Returns:
             Plain text formatted string
         """
-        lines = []
-
         # Header
-        lines.append("=" * 80)
-        lines.append("PR ANALYSIS REPORT")
-        lines.append("=" * 80)
-        lines.append("")
+        lines = list(_REPORT_HEADER)
 
         if "pr_url" in data:
             lines.append(f"Pull Request: {data['pr_url']}")
@@ -63,38 +79,21 @@ class TextFormatter(BaseFormatter):
         if "processing_metrics" in data:
             lines.extend(self._format_processing_metrics(data["processing_metrics"]))
 
-        lines.append("=" * 80)
+        lines.append(_REPORT_RULE)
         return "\n".join(lines)
 
     def _format_metadata(self, metadata: dict[str, Any]) -> list[str]:
         """Format metadata section."""
-        lines = ["-" * 40]
-        lines.append("METADATA ANALYSIS")
-        lines.append("-" * 40)
-        lines.append("")
+        lines = list(_SECTION_HEADERS["metadata"])
 
         # Title and Description Quality
         if "title_quality" in metadata:
-            quality = metadata["title_quality"]
-            lines.append(
-                f"Title Quality: {quality.get('quality_level', 'Unknown')} ({quality.get('score', 0)}/100)"
-            )
-            if issues := quality.get("issues", []):
-                lines.append("  Issues:")
-                for issue in issues:
-                    lines.append(f"    - {issue}")
-            lines.append("")
+            lines.extend(self._format_quality("Title", metadata["title_quality"]))
 
         if "description_quality" in metadata:
-            quality = metadata["description_quality"]
-            lines.append(
-                f"Description Quality: {quality.get('quality_level', 'Unknown')} ({quality.get('score', 0)}/100)"
+            lines.extend(
+                self._format_quality("Description", metadata["description_quality"])
             )
-            if issues := quality.get("issues", []):
-                lines.append("  Issues:")
-                for issue in issues:
-                    lines.append(f"    - {issue}")
-            lines.append("")
 
         # Label Analysis
         if "label_analysis" in metadata:
@@ -113,12 +112,21 @@ class TextFormatter(BaseFormatter):
 
         return lines
 
+    def _format_quality(self, label: str, quality: dict[str, Any]) -> list[str]:
+        """Format a title or description quality score and its issues."""
+        lines = [
+            f"{label} Quality: {quality.get('quality_level', 'Unknown')} "
+            f"({quality.get('score', 0)}/100)"
+        ]
+        if issues := quality.get("issues", []):
+            lines.append("  Issues:")
+            lines.extend(f"    - {issue}" for issue in issues)
+        lines.append("")
+        return lines
+
     def _format_code_changes(self, code_changes: dict[str, Any]) -> list[str]:
         """Format code changes section."""
-        lines = ["-" * 40]
-        lines.append("CODE CHANGES ANALYSIS")
-        lines.append("-" * 40)
-        lines.append("")
+        lines = list(_SECTION_HEADERS["code_changes"])
 
         # Change Statistics
         if "change_stats" in code_changes:
@@ -155,10 +163,7 @@ class TextFormatter(BaseFormatter):
 
     def _format_repository_info(self, repo_info: dict[str, Any]) -> list[str]:
         """Format repository information section."""
-        lines = ["-" * 40]
-        lines.append("REPOSITORY ANALYSIS")
-        lines.append("-" * 40)
-        lines.append("")
+        lines = list(_SECTION_HEADERS["repository_info"])
 
         # Repository Health
         if "health_assessment" in repo_info:
@@ -193,10 +198,7 @@ class TextFormatter(BaseFormatter):
 
     def _format_reviews(self, reviews: dict[str, Any]) -> list[str]:
         """Format reviews section."""
-        lines = ["-" * 40]
-        lines.append("REVIEW ANALYSIS")
-        lines.append("-" * 40)
-        lines.append("")
+        lines = list(_SECTION_HEADERS["reviews"])
 
         # Review Summary
         if "review_summary" in reviews:
@@ -225,10 +227,7 @@ class TextFormatter(BaseFormatter):
 
     def _format_ai_summaries(self, ai_summaries: dict[str, Any]) -> list[str]:
         """Format AI-generated summaries section."""
-        lines = ["-" * 40]
-        lines.append("AI-GENERATED SUMMARIES")
-        lines.append("-" * 40)
-        lines.append("")
+        lines = list(_SECTION_HEADERS["ai_summaries"])
 
         # Executive Summary
         if "executive_summary" in ai_summaries:
@@ -287,10 +286,7 @@ class TextFormatter(BaseFormatter):
 
     def _format_processing_metrics(self, metrics: dict[str, Any]) -> list[str]:
         """Format processing metrics section."""
-        lines = ["-" * 40]
-        lines.append("PROCESSING METRICS")
-        lines.append("-" * 40)
-        lines.append("")
+        lines = list(_SECTION_HEADERS["processing_metrics"])
 
         if "total_duration" in metrics:
             lines.append(f"Total Processing Time: {metrics['total_duration']:.2f}s")
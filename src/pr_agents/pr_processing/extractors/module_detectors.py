@@ -2,12 +2,25 @@
 Module detection strategies for different module types.
 """
 
+import fnmatch
+import re
+import sys
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 
 class ModuleDetector(ABC):
-    """Base class for module type detection strategies."""
+    """Base class for module type detection strategies.
+
+    Detectors that match purely on a name suffix should subclass
+    ``SuffixDetector``; the registry indexes any detector declaring
+    ``SUFFIXES``, ``MODULE_TYPE`` and ``CATEGORY`` by suffix and resolves it
+    with dict lookups instead of calling ``detect()``.
+    """
 
     @abstractmethod
     def detect(self, module_name: str, file_path: str) -> tuple[str | None, str | None]:
@@ -24,58 +37,86 @@ class ModuleDetector(ABC):
         pass
 
 
-class BidAdapterDetector(ModuleDetector):
-    """Detects bid adapter modules."""
+class SuffixDetector(ModuleDetector):
+    """Detects modules whose name ends with one of ``SUFFIXES``.
+
+    Subclasses only set the class attributes; the registry indexes them by
+    suffix rather than calling ``detect()``.
+    """
+
+    SUFFIXES: tuple[str, ...] = ()
+    MODULE_TYPE: str = ""
+    CATEGORY: str = ""
 
     def detect(self, module_name: str, file_path: str) -> tuple[str | None, str | None]:
-        if module_name.endswith("BidAdapter"):
-            return "bid_adapter", "adapter"
+        if self.SUFFIXES and module_name.endswith(self.SUFFIXES):
+            return self.MODULE_TYPE, self.CATEGORY
         return None, None
 
 
-class RtdModuleDetector(ModuleDetector):
+class BidAdapterDetector(SuffixDetector):
+    """Detects bid adapter modules."""
+
+    SUFFIXES = ("BidAdapter",)
+    MODULE_TYPE = "bid_adapter"
+    CATEGORY = "adapter"
+
+
+class RtdModuleDetector(SuffixDetector):
     """Detects real-time data modules."""
 
-    def detect(self, module_name: str, file_path: str) -> tuple[str | None, str | None]:
-        if module_name.endswith("RtdModule") or module_name.endswith("RtdProvider"):
-            return "rtd_module", "rtd"
-        return None, None
+    SUFFIXES = ("RtdModule", "RtdProvider")
+    MODULE_TYPE = "rtd_module"
+    CATEGORY = "rtd"
 
 
-class AnalyticsAdapterDetector(ModuleDetector):
+class AnalyticsAdapterDetector(SuffixDetector):
     """Detects analytics adapter modules."""
 
-    def detect(self, module_name: str, file_path: str) -> tuple[str | None, str | None]:
-        if module_name.endswith("AnalyticsAdapter"):
-            return "analytics_adapter", "analytics"
-        return None, None
+    SUFFIXES = ("AnalyticsAdapter",)
+    MODULE_TYPE = "analytics_adapter"
+    CATEGORY = "analytics"
 
 
-class IdSystemDetector(ModuleDetector):
+class IdSystemDetector(SuffixDetector):
     """Detects ID system modules."""
 
-    def detect(self, module_name: str, file_path: str) -> tuple[str | None, str | None]:
-        if module_name.endswith("IdSystem"):
-            return "id_system", "identity"
-        return None, None
+    SUFFIXES = ("IdSystem",)
+    MODULE_TYPE = "id_system"
+    CATEGORY = "identity"
 
 
-class UserModuleDetector(ModuleDetector):
+class UserModuleDetector(SuffixDetector):
     """Detects user modules."""
 
-    def detect(self, module_name: str, file_path: str) -> tuple[str | None, str | None]:
-        if module_name.endswith("UserModule"):
-            return "user_module", "user"
-        return None, None
+    SUFFIXES = ("UserModule",)
+    MODULE_TYPE = "user_module"
+    CATEGORY = "user"
 
 
-class VideoModuleDetector(ModuleDetector):
+class VideoModuleDetector(SuffixDetector):
     """Detects video modules."""
 
-    def detect(self, module_name: str, file_path: str) -> tuple[str | None, str | None]:
-        if module_name.endswith("VideoModule"):
-            return "video_module", "video"
-        return None, None
+    SUFFIXES = ("VideoModule",)
+    MODULE_TYPE = "video_module"
+    CATEGORY = "video"
+
+
+# Module names whose suffix lookup is remembered per registry; PRs and
+# batches keep touching the same modules, whatever directory they are in
+SUFFIX_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=64)
+def _compile_globs(paths: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile a set of globs into one alternation, or None if there are none.
+
+    Cached on the glob tuple, so reloading the same repository config (a new
+    set of detectors per extractor) reuses the compiled patterns.
+    """
+    if not paths:
+        return None
+    return re.compile("|".join(fnmatch.translate(path) for path in paths))
 
 
 class ConfigBasedDetector(ModuleDetector):
@@ -87,35 +128,36 @@ class ConfigBasedDetector(ModuleDetector):
         self.paths = config.get("paths", [])
         self.naming_pattern = config.get("naming_pattern", "")
         self.category = config.get("category", self._determine_category(module_type))
+        # Translate the globs and parse the naming pattern once, not per file
+        self._paths_re = _compile_globs(tuple(self.paths))
+        self._naming_rule = self._parse_naming_pattern(self.naming_pattern)
 
     def detect(self, module_name: str, file_path: str) -> tuple[str | None, str | None]:
         # Check if file matches configured paths
-        for path_pattern in self.paths:
-            if self._matches_pattern(file_path, path_pattern):
-                # Check naming pattern if specified
-                if self.naming_pattern:
-                    if self._matches_naming_pattern(module_name):
-                        return self.module_type, self.category
-                else:
-                    # No naming pattern, just path match is enough
-                    return self.module_type, self.category
+        if self._paths_re is None or not self._paths_re.match(file_path):
+            return None, None
+        # Check naming pattern if specified; otherwise the path match is enough
+        if self._matches_naming_pattern(module_name):
+            return self.module_type, self.category
         return None, None
 
-    def _matches_pattern(self, file_path: str, pattern: str) -> bool:
-        """Check if file path matches a pattern."""
-        import fnmatch
-
-        return fnmatch.fnmatch(file_path, pattern)
+    @staticmethod
+    def _parse_naming_pattern(naming_pattern: str) -> tuple[str, str] | None:
+        """Parse ``endsWith('x')``/``startsWith('x')`` into ``(kind, literal)``."""
+        for kind in ("endsWith", "startsWith"):
+            if kind in naming_pattern:
+                parts = naming_pattern.split("'")
+                return kind, parts[1] if len(parts) > 1 else ""
+        return None
 
     def _matches_naming_pattern(self, module_name: str) -> bool:
         """Check if module name matches naming pattern."""
-        if "endsWith" in self.naming_pattern:
-            suffix = self.naming_pattern.split("'")[1]
-            return module_name.endswith(suffix)
-        elif "startsWith" in self.naming_pattern:
-            prefix = self.naming_pattern.split("'")[1]
-            return module_name.startswith(prefix)
-        return True
+        if self._naming_rule is None:
+            return True
+        kind, literal = self._naming_rule
+        if kind == "endsWith":
+            return module_name.endswith(literal)
+        return module_name.startswith(literal)
 
     def _determine_category(self, module_type: str) -> str:
         """Determine category from module type."""
@@ -134,20 +176,58 @@ class ConfigBasedDetector(ModuleDetector):
         return category_map.get(module_type, "other")
 
 
+# Shared read-only detection results, one per (module_type, category) pair, so
+# detect_module_type() doesn't allocate a fresh dict for every file. Pairs
+# are added on first use.
+_RESULTS: dict[tuple[str, str], Mapping[str, str]] = {
+    ("generic", "utility"): MappingProxyType({"type": "generic", "category": "utility"})
+}
+
+
+def _detection_result(module_type: str, category: str) -> Mapping[str, str]:
+    """Return the shared result mapping for a (module_type, category) pair.
+
+    Types and categories read from repository config are interned when first
+    seen, so grouping and counting modules downstream compares them by
+    identity like the built-in literals.
+    """
+    result = _RESULTS.get((module_type, category))
+    if result is None:
+        result = MappingProxyType(
+            {"type": sys.intern(module_type), "category": sys.intern(category)}
+        )
+        _RESULTS[(module_type, category)] = result
+    return result
+
+
 class ModuleDetectorRegistry:
     """Registry for module detectors."""
 
     def __init__(self):
         # Default detectors for common patterns
-        self.default_detectors: list[ModuleDetector] = [
+        self.default_detectors: list[ModuleDetector] = []
+        self.config_detectors: list[ModuleDetector] = []
+        # Suffix-based default detectors, indexed as
+        # suffix -> (registration order, result) so detect_module_type()
+        # only slices the name at each known suffix length
+        self._suffix_map: dict[str, tuple[int, Mapping[str, str]]] = {}
+        self._suffix_lengths: list[int] = []
+        # LRU of module name -> suffix lookup result (None for no match);
+        # an instance dict rather than lru_cache on the method, which would
+        # pin the registry alive
+        self._suffix_cache: OrderedDict[str, Mapping[str, str] | None] = OrderedDict()
+        # Default detectors without declared suffixes, called in order
+        self._custom_detectors: list[ModuleDetector] = []
+
+        for detector in (
             BidAdapterDetector(),
             RtdModuleDetector(),
             AnalyticsAdapterDetector(),
             IdSystemDetector(),
             UserModuleDetector(),
             VideoModuleDetector(),
-        ]
-        self.config_detectors: list[ModuleDetector] = []
+        ):
+            self.register_detector(detector)
 
     def load_repository_config(self, config: dict[str, Any]) -> None:
         """
@@ -163,7 +243,7 @@ class ModuleDetectorRegistry:
             detector = ConfigBasedDetector(module_type, type_config)
             self.config_detectors.append(detector)
 
-    def detect_module_type(self, module_name: str, file_path: str) -> dict[str, Any]:
+    def detect_module_type(self, module_name: str, file_path: str) -> Mapping[str, str]:
         """
         Detect module type using registered detectors.
 
@@ -174,22 +254,97 @@ class ModuleDetectorRegistry:
             file_path: Full file path
 
         Returns:
-            Dictionary with type and category
+            Read-only mapping with type and category, shared between calls
         """
         # Check config-based detectors first (more specific)
         for detector in self.config_detectors:
             module_type, category = detector.detect(module_name, file_path)
             if module_type:
-                return {"type": module_type, "category": category}
+                return _detection_result(module_type, category)
+
+        return self._detect_default(module_name, file_path)
 
-        # Fall back to default detectors
-        for detector in self.default_detectors:
+    def detect_many(
+        self, module_names: Sequence[str], file_paths: Sequence[str]
+    ) -> list[Mapping[str, str]]:
+        """
+        Detect module types for a batch of files.
+
+        Gives the same results as calling detect_module_type() for each
+        pair, with the detector lists looked up once for the whole batch.
+
+        Args:
+            module_names: Module names
+            file_paths: File paths, parallel to ``module_names``
+
+        Returns:
+            Detection results in input order
+
+        Raises:
+            ValueError: If the two sequences differ in length
+        """
+        if len(module_names) != len(file_paths):
+            raise ValueError(
+                f"Got {len(module_names)} module names for {len(file_paths)} paths"
+            )
+
+        config_detectors = self.config_detectors
+        custom_detectors = self._custom_detectors
+        results = []
+        for module_name, file_path in zip(module_names, file_paths, strict=True):
+            result = None
+            for detector in config_detectors:
+                module_type, category = detector.detect(module_name, file_path)
+                if module_type:
+                    result = _detection_result(module_type, category)
+                    break
+            if result is None:
+                result = self._match_suffix(module_name)
+            if result is None and custom_detectors:
+                result = self._detect_custom(module_name, file_path)
+            results.append(result or _RESULTS["generic", "utility"])
+        return results
+
+    def _detect_default(self, module_name: str, file_path: str) -> Mapping[str, str]:
+        """Run the default detectors, falling back to the generic result."""
+        return (
+            self._match_suffix(module_name)
+            or self._detect_custom(module_name, file_path)
+            or _RESULTS["generic", "utility"]
+        )
+
+    def _match_suffix(self, module_name: str) -> Mapping[str, str] | None:
+        """Look up the suffix-indexed detectors for a module name.
+
+        If several suffixes match, the earliest registered detector wins.
+        Results depend only on the name, so they are cached per registry.
+        """
+        cache = self._suffix_cache
+        if module_name in cache:
+            cache.move_to_end(module_name)
+            return cache[module_name]
+
+        best = None
+        for length in self._suffix_lengths:
+            entry = self._suffix_map.get(module_name[-length:])
+            if entry and (best is None or entry[0] < best[0]):
+                best = entry
+        result = best[1] if best else None
+
+        cache[module_name] = result
+        if len(cache) > SUFFIX_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def _detect_custom(
+        self, module_name: str, file_path: str
+    ) -> Mapping[str, str] | None:
+        """Call the default detectors that have no declared suffixes."""
+        for detector in self._custom_detectors:
             module_type, category = detector.detect(module_name, file_path)
             if module_type:
-                return {"type": module_type, "category": category}
-
-        # Default to generic if no detector matches
-        return {"type": "generic", "category": "utility"}
+                return _detection_result(module_type, category)
+        return None
 
     def register_detector(
         self, detector: ModuleDetector, use_config: bool = False
@@ -203,5 +358,19 @@ class ModuleDetectorRegistry:
         """
         if use_config:
             self.config_detectors.append(detector)
-        else:
-            self.default_detectors.append(detector)
+            return
+
+        order = len(self.default_detectors)
+        self.default_detectors.append(detector)
+        suffixes = getattr(detector, "SUFFIXES", None)
+        if not suffixes:
+            self._custom_detectors.append(detector)
+            return
+
+        result = _detection_result(detector.MODULE_TYPE, detector.CATEGORY)
+        for suffix in suffixes:
+            # An empty suffix would slice to the whole name
+            if suffix:
+                self._suffix_map.setdefault(suffix, (order, result))
+        self._suffix_lengths = sorted({len(suffix) for suffix in self._suffix_map})
+        self._suffix_cache.clear()
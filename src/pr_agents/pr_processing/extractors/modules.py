@@ -1,5 +1,8 @@
 """Module extractor for PR analysis."""
 
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from typing import Any
 
 from github import PullRequest
@@ -14,6 +17,28 @@ from src.pr_agents.pr_processing.extractors.base import BaseExtractor
 
 from .module_detectors import ModuleDetectorRegistry
 
+# Any path mentioning "test" or "spec" (which also covers "tests/" and
+# "__tests__") is treated as a test file. Matched line-wise so a whole PR's
+# newline-joined path list is filtered with one findall call.
+_TEST_FILE_RE = re.compile(r"^.*(?:test|spec).*$", re.IGNORECASE | re.MULTILINE)
+
+# Directories whose direct children are treated as modules
+_MODULE_DIRS = frozenset({"modules", "src", "lib", "libraries", "adapters"})
+
+# Name suffixes that make a file outside _MODULE_DIRS count as a module; a
+# tuple lets str.endswith test them all in one call
+_MODULE_SUFFIXES = (
+    "BidAdapter",
+    "AnalyticsAdapter",
+    "RtdProvider",
+    "RtdModule",
+    "IdSystem",
+    "UserModule",
+    "VideoModule",
+    "Module",
+    "Adapter",
+)
+
 
 class ModuleExtractor(BaseExtractor):
     """Extracts module structure and relationships from repositories.
@@ -60,12 +85,47 @@ class ModuleExtractor(BaseExtractor):
         Returns:
             Dictionary containing:
             - modules: List of identified modules with categorization
+            - modules_by_type: The same modules grouped by module type
             - module_categories: Count by category
             - primary_module_type: Most common module type
             - module_dependencies: Detected dependencies between modules
         """
         log_function_entry("extract", pr_data=type(pr_data).__name__)
 
+        result = self._extract_one(pr_data)
+
+        log_function_exit("extract", result=f"{result['total_modules']} modules found")
+        return result
+
+    def extract_many(self, prs: Iterable[Any]) -> list[dict[str, Any]]:
+        """Extract module information from several PRs.
+
+        Equivalent to calling ``extract()`` on each PR, with the entry/exit
+        logging done once for the batch. The PRs are expected to come from
+        the repository set with ``set_repository_config()``.
+
+        Args:
+            prs: GitHub PR objects or dictionaries with PR data
+
+        Returns:
+            One extraction result per PR, in input order
+        """
+        log_function_entry("extract_many")
+
+        results = [self._extract_one(pr_data) for pr_data in prs]
+
+        log_function_exit("extract_many", result=f"{len(results)} PRs extracted")
+        return results
+
+    def _extract_one(self, pr_data: Any) -> dict[str, Any]:
+        """Extract module information from a single PR without entry logging.
+
+        Args:
+            pr_data: GitHub PR object or dictionary with PR data
+
+        Returns:
+            Module extraction result, or the empty result on invalid input
+        """
         if isinstance(pr_data, dict):
             # Handle dictionary input (for testing)
             files = pr_data.get("files", [])
@@ -82,24 +142,22 @@ class ModuleExtractor(BaseExtractor):
             # Extract modules from files
             modules = self._identify_modules(files)
 
-            # Categorize modules
-            categorized = self._categorize_modules(modules)
+            # Count modules per category and pick the most common one
+            category_counts, primary_type = self._summarize_categories(modules)
 
             # Analyze dependencies (simplified for now)
             dependencies = self._extract_dependencies(modules, files)
 
-            result = {
+            return {
                 "modules": modules,
-                "module_categories": self._count_by_category(categorized),
-                "primary_module_type": self._get_primary_type(categorized),
+                "modules_by_type": self._group_by_type(modules),
+                "module_categories": category_counts,
+                "primary_module_type": primary_type,
                 "module_dependencies": dependencies,
                 "total_modules": len(modules),
                 "repository": repo_name,
             }
 
-            log_function_exit("extract", result=f"{len(modules)} modules found")
-            return result
-
         except Exception as e:
             log_error_with_context(e, f"Error extracting modules from {repo_name}")
             return self._empty_result()
@@ -113,111 +171,92 @@ class ModuleExtractor(BaseExtractor):
         Returns:
             List of module dictionaries
         """
-        modules = []
-        seen_modules = set()
+        # Drop test files with one regex pass over the whole path list
+        test_files = set(_TEST_FILE_RE.findall("\n".join(files)))
 
+        # First file per module name, in PR order
+        module_paths: dict[str, str] = {}
         for file_path in files:
-            module_info = self._extract_module_from_path(file_path)
-            if module_info and module_info["name"] not in seen_modules:
-                modules.append(module_info)
-                seen_modules.add(module_info["name"])
-
-        return modules
+            if file_path in test_files:
+                continue
+            module_name = self._extract_module_name(file_path)
+            if module_name and module_name not in module_paths:
+                module_paths[module_name] = file_path
+
+        # Detect types for the whole batch in one registry call
+        names = list(module_paths)
+        paths = list(module_paths.values())
+        detections = self.detector_registry.detect_many(names, paths)
+
+        return [
+            {
+                "name": module_name,
+                "type": detection["type"],
+                "path": file_path,
+                "category": detection["category"],
+            }
+            for module_name, file_path, detection in zip(
+                names, paths, detections, strict=True
+            )
+        ]
 
-    def _extract_module_from_path(self, file_path: str) -> dict[str, Any] | None:
-        """Extract module information from a file path.
+    def _extract_module_name(self, file_path: str) -> str | None:
+        """Extract the module name from a file path.
 
         Args:
             file_path: Path to the file
 
         Returns:
-            Module information or None
+            Module name or None if the file is not a module
         """
-        # Check if it's a test file
-        if self._is_test_file(file_path):
-            return None
-
         # Extract module name from path
         parts = file_path.split("/")
-        module_name = None
-        in_module_dir = False
-
-        # Look for module in common locations
-        for i, part in enumerate(parts):
-            if part in ["modules", "src", "lib", "libraries", "adapters"]:
-                in_module_dir = True
-                if i + 1 < len(parts):
-                    filename = parts[i + 1]
-                    # Remove extension
-                    module_name = filename.rsplit(".", 1)[0]
-                    break
-
-        # Only consider standalone files if they have module-like naming patterns
-        if not module_name and not in_module_dir:
-            filename = parts[-1] if parts else ""
-            if filename and not filename.startswith("."):
-                # Check if filename suggests it's a module
-                base_name = filename.rsplit(".", 1)[0]
-                # Only consider files with module-like suffixes
-                module_suffixes = [
-                    "BidAdapter",
-                    "AnalyticsAdapter",
-                    "RtdProvider",
-                    "RtdModule",
-                    "IdSystem",
-                    "UserModule",
-                    "VideoModule",
-                    "Module",
-                    "Adapter",
-                ]
-                if any(base_name.endswith(suffix) for suffix in module_suffixes):
-                    module_name = base_name
-
-        if module_name:
-            # Use detector registry to determine module type
-            detection_result = self.detector_registry.detect_module_type(
-                module_name, file_path
-            )
 
-            return {
-                "name": module_name,
-                "type": detection_result["type"],
-                "path": file_path,
-                "category": detection_result["category"],
-            }
+        # A file directly under a module directory, at any depth, is a module
+        # named after the file; the scan stops at the first module directory
+        for i, part in enumerate(parts[:-1]):
+            if part in _MODULE_DIRS:
+                return parts[i + 1].rsplit(".", 1)[0] or None
 
-        return None
+        # Only consider standalone files if they have module-like naming
+        # patterns; a bare module directory name is not a module
+        filename = parts[-1]
+        if filename in _MODULE_DIRS or not filename or filename.startswith("."):
+            return None
+        base_name = filename.rsplit(".", 1)[0]
+        return base_name if base_name.endswith(_MODULE_SUFFIXES) else None
 
-    def _is_test_file(self, file_path: str) -> bool:
-        """Check if file is a test file.
+    def _group_by_type(
+        self, modules: list[dict[str, Any]]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Group modules by type, keeping PR order within each type.
 
         Args:
-            file_path: Path to check
+            modules: List of module dictionaries
 
         Returns:
-            True if test file
+            Mapping of module type to the modules of that type
         """
-        test_indicators = ["test", "spec", "__tests__", "tests/"]
-        return any(indicator in file_path.lower() for indicator in test_indicators)
+        by_type: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        for module in modules:
+            by_type[module["type"]].append(module)
+        return dict(by_type)
 
-    def _categorize_modules(
+    def _summarize_categories(
         self, modules: list[dict[str, Any]]
-    ) -> dict[str, list[dict[str, Any]]]:
-        """Categorize modules by type.
+    ) -> tuple[dict[str, int], str | None]:
+        """Count modules by category and find the primary category.
 
         Args:
             modules: List of module dictionaries
 
         Returns:
-            Dictionary mapping categories to module lists
+            Count by category, and the category with the most modules (the
+            first one seen on a tie) or None if there are no modules
         """
-        categorized = {}
-        for module in modules:
-            category = module["category"]
-            if category not in categorized:
-                categorized[category] = []
-            categorized[category].append(module)
-        return categorized
+        counts = Counter(module["category"] for module in modules)
+        primary = max(counts, key=counts.__getitem__) if counts else None
+        return dict(counts), primary
 
     def _determine_category(self, module_type: str) -> str:
         """Determine category from module type.
@@ -243,37 +282,6 @@ class ModuleExtractor(BaseExtractor):
         }
         return category_map.get(module_type, "other")
 
-    def _count_by_category(
-        self, categorized: dict[str, list[dict[str, Any]]]
-    ) -> dict[str, int]:
-        """Count modules by category.
-
-        Args:
-            categorized: Categorized modules
-
-        Returns:
-            Count by category
-        """
-        return {category: len(modules) for category, modules in categorized.items()}
-
-    def _get_primary_type(
-        self, categorized: dict[str, list[dict[str, Any]]]
-    ) -> str | None:
-        """Get the primary module type.
-
-        Args:
-            categorized: Categorized modules
-
-        Returns:
-            Primary type or None
-        """
-        if not categorized:
-            return None
-
-        # Find category with most modules
-        max_category = max(categorized.items(), key=lambda x: len(x[1]))
-        return max_category[0]
-
     def _extract_dependencies(
         self, modules: list[dict[str, Any]], files: list[str]
     ) -> dict[str, list[str]]:
@@ -311,6 +319,7 @@ class ModuleExtractor(BaseExtractor):
         """
         return {
             "modules": [],
+            "modules_by_type": {},
             "module_categories": {},
             "primary_module_type": None,
             "module_dependencies": {},
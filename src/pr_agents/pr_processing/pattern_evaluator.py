@@ -3,17 +3,207 @@ Pattern evaluation system for PR tagging.
 """
 
 import fnmatch
+import re
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .tagging_models import YAMLPattern
 
+# Compiled matchers kept per distinct (path, type, value) pattern; a registry
+# has a few hundred patterns, each evaluated against every file of every PR
+MATCHER_CACHE_SIZE = 4096
+
+
+def _is_under_path(filepath: str, path_prefix: str) -> bool:
+    """Check if filepath is under the given path prefix."""
+    # Normalize paths for comparison
+    filepath = filepath.strip("/")
+    path_prefix = path_prefix.strip("/")
+
+    if not path_prefix:
+        return True
+
+    # Handle exact match or subpath
+    return filepath == path_prefix or filepath.startswith(path_prefix + "/")
+
+
+def _glob_matcher(glob: str) -> Callable[[str], bool]:
+    """Compile a glob into a predicate equivalent to ``fnmatch.fnmatch``."""
+    return re.compile(fnmatch.translate(glob)).match
+
+
+def _never(filepath: str) -> bool:
+    """Matcher for patterns that cannot match any file."""
+    return False
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _compile_matcher(
+    path_components: tuple[str, ...], pattern_type: str, pattern_value: str | None
+) -> Callable[[str], bool]:
+    """Build a predicate telling whether a file path matches a pattern.
+
+    The pattern is parsed once here (path prefix, type dispatch, globs),
+    so evaluating it against each file is just the returned check. The
+    file status is not part of the match; "++" patterns match any file
+    under their path.
+    """
+    # Build the expected path prefix from pattern components
+    path_prefix = "/".join(path_components)
+    value = pattern_value
+
+    def under_prefix(check: Callable[[str], bool]) -> Callable[[str], bool]:
+        return lambda filepath: (
+            _is_under_path(filepath, path_prefix) and check(filepath)
+        )
+
+    if pattern_type == "++":
+        # Any file under this path
+        return under_prefix(lambda filepath: True)
+
+    if not value:
+        return _never
+
+    if pattern_type == "dir":
+        # Check if file is in specified directory
+        full_pattern = f"{path_prefix}/{value}"
+        return under_prefix(lambda filepath: _is_under_path(filepath, full_pattern))
+
+    if pattern_type == "file":
+        if "*" in value:
+            # Wildcard pattern on the filename
+            matches_name = _glob_matcher(value)
+            return under_prefix(
+                lambda filepath: bool(matches_name(Path(filepath).name))
+            )
+        if path_prefix:
+            # Exact file under the path
+            full_pattern = f"{path_prefix}/{value}"
+            return under_prefix(lambda filepath: filepath == full_pattern)
+        # Match just the filename
+        return lambda filepath: filepath == value or Path(filepath).name == value
+
+    if pattern_type == "files":
+        # Check file extension
+        return under_prefix(lambda filepath: filepath.endswith(value))
+
+    if pattern_type == "endsWith":
+        # Check if filename ends with pattern
+        return under_prefix(lambda filepath: Path(filepath).name.endswith(value))
+
+    if pattern_type == "includes":
+        # Case-insensitive substring match
+        needle = value.lower()
+        return under_prefix(lambda filepath: needle in filepath.lower())
+
+    if pattern_type == "path":
+        # Direct path pattern
+        matches_path = _glob_matcher(f"{path_prefix}/{value}")
+        return under_prefix(lambda filepath: bool(matches_path(filepath)))
+
+    return _never
+
+
+class _PrefixNode:
+    """Node of the path-prefix trie: patterns rooted here, and child dirs."""
+
+    __slots__ = ("indices", "children")
+
+    def __init__(self):
+        self.indices: list[int] = []
+        self.children: dict[str, _PrefixNode] = {}
+
+
+class _PatternIndex:
+    """Compiled matchers for a pattern list, with candidate lookup by file.
+
+    Patterns are placed in a trie keyed by their path prefix components, so
+    one walk down a file's path finds every pattern the file is under.
+    ``endsWith`` patterns among those are further narrowed by filename
+    suffix and ``includes`` patterns by lowercased needle; only the
+    remaining candidates run their matchers.
+    """
+
+    def __init__(self, patterns: list[YAMLPattern]):
+        self.patterns = patterns
+        self.size = len(patterns)
+        self.matchers = [
+            _compile_matcher(
+                tuple(pattern.path_components),
+                pattern.pattern_type,
+                pattern.pattern_value,
+            )
+            for pattern in patterns
+        ]
+
+        self._root = _PrefixNode()
+        self._filtered: set[int] = set()
+        self._suffixes: dict[str, list[int]] = {}
+        self._needles: dict[str, list[int]] = {}
+        for i, (pattern, matcher) in enumerate(
+            zip(patterns, self.matchers, strict=True)
+        ):
+            if matcher is _never:
+                continue
+
+            # Same normalization as _is_under_path: a file is under the prefix
+            # when its "/"-separated parts start with the prefix's parts
+            node = self._root
+            prefix = "/".join(pattern.path_components).strip("/")
+            for part in prefix.split("/") if prefix else ():
+                node = node.children.setdefault(part, _PrefixNode())
+            node.indices.append(i)
+
+            if pattern.pattern_type == "endsWith":
+                self._suffixes.setdefault(pattern.pattern_value, []).append(i)
+                self._filtered.add(i)
+            elif pattern.pattern_type == "includes":
+                self._needles.setdefault(pattern.pattern_value.lower(), []).append(i)
+                self._filtered.add(i)
+        self._suffix_lengths = sorted({len(suffix) for suffix in self._suffixes})
+
+    def candidates(self, filepath: str) -> list[int]:
+        """Return the indices of the patterns that may match, in list order."""
+        node = self._root
+        found = list(node.indices)
+        for part in filepath.strip("/").split("/"):
+            node = node.children.get(part)
+            if node is None:
+                break
+            found.extend(node.indices)
+
+        if self._filtered and not self._filtered.isdisjoint(found):
+            hits = self._value_hits(filepath)
+            found = [i for i in found if i not in self._filtered or i in hits]
+        found.sort()
+        return found
+
+    def _value_hits(self, filepath: str) -> set[int]:
+        """Return the endsWith and includes patterns whose value fits the file."""
+        hits: set[int] = set()
+        if self._suffixes:
+            filename = Path(filepath).name
+            for length in self._suffix_lengths:
+                if length > len(filename):
+                    break
+                hits.update(self._suffixes.get(filename[-length:], ()))
+        if self._needles:
+            lowered = filepath.lower()
+            for needle, indices in self._needles.items():
+                if needle in lowered:
+                    hits.update(indices)
+        return hits
+
 
 class PatternEvaluator:
     """Evaluates file paths against YAML patterns."""
 
     def __init__(self):
-        self.pattern_cache = {}
+        # Index of the last pattern list evaluated; callers pass the same list
+        # for every file of a PR (and every PR of a repository)
+        self._index: _PatternIndex | None = None
 
     def evaluate_file(
         self, filepath: str, patterns: list[YAMLPattern], file_status: str = "modified"
@@ -29,126 +219,53 @@ class PatternEvaluator:
         Returns:
             List of tuples (pattern, match_info)
         """
+        index = self._get_index(patterns)
         matches = []
 
-        for pattern in patterns:
-            match_info = self._match_pattern(filepath, pattern, file_status)
-            if match_info["matches"]:
-                matches.append((pattern, match_info))
+        for i in index.candidates(filepath):
+            if index.matchers[i](filepath):
+                pattern = patterns[i]
+                matches.append((pattern, self._match_info(pattern, file_status)))
 
         return matches
 
+    def _get_index(self, patterns: list[YAMLPattern]) -> _PatternIndex:
+        """Return the index for a pattern list, rebuilding it for a new list."""
+        index = self._index
+        if (
+            index is None
+            or index.patterns is not patterns
+            or index.size != len(patterns)
+        ):
+            index = self._index = _PatternIndex(patterns)
+        return index
+
     def _match_pattern(
         self, filepath: str, pattern: YAMLPattern, file_status: str
     ) -> dict[str, Any]:
         """Check if a file matches a specific pattern."""
-        # Build the expected path prefix from pattern components
-        path_prefix = "/".join(pattern.path_components)
-
-        # Check if file is under the expected path
-        if not self._is_under_path(filepath, path_prefix):
+        matcher = _compile_matcher(
+            tuple(pattern.path_components), pattern.pattern_type, pattern.pattern_value
+        )
+        if not matcher(filepath):
             return {"matches": False}
 
-        match_info = {
-            "matches": False,
-            "is_new_addition": False,
+        return self._match_info(pattern, file_status)
+
+    def _match_info(self, pattern: YAMLPattern, file_status: str) -> dict[str, Any]:
+        """Build the match info for a file that matched a pattern."""
+        return {
+            "matches": True,
+            # "++" matches any file under its path, but only added files
+            # count as new additions
+            "is_new_addition": pattern.pattern_type == "++" and file_status == "added",
             "match_type": pattern.pattern_type,
             "hierarchical_tag": pattern.get_hierarchical_tag(),
         }
 
-        # Handle different pattern types
-        if pattern.pattern_type == "++":
-            # Any new file under this path
-            if file_status == "added":
-                match_info["matches"] = True
-                match_info["is_new_addition"] = True
-            else:
-                # For modified/removed files, still match but not as new addition
-                match_info["matches"] = True
-
-        elif pattern.pattern_type == "dir":
-            # Check if file is in specified directory
-            if pattern.pattern_value:
-                full_pattern = f"{path_prefix}/{pattern.pattern_value}"
-                if self._is_under_path(filepath, full_pattern):
-                    match_info["matches"] = True
-
-        elif pattern.pattern_type == "file":
-            # Check for specific file or wildcard pattern
-            if pattern.pattern_value:
-                if "*" in pattern.pattern_value:
-                    # Wildcard pattern
-                    if path_prefix:
-                        # Check if file is under path and matches pattern
-                        if self._is_under_path(filepath, path_prefix):
-                            filename = Path(filepath).name
-                            if fnmatch.fnmatch(filename, pattern.pattern_value):
-                                match_info["matches"] = True
-                    else:
-                        # No path restriction, just match filename
-                        filename = Path(filepath).name
-                        if fnmatch.fnmatch(filename, pattern.pattern_value):
-                            match_info["matches"] = True
-                else:
-                    # Exact file match
-                    if path_prefix:
-                        full_pattern = f"{path_prefix}/{pattern.pattern_value}"
-                        if filepath == full_pattern:
-                            match_info["matches"] = True
-                    else:
-                        # Match just the filename
-                        if (
-                            filepath == pattern.pattern_value
-                            or Path(filepath).name == pattern.pattern_value
-                        ):
-                            match_info["matches"] = True
-
-        elif pattern.pattern_type == "files":
-            # Check file extension
-            if pattern.pattern_value and filepath.endswith(pattern.pattern_value):
-                match_info["matches"] = True
-
-        elif pattern.pattern_type == "endsWith":
-            # Check if filename ends with pattern
-            filename = Path(filepath).name
-            if pattern.pattern_value and filename.endswith(pattern.pattern_value):
-                match_info["matches"] = True
-
-        elif pattern.pattern_type == "includes":
-            # Case-insensitive substring match
-            if (
-                pattern.pattern_value
-                and pattern.pattern_value.lower() in filepath.lower()
-            ):
-                match_info["matches"] = True
-
-        elif pattern.pattern_type == "path":
-            # Direct path pattern
-            if pattern.pattern_value:
-                full_pattern = f"{path_prefix}/{pattern.pattern_value}"
-                if fnmatch.fnmatch(filepath, full_pattern):
-                    match_info["matches"] = True
-
-        return match_info
-
     def _is_under_path(self, filepath: str, path_prefix: str) -> bool:
         """Check if filepath is under the given path prefix."""
-        # Normalize paths for comparison
-        filepath = filepath.strip("/")
-        path_prefix = path_prefix.strip("/")
-
-        if not path_prefix:
-            return True
-
-        # Handle exact match or subpath
-        if filepath == path_prefix or filepath.startswith(path_prefix + "/"):
-            return True
-
-        # For single-component paths like "modules", check if file starts with it
-        if "/" not in path_prefix and filepath.startswith(path_prefix + "/"):
-            return True
-
-        return False
+        return _is_under_path(filepath, path_prefix)
 
     def extract_module_info(
         self, filepath: str, pattern: YAMLPattern
@@ -1,6 +1,10 @@
 """PR Metadata-Code Accuracy Validator processor."""
 
+import copy
+import hashlib
+import json
 import re
+from collections import OrderedDict
 from dataclasses import asdict
 from typing import Any
 
@@ -15,14 +19,73 @@ from src.pr_agents.pr_processing.analysis_models import (
 from src.pr_agents.pr_processing.models import ProcessingResult
 from src.pr_agents.pr_processing.processors.base import BaseProcessor
 
+# Fixed vocabularies used on every validation, built once at import time
+# instead of being rebuilt as lists inside each scoring call.
+ACTION_VERBS = ("add", "fix", "update", "remove", "refactor", "implement")
+TECHNICAL_TERMS = (
+    "api",
+    "endpoint",
+    "adapter",
+    "module",
+    "component",
+    "function",
+    "method",
+    "class",
+    "interface",
+    "implementation",
+    "algorithm",
+    "optimization",
+    "refactor",
+    "deprecate",
+    "migrate",
+)
+VAGUE_TERMS = ("fix", "update", "change", "modify", "improve", "enhance")
+CONCRETE_TERMS = ("implement", "remove", "add", "replace", "migrate", "deprecate")
+MATCH_SUFFIXES = (
+    "bidadapter",
+    "adapter",
+    "module",
+    "component",
+    ".js",
+    ".py",
+    ".java",
+)
+CHANGE_STATUSES = frozenset({"added", "removed", "modified", "renamed"})
+
+# camelCase splitting used by fuzzy matching: exampleBidAdapter -> example bid adapter
+_UPPER_RUN_RE = re.compile("([A-Z]+)")
+_CAPITALIZED_WORD_RE = re.compile("([A-Z][a-z]+)")
+
 
 class AccuracyValidator(BaseProcessor):
     """Validates that PR metadata accurately reflects code changes.
 
     This processor works with pre-processed results from metadata and code
     processors to calculate accuracy scores without making any API calls.
+
+    Results are memoized per instance, keyed by a hash of the canonicalized
+    input, so re-validating unchanged PR content (retries, duplicate
+    webhooks) skips the fuzzy matching entirely.
     """
 
+    # Component score field, threshold below which it triggers advice, and the
+    # builder producing that advice. Evaluated in order in a single pass.
+    _RECOMMENDATION_RULES = (
+        ("title_accuracy", 70, "_title_recommendations"),
+        ("description_accuracy", 70, "_description_recommendations"),
+        ("completeness", 70, "_completeness_recommendations"),
+        ("specificity", 50, "_specificity_recommendations"),
+    )
+
+    def __init__(self, cache_size: int = 256):
+        """Initialize the validator.
+
+        Args:
+            cache_size: Maximum number of memoized results to keep
+        """
+        self.cache_size = cache_size
+        self._result_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
     @property
     def component_name(self) -> str:
         """Name of the component this processor handles."""
@@ -56,17 +119,37 @@ class AccuracyValidator(BaseProcessor):
                     errors=["Missing metadata or code results"],
                 )
 
+            cache_key = self._get_cache_key(
+                metadata_results, code_results, modules_results
+            )
+            cached = (
+                self._result_cache.get(cache_key) if cache_key is not None else None
+            )
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                log_function_exit("process", result="cache hit")
+                return ProcessingResult(
+                    component=self.component_name,
+                    success=True,
+                    data=copy.deepcopy(cached),
+                )
+
             # Calculate accuracy score
             accuracy_score = self._calculate_accuracy(
                 metadata_results, code_results, modules_results
             )
+            data = asdict(accuracy_score)
+            if cache_key is not None:
+                self._store_result(cache_key, data)
 
             log_function_exit(
                 "process", result=f"accuracy={accuracy_score.total_score:.1f}"
             )
 
             return ProcessingResult(
-                component=self.component_name, success=True, data=asdict(accuracy_score)
+                component=self.component_name,
+                success=True,
+                data=copy.deepcopy(data),
             )
 
         except Exception as e:
@@ -75,6 +158,45 @@ class AccuracyValidator(BaseProcessor):
                 component=self.component_name, success=False, errors=[str(e)]
             )
 
+    def _get_cache_key(
+        self, metadata: dict[str, Any], code: dict[str, Any], modules: dict[str, Any]
+    ) -> str | None:
+        """Build a stable content hash for the validation inputs.
+
+        Args:
+            metadata: Metadata processor results
+            code: Code processor results
+            modules: Module extractor results
+
+        Returns:
+            Hex digest identifying the input payload, or None when the payload
+            cannot be canonicalized (e.g. dicts mixing int and str keys)
+        """
+        try:
+            payload = json.dumps(
+                [metadata, code, modules],
+                sort_keys=True,
+                separators=(",", ":"),
+                default=str,
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _store_result(self, key: str, data: dict[str, Any]) -> None:
+        """Memoize a result, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key from _get_cache_key
+            data: Serialized accuracy score
+        """
+        if self.cache_size <= 0:
+            return
+        self._result_cache[key] = data
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.cache_size:
+            self._result_cache.popitem(last=False)
+
     def _calculate_accuracy(
         self, metadata: dict[str, Any], code: dict[str, Any], modules: dict[str, Any]
     ) -> AccuracyScore:
@@ -186,8 +308,7 @@ class AccuracyValidator(BaseProcessor):
                 score += min(20, (mentioned_modules / len(module_list)) * 20)
 
         # Check for action verb accuracy (20 points)
-        action_verbs = ["add", "fix", "update", "remove", "refactor", "implement"]
-        has_action = any(verb in title for verb in action_verbs)
+        has_action = any(verb in title for verb in ACTION_VERBS)
         if has_action:
             score += 20
 
@@ -279,30 +400,27 @@ class AccuracyValidator(BaseProcessor):
         """
         score = 100.0  # Start at 100 and deduct for missing info
 
-        # Check for unmentioned significant files
-        file_analysis = code.get("file_analysis", {})
-        significant_files = [
-            f
-            for f in file_analysis.get("files_changed", [])
-            if f.get("changes", 0) > 100  # Significant = >100 line changes
-        ]
-
         title = metadata.get("title_analysis", {}).get("title", "").lower()
         description = (
             metadata.get("description_analysis", {}).get("description", "").lower()
         )
         combined_text = title + " " + description
 
-        unmentioned_significant = sum(
-            1
-            for f in significant_files
+        # Check for unmentioned significant files in a single pass; only
+        # significant files (>100 line changes) pay for fuzzy matching.
+        significant_count = 0
+        unmentioned_significant = 0
+        for f in code.get("file_analysis", {}).get("files_changed", []):
+            if f.get("changes", 0) <= 100:
+                continue
+            significant_count += 1
             if not self._fuzzy_match_in_text(
                 self._extract_filename(f["filename"]), combined_text
-            )
-        )
+            ):
+                unmentioned_significant += 1
 
-        if significant_files:
-            score -= (unmentioned_significant / len(significant_files)) * 30
+        if significant_count:
+            score -= (unmentioned_significant / significant_count) * 30
 
         # Check for unmentioned modules (20 points)
         if modules:
@@ -342,47 +460,19 @@ class AccuracyValidator(BaseProcessor):
         description = description_analysis.get("description", "").lower()
 
         # Technical terms in title (40 points)
-        technical_terms = [
-            "api",
-            "endpoint",
-            "adapter",
-            "module",
-            "component",
-            "function",
-            "method",
-            "class",
-            "interface",
-            "implementation",
-            "algorithm",
-            "optimization",
-            "refactor",
-            "deprecate",
-            "migrate",
-        ]
-
-        title_technical_count = sum(1 for term in technical_terms if term in title)
+        title_technical_count = sum(1 for term in TECHNICAL_TERMS if term in title)
         score += min(40, title_technical_count * 10)
 
         # Technical terms in description (40 points)
         if description:
             desc_technical_count = sum(
-                1 for term in technical_terms if term in description
+                1 for term in TECHNICAL_TERMS if term in description
             )
             score += min(40, desc_technical_count * 5)
 
         # Concrete vs vague language (20 points)
-        vague_terms = ["fix", "update", "change", "modify", "improve", "enhance"]
-        concrete_terms = [
-            "implement",
-            "remove",
-            "add",
-            "replace",
-            "migrate",
-            "deprecate",
-        ]
-
-        vague_count = sum(1 for term in vague_terms if term in title)
-        concrete_count = sum(1 for term in concrete_terms if term in title)
+        vague_count = sum(1 for term in VAGUE_TERMS if term in title)
+        concrete_count = sum(1 for term in CONCRETE_TERMS if term in title)
 
         if concrete_count > vague_count:
             score += 20
@@ -409,66 +499,78 @@ class AccuracyValidator(BaseProcessor):
         """
         recommendations = []
 
-        # Title recommendations
-        if components.title_accuracy < 70:
-            files_changed = code.get("file_analysis", {}).get("files_changed", [])
-            if files_changed:
-                key_file = max(files_changed, key=lambda f: f.get("changes", 0))
-                recommendations.append(
-                    AccuracyRecommendation(
-                        component="title",
-                        issue="Title doesn't mention key files or modules changed",
-                        suggestion=f"Consider mentioning '{self._extract_filename(key_file['filename'])}' in the title",
-                        priority="high",
-                    )
-                )
+        for field_name, threshold, builder in self._RECOMMENDATION_RULES:
+            if getattr(components, field_name) < threshold:
+                recommendations.extend(getattr(self, builder)(metadata, code))
 
-        # Description recommendations
-        if components.description_accuracy < 70:
-            if not metadata.get("description_analysis", {}).get(
-                "has_description", False
-            ):
-                recommendations.append(
-                    AccuracyRecommendation(
-                        component="description",
-                        issue="No description provided",
-                        suggestion="Add a description explaining what changed and why",
-                        priority="high",
-                    )
-                )
-            else:
-                recommendations.append(
-                    AccuracyRecommendation(
-                        component="description",
-                        issue="Description doesn't cover all significant changes",
-                        suggestion="List all modified files and explain the changes made",
-                        priority="medium",
-                    )
-                )
+        return recommendations
+
+    def _title_recommendations(
+        self, metadata: dict[str, Any], code: dict[str, Any]
+    ) -> list[AccuracyRecommendation]:
+        """Recommend naming the most-changed file in the title."""
+        files_changed = code.get("file_analysis", {}).get("files_changed", [])
+        if not files_changed:
+            return []
+
+        key_file = max(files_changed, key=lambda f: f.get("changes", 0))
+        return [
+            AccuracyRecommendation(
+                component="title",
+                issue="Title doesn't mention key files or modules changed",
+                suggestion=f"Consider mentioning '{self._extract_filename(key_file['filename'])}' in the title",
+                priority="high",
+            )
+        ]
 
-        # Completeness recommendations
-        if components.completeness < 70:
-            recommendations.append(
+    def _description_recommendations(
+        self, metadata: dict[str, Any], code: dict[str, Any]
+    ) -> list[AccuracyRecommendation]:
+        """Recommend adding or expanding the description."""
+        if not metadata.get("description_analysis", {}).get("has_description", False):
+            return [
                 AccuracyRecommendation(
-                    component="completeness",
-                    issue="Significant changes not mentioned in metadata",
-                    suggestion="Review all changed files and ensure major changes are documented",
+                    component="description",
+                    issue="No description provided",
+                    suggestion="Add a description explaining what changed and why",
                     priority="high",
                 )
+            ]
+
+        return [
+            AccuracyRecommendation(
+                component="description",
+                issue="Description doesn't cover all significant changes",
+                suggestion="List all modified files and explain the changes made",
+                priority="medium",
             )
+        ]
 
-        # Specificity recommendations
-        if components.specificity < 50:
-            recommendations.append(
-                AccuracyRecommendation(
-                    component="specificity",
-                    issue="Metadata uses vague language",
-                    suggestion="Use specific technical terms and concrete action verbs",
-                    priority="medium",
-                )
+    def _completeness_recommendations(
+        self, metadata: dict[str, Any], code: dict[str, Any]
+    ) -> list[AccuracyRecommendation]:
+        """Recommend documenting significant unmentioned changes."""
+        return [
+            AccuracyRecommendation(
+                component="completeness",
+                issue="Significant changes not mentioned in metadata",
+                suggestion="Review all changed files and ensure major changes are documented",
+                priority="high",
             )
+        ]
 
-        return recommendations
+    def _specificity_recommendations(
+        self, metadata: dict[str, Any], code: dict[str, Any]
+    ) -> list[AccuracyRecommendation]:
+        """Recommend more concrete technical language."""
+        return [
+            AccuracyRecommendation(
+                component="specificity",
+                issue="Metadata uses vague language",
+                suggestion="Use specific technical terms and concrete action verbs",
+                priority="medium",
+            )
+        ]
 
     def _get_accuracy_level(self, score: float) -> str:
         """Get accuracy level from score.
@@ -506,15 +608,7 @@ class AccuracyValidator(BaseProcessor):
             return True
 
         # Try without common suffixes
-        for suffix in [
-            "bidadapter",
-            "adapter",
-            "module",
-            "component",
-            ".js",
-            ".py",
-            ".java",
-        ]:
+        for suffix in MATCH_SUFFIXES:
             if needle.endswith(suffix):
                 base = needle[: -len(suffix)]
                 if base in haystack:
@@ -523,8 +617,8 @@ class AccuracyValidator(BaseProcessor):
         # Check if the base name (without camelCase) is present
         # Convert camelCase to words: exampleBidAdapter -> example bid adapter
 
-        words = re.sub(
-            "([A-Z][a-z]+)", r" \1", re.sub("([A-Z]+)", r" \1", needle)
+        words = _CAPITALIZED_WORD_RE.sub(
+            r" \1", _UPPER_RUN_RE.sub(r" \1", needle)
         ).split()
         base_word = words[0].lower() if words else needle
         if len(base_word) > 3 and base_word in haystack:
@@ -568,14 +662,9 @@ class AccuracyValidator(BaseProcessor):
         change_types = set()
 
         for file_info in file_analysis.get("files_changed", []):
-            if file_info.get("status") == "added":
-                change_types.add("added")
-            elif file_info.get("status") == "removed":
-                change_types.add("removed")
-            elif file_info.get("status") == "modified":
-                change_types.add("modified")
-            elif file_info.get("status") == "renamed":
-                change_types.add("renamed")
+            status = file_info.get("status")
+            if status in CHANGE_STATUSES:
+                change_types.add(status)
 
         return change_types
 
@@ -2,11 +2,89 @@
 Module processor for analyzing extracted module data across different repository types.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from ..models import ProcessingResult
 from .base import BaseProcessor
 
+# Ordered (predicate, repo type) rules over the lowercased repo name, full name
+# and language; the first matching rule wins.
+_REPO_RULES: tuple[tuple[Callable[[str, str, str], bool], str], ...] = (
+    (lambda name, full, lang: "prebid.js" in name or "/prebid.js" in full, "prebid-js"),
+    (
+        lambda name, full, lang: "prebid-server" in name or "/prebid-server" in full,
+        "prebid-server",
+    ),
+    (
+        lambda name, full, lang: (
+            "prebid-mobile" in name or ("mobile" in name and "prebid" in full)
+        ),
+        "prebid-mobile",
+    ),
+    (lambda name, full, lang: "android" in name or "ios" in name, "prebid-mobile"),
+    # Language hint for server repos that don't follow the naming scheme
+    (
+        lambda name, full, lang: lang in ("java", "go") and "prebid" in full,
+        "prebid-server",
+    ),
+)
+
+
+@lru_cache(maxsize=256)
+def _detect_repo_type(name: str, full_name: str, language: str) -> str:
+    """Return the repository type for the lowercased repo identifiers.
+
+    Cached because batch processing asks about the same repository for
+    every PR.
+    """
+    for matches, repo_type in _REPO_RULES:
+        if matches(name, full_name, language):
+            return repo_type
+    return "generic"
+
+
+# Zeroed adapter change counters, copied for each analysis
+_ADAPTER_COUNTS_TEMPLATE = MappingProxyType(
+    {
+        "bid_adapters": 0,
+        "rtd_providers": 0,
+        "analytics_adapters": 0,
+        "user_modules": 0,
+        "other": 0,
+    }
+)
+
+# Counter each JS module type is tallied under; other types count as "other"
+_ADAPTER_BUCKETS = MappingProxyType(
+    {
+        "bid_adapter": "bid_adapters",
+        "rtd_provider": "rtd_providers",
+        "rtd_module": "rtd_providers",
+        "analytics_adapter": "analytics_adapters",
+        "user_module": "user_modules",
+    }
+)
+
+# Core Prebid.js modules worth calling out, with lowercased names for matching
+_CORE_JS_MODULES: tuple[tuple[str, str, str], ...] = tuple(
+    (name, name.lower(), description)
+    for name, description in {
+        "prebidCore": "Core auction logic",
+        "adapterManager": "Adapter management system",
+        "auctionManager": "Auction orchestration",
+        "userSync": "User synchronization",
+        "config": "Configuration management",
+        "gdprEnforcement": "GDPR compliance",
+        "consentManagement": "Consent handling",
+        "currency": "Currency conversion",
+        "sizeMapping": "Responsive ad sizing",
+        "priceFloors": "Price floor management",
+    }.items()
+)
+
 
 class ModuleProcessor(BaseProcessor):
     """
@@ -87,27 +165,11 @@ class ModuleProcessor(BaseProcessor):
 
     def _determine_repo_type(self, repository: dict[str, Any]) -> str:
         """Determine repository type from repository data."""
-        repo_name = repository.get("name", "").lower()
-        full_name = repository.get("full_name", "").lower()
-
-        # Check for specific repository patterns
-        if "prebid.js" in repo_name or "/prebid.js" in full_name:
-            return "prebid-js"
-        elif "prebid-server" in repo_name or "/prebid-server" in full_name:
-            return "prebid-server"
-        elif "prebid-mobile" in repo_name or (
-            "mobile" in repo_name and "prebid" in full_name
-        ):
-            return "prebid-mobile"
-        elif "android" in repo_name or "ios" in repo_name:
-            return "prebid-mobile"
-
-        # Check language hints
-        language = repository.get("language", "").lower()
-        if language in ["java", "go"] and "prebid" in full_name:
-            return "prebid-server"
-
-        return "generic"
+        return _detect_repo_type(
+            repository.get("name", "").lower(),
+            repository.get("full_name", "").lower(),
+            repository.get("language", "").lower(),
+        )
 
     def _analyze_js_modules(
         self,
@@ -233,45 +295,18 @@ class ModuleProcessor(BaseProcessor):
 
     def _analyze_adapter_changes(self, modules: list[dict[str, Any]]) -> dict[str, int]:
         """Analyze adapter-specific changes for JS repos."""
-        adapter_counts = {
-            "bid_adapters": 0,
-            "rtd_providers": 0,
-            "analytics_adapters": 0,
-            "user_modules": 0,
-            "other": 0,
-        }
+        adapter_counts = dict(_ADAPTER_COUNTS_TEMPLATE)
 
         for module in modules:
             if isinstance(module, dict):
-                module_type = module.get("type", "")
-                if module_type == "bid_adapter":
-                    adapter_counts["bid_adapters"] += 1
-                elif module_type in ["rtd_provider", "rtd_module"]:
-                    adapter_counts["rtd_providers"] += 1
-                elif module_type == "analytics_adapter":
-                    adapter_counts["analytics_adapters"] += 1
-                elif module_type == "user_module":
-                    adapter_counts["user_modules"] += 1
-                else:
-                    adapter_counts["other"] += 1
+                bucket = _ADAPTER_BUCKETS.get(module.get("type", ""), "other")
+                adapter_counts[bucket] += 1
 
         return {k: v for k, v in adapter_counts.items() if v > 0}
 
     def _check_important_js_modules(self, modules: list[dict[str, Any]]) -> list[str]:
         """Check for important/core JavaScript modules."""
         important = []
-        core_modules = {
-            "prebidCore": "Core auction logic",
-            "adapterManager": "Adapter management system",
-            "auctionManager": "Auction orchestration",
-            "userSync": "User synchronization",
-            "config": "Configuration management",
-            "gdprEnforcement": "GDPR compliance",
-            "consentManagement": "Consent handling",
-            "currency": "Currency conversion",
-            "sizeMapping": "Responsive ad sizing",
-            "priceFloors": "Price floor management",
-        }
 
         for module in modules:
             module_name = ""
@@ -281,13 +316,12 @@ class ModuleProcessor(BaseProcessor):
             else:
                 module_name = str(module)
                 file_path = ""
+            module_name = module_name.lower()
+            file_path = file_path.lower()
 
             # Check module name and file path
-            for core_name, description in core_modules.items():
-                if (
-                    core_name.lower() in module_name.lower()
-                    or core_name.lower() in file_path.lower()
-                ):
+            for core_name, core_key, description in _CORE_JS_MODULES:
+                if core_key in module_name or core_key in file_path:
                     important.append(f"{core_name} - {description}")
                     break
 
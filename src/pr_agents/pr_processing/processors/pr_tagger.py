@@ -2,6 +2,7 @@
 PR Tagging Processor - Tags PRs based on YAML registry and repository structure.
 """
 
+from collections import Counter
 from dataclasses import asdict
 from typing import Any
 
@@ -13,6 +14,8 @@ from ..tagging_models import (
     FileTag,
     ImpactLevel,
     TaggingResult,
+    YAMLPattern,
+    YAMLRegistryStructure,
 )
 from .base import BaseProcessor
 
@@ -27,10 +30,19 @@ class PRTaggerProcessor(BaseProcessor):
         self,
         registry_path: str = "registry/prebid/",
         config_file: str = "config/repository_structures.json",
+        registry: YAMLRegistryStructure | None = None,
     ):
-        self.registry_loader = RegistryLoader(registry_path)
+        # A prebuilt registry skips parsing the YAML files in registry_path
+        self.registry_loader = RegistryLoader(
+            registry_path, registries=[registry] if registry is not None else None
+        )
         self.pattern_evaluator = PatternEvaluator()
         self.repo_manager = RepositoryStructureManager(config_file)
+        # Patterns parsed from the last registry used; PRs of one repository
+        # share the list, so the evaluator keeps its index across PRs
+        self._registry_patterns: (
+            tuple[YAMLRegistryStructure, list[YAMLPattern]] | None
+        ) = None
 
     @property
     def component_name(self) -> str:
@@ -65,10 +77,13 @@ class PRTaggerProcessor(BaseProcessor):
             # Get repository structure configuration
             repo_structure = self.repo_manager.get_repository(repo_url)
 
+            # Registry patterns are parsed once, not per file
+            patterns = self._get_patterns(registry) if registry else []
+
             # Process each file
             for file_info in files:
                 self._process_file(
-                    file_info, result, registry, repo_structure, repo_url
+                    file_info, result, registry, repo_structure, repo_url, patterns
                 )
 
             # Generate PR-level tags and summary
@@ -95,6 +110,7 @@ class PRTaggerProcessor(BaseProcessor):
         registry: Any,
         repo_structure: Any,
         repo_url: str,
+        patterns: list[YAMLPattern],
     ):
         """Process a single file and add tags."""
         filepath = file_info.get("filename", "")
@@ -120,15 +136,12 @@ class PRTaggerProcessor(BaseProcessor):
             # Add module information to result
             if file_tag.module_name and file_tag.module_categories:
                 for category in file_tag.module_categories:
-                    if category not in result.affected_modules:
-                        result.affected_modules[category] = []
-                    if file_tag.module_name not in result.affected_modules[category]:
-                        result.affected_modules[category].append(file_tag.module_name)
+                    modules = result.affected_modules.setdefault(category, [])
+                    if file_tag.module_name not in modules:
+                        modules.append(file_tag.module_name)
 
         # Apply YAML registry patterns (hierarchical tagging)
         if registry:
-            patterns = self.registry_loader.parse_structure_patterns(registry.structure)
-
             matches = self.pattern_evaluator.evaluate_file(filepath, patterns, status)
 
             for pattern, match_info in matches:
@@ -160,6 +173,14 @@ class PRTaggerProcessor(BaseProcessor):
         # Add file tag to result
         result.file_tags[filepath] = file_tag
 
+    def _get_patterns(self, registry: YAMLRegistryStructure) -> list[YAMLPattern]:
+        """Return the parsed structure patterns of a registry."""
+        cached = self._registry_patterns
+        if cached is None or cached[0] is not registry:
+            patterns = self.registry_loader.parse_structure_patterns(registry.structure)
+            cached = self._registry_patterns = (registry, patterns)
+        return cached[1]
+
     def _apply_rules(
         self, file_tag: FileTag, rules: list[dict[str, Any]], result: TaggingResult
     ):
@@ -173,11 +194,13 @@ class PRTaggerProcessor(BaseProcessor):
         # Collect all unique tags
         all_tags = set()
         all_hierarchical_tags = []
+        all_categories = set()
         impact_levels = []
 
         for file_tag in result.file_tags.values():
             all_tags.update(file_tag.flat_tags)
             all_hierarchical_tags.extend(file_tag.hierarchical_tags)
+            all_categories.update(file_tag.module_categories)
             impact_levels.append(file_tag.impact_level.value)
 
         result.pr_tags = all_tags
@@ -195,52 +218,48 @@ class PRTaggerProcessor(BaseProcessor):
             max_impact = max(impact_levels, key=lambda x: impact_priority.get(x, 0))
             result.pr_impact_level = ImpactLevel(max_impact)
 
-        # Collect unique module categories
-        all_categories = set()
-        for file_tag in result.file_tags.values():
-            all_categories.update(file_tag.module_categories)
+        # Unique module categories
         result.module_categories = list(all_categories)
 
     def _calculate_statistics(self, result: TaggingResult):
         """Calculate summary statistics."""
-        result.stats = {
-            "total_files": len(result.file_tags),
-            "files_by_impact": {},
-            "files_by_primary_tag": {},
-            "new_files_count": 0,
-            "core_files_count": 0,
-            "test_files_count": 0,
-            "doc_files_count": 0,
-            "module_count": sum(
-                len(modules) for modules in result.affected_modules.values()
-            ),
-        }
-
-        # Count files by impact level
-        for level in ImpactLevel:
-            result.stats["files_by_impact"][level.value] = 0
+        impact_counts = Counter()
+        primary_counts = Counter()
+        new_files = core_files = test_files = doc_files = 0
 
-        # Count files by primary tag
+        # One pass over the files for every count
         for file_tag in result.file_tags.values():
-            # Impact level
-            result.stats["files_by_impact"][file_tag.impact_level.value] += 1
+            impact_counts[file_tag.impact_level.value] += 1
 
             # File types
             if file_tag.is_new_file:
-                result.stats["new_files_count"] += 1
+                new_files += 1
             if file_tag.is_core:
-                result.stats["core_files_count"] += 1
+                core_files += 1
             if file_tag.is_test:
-                result.stats["test_files_count"] += 1
+                test_files += 1
             if file_tag.is_doc:
-                result.stats["doc_files_count"] += 1
+                doc_files += 1
 
-            # Primary tags
+            # Primary tags, in first-seen order
             for htag in file_tag.hierarchical_tags:
-                primary = htag.primary
-                if primary not in result.stats["files_by_primary_tag"]:
-                    result.stats["files_by_primary_tag"][primary] = 0
-                result.stats["files_by_primary_tag"][primary] += 1
+                primary_counts[htag.primary] += 1
+
+        result.stats = {
+            "total_files": len(result.file_tags),
+            # Every impact level is listed, including those with no files
+            "files_by_impact": {
+                level.value: impact_counts[level.value] for level in ImpactLevel
+            },
+            "files_by_primary_tag": dict(primary_counts),
+            "new_files_count": new_files,
+            "core_files_count": core_files,
+            "test_files_count": test_files,
+            "doc_files_count": doc_files,
+            "module_count": sum(
+                len(modules) for modules in result.affected_modules.values()
+            ),
+        }
 
     def _detect_version(
         self, component_data: dict[str, Any], repo_info: dict[str, Any]
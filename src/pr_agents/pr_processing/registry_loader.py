@@ -5,18 +5,34 @@ YAML registry loader for PR tagging.
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from ..config.io_utils import read_yaml_file
 from .tagging_models import YAMLPattern, YAMLRegistryStructure
 
 
 class RegistryLoader:
     """Loads and manages YAML registry configurations."""
 
-    def __init__(self, registry_path: str = "registry/prebid/"):
+    def __init__(
+        self,
+        registry_path: str = "registry/prebid/",
+        registries: list[YAMLRegistryStructure] | None = None,
+    ):
+        """
+        Initialize the registry loader.
+
+        Args:
+            registry_path: Directory of YAML registry files
+            registries: Already-built registries; when given, these are used
+                instead of parsing the YAML files under registry_path
+        """
         self.registry_path = Path(registry_path)
         self.registry_cache: dict[str, YAMLRegistryStructure] = {}
-        self._load_all_registries()
+        if registries is not None:
+            for registry in registries:
+                repo_key = self._extract_repo_name(registry.repo_url)
+                self.registry_cache[repo_key] = registry
+        else:
+            self._load_all_registries()
 
     def _load_all_registries(self):
         """Load all YAML files from the registry directory."""
@@ -36,8 +52,7 @@ class RegistryLoader:
 
     def _load_registry_file(self, filepath: Path) -> YAMLRegistryStructure | None:
         """Load a single YAML registry file."""
-        with open(filepath) as f:
-            data = yaml.safe_load(f)
+        data = read_yaml_file(filepath)
 
         if not data or "repo" not in data:
             return None
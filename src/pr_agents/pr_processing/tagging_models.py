@@ -2,10 +2,26 @@
 Data models for PR tagging processor.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
+# Distinct tags in a registry are few, but each is rendered for every file
+TAG_STRING_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=TAG_STRING_CACHE_SIZE)
+def _tag_string(primary: str, secondary: str | None, tertiary: str | None) -> str:
+    """Join tag parts into their dotted form, interned so repeats share one str."""
+    parts = [primary]
+    if secondary:
+        parts.append(secondary)
+    if tertiary:
+        parts.append(tertiary)
+    return sys.intern(".".join(parts))
+
 
 class ImpactLevel(Enum):
     """Impact level of changes."""
@@ -17,7 +33,7 @@ class ImpactLevel(Enum):
     MINIMAL = "minimal"
 
 
-@dataclass
+@dataclass(slots=True)
 class HierarchicalTag:
     """Represents a tag with hierarchical structure."""
 
@@ -27,12 +43,7 @@ class HierarchicalTag:
 
     def to_string(self) -> str:
         """Convert to string representation."""
-        parts = [self.primary]
-        if self.secondary:
-            parts.append(self.secondary)
-        if self.tertiary:
-            parts.append(self.tertiary)
-        return ".".join(parts)
+        return _tag_string(self.primary, self.secondary, self.tertiary)
 
     @classmethod
     def from_path(cls, tag_path: list[str]) -> "HierarchicalTag":
@@ -43,7 +54,7 @@ class HierarchicalTag:
         return cls(primary=primary, secondary=secondary, tertiary=tertiary)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileTag:
     """Tags and metadata for a single file."""
 
@@ -73,7 +84,7 @@ class FileTag:
         self.flat_tags.append(tag.to_string())
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleMatch:
     """Represents a matched rule from YAML registry."""
 
@@ -87,7 +98,7 @@ class RuleMatch:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaggingResult:
     """Complete result of PR tagging analysis."""
 
@@ -123,20 +134,12 @@ class TaggingResult:
         self, filepath: str, primary: str, secondary: str | None = None
     ):
         """Add a file to the tag hierarchy structure."""
-        if primary not in self.tag_hierarchy:
-            self.tag_hierarchy[primary] = {}
-
-        if secondary:
-            if secondary not in self.tag_hierarchy[primary]:
-                self.tag_hierarchy[primary][secondary] = []
-            self.tag_hierarchy[primary][secondary].append(filepath)
-        else:
-            if "_root" not in self.tag_hierarchy[primary]:
-                self.tag_hierarchy[primary]["_root"] = []
-            self.tag_hierarchy[primary]["_root"].append(filepath)
+        self.tag_hierarchy.setdefault(primary, {}).setdefault(
+            secondary or "_root", []
+        ).append(filepath)
 
 
-@dataclass
+@dataclass(slots=True)
 class YAMLRegistryStructure:
     """Structure from YAML registry file."""
 
@@ -146,7 +149,7 @@ class YAMLRegistryStructure:
     rules: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class YAMLPattern:
     """Pattern definition from YAML structure."""
 
@@ -4,9 +4,10 @@ import re
 from pathlib import Path
 from typing import Any
 
-import yaml
 from loguru import logger
 
+from src.pr_agents.config.io_utils import read_json_file, read_yaml_file
+
 
 class EnhancedRepositoryContextProvider:
     """Provides rich repository context from knowledge bases.
@@ -69,15 +70,26 @@ class EnhancedRepositoryContextProvider:
             )
             return None
 
-        # Try to load the specific YAML file
+        # Prefer a JSON knowledge file, which parses far faster than YAML
+        json_file = self.knowledge_base_path / f"{repo_type}.json"
+        if json_file.exists():
+            try:
+                knowledge = read_json_file(json_file)
+                self._knowledge_cache[repo_type] = knowledge
+                logger.info(f"Loaded knowledge base for {repo_type}")
+                return knowledge
+            except Exception as e:
+                # A corrupt or stale JSON copy must not hide the YAML source
+                logger.error(f"Failed to load {json_file}: {e}")
+
+        # Fall back to the YAML source
         yaml_file = self.knowledge_base_path / f"{repo_type}.yaml"
         if yaml_file.exists():
             try:
-                with open(yaml_file) as f:
-                    knowledge = yaml.safe_load(f)
-                    self._knowledge_cache[repo_type] = knowledge
-                    logger.info(f"Loaded knowledge base for {repo_type}")
-                    return knowledge
+                knowledge = read_yaml_file(yaml_file)
+                self._knowledge_cache[repo_type] = knowledge
+                logger.info(f"Loaded knowledge base for {repo_type}")
+                return knowledge
             except Exception as e:
                 logger.error(f"Failed to load {yaml_file}: {e}")
         else:
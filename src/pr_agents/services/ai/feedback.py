@@ -9,7 +9,7 @@ from typing import Any
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeedbackEntry:
     """A single feedback entry for a summary."""
 
@@ -23,7 +23,7 @@ class FeedbackEntry:
     user_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeedbackStats:
     """Statistics about feedback for a persona."""
 
@@ -8,7 +8,7 @@ from typing import Any
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelVersion:
     """Represents a fine-tuned model version."""
 
@@ -21,7 +21,7 @@ class ModelVersion:
     is_active: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class FineTuneConfig:
     """Configuration for fine-tuning."""
 
@@ -8,6 +8,8 @@ from src.pr_agents.pr_processing.analysis_models import PersonaSummary
 class StreamingResponse:
     """Represents a streaming response from an LLM."""
 
+    __slots__ = ("persona", "stream", "accumulated_text", "token_count")
+
     def __init__(self, persona: str, stream: AsyncIterator[str]):
         """Initialize streaming response.
 
@@ -342,3 +342,69 @@ class TestAccuracyValidator:
         result = self.validator.process(vague_data)
         assert result.success
         assert result.data["component_scores"]["specificity"] < 30
+
+    def test_repeated_validation_is_memoized(self):
+        """Test identical inputs reuse the cached result without sharing state."""
+        component_data = {
+            "metadata_results": {
+                "title_analysis": {"title": "Add fooBidAdapter", "has_prefix": False},
+                "description_analysis": {
+                    "has_description": True,
+                    "description": "Adds the foo adapter",
+                    "sections": [],
+                },
+            },
+            "code_results": {
+                "file_analysis": {
+                    "files_changed": [
+                        {
+                            "filename": "modules/fooBidAdapter.js",
+                            "changes": 120,
+                            "status": "added",
+                        }
+                    ],
+                    "total_changes": 120,
+                },
+                "pattern_analysis": {"patterns_detected": []},
+                "risk_assessment": {"risk_level": "low"},
+            },
+        }
+
+        first = self.validator.process(component_data)
+        first.data["total_score"] = -1
+        second = self.validator.process(component_data)
+
+        assert len(self.validator._result_cache) == 1
+        assert second.success
+        assert second.data["total_score"] >= 0
+
+    def test_memo_cache_is_bounded(self):
+        """Test the memo cache evicts the oldest entries beyond its size."""
+        validator = AccuracyValidator(cache_size=2)
+        for title in ["Add a", "Add b", "Add c"]:
+            validator.process(
+                {
+                    "metadata_results": {"title_analysis": {"title": title}},
+                    "code_results": {"file_analysis": {"files_changed": []}},
+                }
+            )
+
+        assert len(validator._result_cache) == 2
+
+    def test_mixed_key_types_skip_cache(self):
+        """Test inputs that cannot be canonicalized still validate, uncached."""
+        validator = AccuracyValidator()
+        result = validator.process(
+            {
+                "metadata_results": {"title_analysis": {"title": "Add foo"}},
+                "code_results": {
+                    "file_analysis": {
+                        "files_changed": [],
+                        "file_types": {"js": 1, 2: 3},
+                    }
+                },
+            }
+        )
+
+        assert result.success
+        assert len(validator._result_cache) == 0
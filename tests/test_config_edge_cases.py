@@ -14,10 +14,13 @@ from src.pr_agents.config.exceptions import (
 from src.pr_agents.config.loader import ConfigurationLoader
 from src.pr_agents.config.manager import RepositoryStructureManager
 from src.pr_agents.config.models import ModulePattern
-from src.pr_agents.config.pattern_matcher import PatternMatcher
+from src.pr_agents.config.pattern_matcher import PathContext, PatternMatcher
 from src.pr_agents.config.validator import ConfigurationValidator
 from src.pr_agents.config.version_utils import parse_version, version_matches_range
-from src.pr_agents.config.watcher import ConfigurationWatcher
+from src.pr_agents.config.watcher import (
+    ConfigurationChangeHandler,
+    ConfigurationWatcher,
+)
 
 
 class TestConfigurationEdgeCases:
@@ -77,6 +80,51 @@ class TestConfigurationEdgeCases:
         assert isinstance(config, RepositoryConfig)
         assert "test/c" in config.repositories
 
+    def test_extends_cycles_found_in_one_pass(self, tmp_path):
+        """Test every extends cycle is found once, including self-loops."""
+        repos_dir = tmp_path / "repositories"
+        repos_dir.mkdir()
+        for name, extends in [("a", "b"), ("b", "a"), ("d", "a"), ("e", "e")]:
+            (repos_dir / f"{name}.json").write_text(
+                json.dumps(
+                    {
+                        "extends": f"{extends}.json",
+                        "repo_name": f"test/{name}",
+                        "repo_type": "test",
+                    }
+                )
+            )
+
+        loader = ConfigurationLoader(str(tmp_path))
+        config = loader.load_config()
+
+        assert {p.name for p in loader._cyclic_files} == {"a.json", "b.json", "e.json"}
+        # d extends into the cycle but is not part of it, so it still resolves
+        assert "test/d" in config.repositories
+
+    def test_multi_level_inheritance(self, tmp_path):
+        """Test extends chains are resolved through every level."""
+        repos_dir = tmp_path / "repositories"
+        repos_dir.mkdir()
+        (repos_dir / "root-base.json").write_text(
+            json.dumps({"description": "root", "paths": {"core": ["src/"]}})
+        )
+        (repos_dir / "mid-base.json").write_text(
+            json.dumps({"extends": "root-base.json", "paths": {"test": ["test/"]}})
+        )
+        (repos_dir / "leaf.json").write_text(
+            json.dumps(
+                {"extends": "mid-base.json", "repo_name": "test/leaf", "repo_type": "t"}
+            )
+        )
+
+        loader = ConfigurationLoader(str(tmp_path))
+        repo = loader.load_config().get_repository("test/leaf")
+
+        assert repo.description == "root"
+        assert repo.core_paths == ["src/"]
+        assert repo.test_paths == ["test/"]
+
     def test_missing_extends_file(self, tmp_path):
         """Test handling of missing base config file."""
         repos_dir = tmp_path / "repositories"
@@ -131,6 +179,25 @@ class TestConfigurationEdgeCases:
         assert version_matches_range("v10.5", ">=10.0,<11.0")
         assert not version_matches_range("v11.0", ">=10.0,<11.0")
 
+    @pytest.mark.parametrize(
+        ("version", "version_range", "expected"),
+        [
+            # Pre-releases of the upper bound sort below it
+            ("11.0.0-rc1", "<11.0", True),
+            ("11.0.0.dev1", "<11.0", True),
+            # Post-releases and local builds sort above the lower bound
+            ("10.0.post1", ">10.0", True),
+            ("10.0+abc", ">10.0", True),
+            # A local build is not the exact release
+            ("10.0+local", "==10.0", False),
+        ],
+    )
+    def test_version_range_uses_version_ordering(
+        self, version, version_range, expected
+    ):
+        """Test ranges compare plain Version ordering, not PEP 440 specifiers."""
+        assert version_matches_range(version, version_range) is expected
+
     def test_deeply_nested_configs(self, tmp_path):
         """Test handling of deeply nested directory structures."""
         # Create repositories directory
@@ -262,6 +329,31 @@ class TestConfigurationEdgeCases:
         pattern = ModulePattern(pattern="test[[]].js", pattern_type="glob")
         assert matcher.match_pattern("test[].js", pattern)
 
+        # Glob regex is translated once at construction, not per match
+        pattern = ModulePattern(pattern="modules/*.js", pattern_type="glob")
+        assert pattern.compiled_glob is not None
+        assert matcher.match_pattern("modules/fooBidAdapter.js", pattern)
+        assert (
+            ModulePattern(pattern="*.js", pattern_type="suffix").compiled_glob is None
+        )
+
+        # A pre-split PathContext gives the same answers as the raw path
+        ctx = PathContext.from_path("modules/rubicon/rubiconBidAdapter.js")
+        assert ctx.basename == "rubiconBidAdapter.js"
+        assert ctx.dirs == ("modules", "rubicon")
+        for pattern_str, pattern_type in [
+            ("rubicon*", "prefix"),
+            ("rubicon", "directory"),
+            ("modules/*", "directory"),
+            ("*Adapter.js", "suffix"),
+            ("other*", "prefix"),
+            ("other", "directory"),
+        ]:
+            pattern = ModulePattern(pattern=pattern_str, pattern_type=pattern_type)
+            assert matcher.match_pattern(
+                ctx.path, pattern, ctx
+            ) == matcher.match_pattern(ctx.path, pattern)
+
     def test_watcher_rapid_changes(self, tmp_path):
         """Test watcher handling rapid file changes."""
         config_file = tmp_path / "rapid.json"
@@ -284,8 +376,62 @@ class TestConfigurationEdgeCases:
 
             time.sleep(2)
 
-        # Should batch rapid changes
-        assert len(changes_detected) < 10
+        # Should batch rapid changes into a trailing reload
+        assert 1 <= len(changes_detected) < 10
+
+    def test_watcher_reloads_early_on_event_burst(self, tmp_path):
+        """Test a full batch of events reloads without waiting out the debounce."""
+        import threading
+
+        config_file = tmp_path / "burst.json"
+        config_file.write_text(json.dumps({"repo_name": "test", "repo_type": "test"}))
+
+        reloaded = threading.Event()
+        handler = ConfigurationChangeHandler(
+            tmp_path,
+            lambda config: reloaded.set(),
+            debounce_seconds=60,
+            max_batch_events=3,
+        )
+        try:
+            for _ in range(3):
+                handler._schedule_reload()
+            assert reloaded.wait(5)
+        finally:
+            handler.cancel_pending()
+
+    def test_watcher_accepts_ndjson_bundle(self, tmp_path):
+        """Test edits to repositories.ndjson count as config changes."""
+        handler = ConfigurationChangeHandler(tmp_path, lambda config: None)
+
+        assert handler._is_config_file(str(tmp_path / "repositories.ndjson"))
+        assert handler._is_config_file(str(tmp_path / "repositories.json"))
+        assert not handler._is_config_file(str(tmp_path / "notes.txt"))
+
+    def test_watcher_reloads_again_for_event_during_reload(self, tmp_path):
+        """Test a save arriving mid-reload triggers a follow-up reload."""
+        import threading
+
+        config_file = tmp_path / "busy.json"
+        config_file.write_text(json.dumps({"repo_name": "test", "repo_type": "test"}))
+
+        reloads = []
+        reloaded_twice = threading.Event()
+
+        def on_change(config):
+            reloads.append(config)
+            if len(reloads) == 1:
+                # A user save landing while the first reload is in progress
+                handler._schedule_reload()
+            else:
+                reloaded_twice.set()
+
+        handler = ConfigurationChangeHandler(tmp_path, on_change, debounce_seconds=0.01)
+        try:
+            handler._schedule_reload()
+            assert reloaded_twice.wait(5)
+        finally:
+            handler.cancel_pending()
 
     def test_manager_with_invalid_repo_urls(self):
         """Test manager handling of invalid repository URLs."""
@@ -357,6 +503,35 @@ class TestConfigurationEdgeCases:
         # Cache should prevent memory bloat
         assert len(loader._loaded_configs) <= 10  # Reasonable cache size
 
+    def test_loaded_configs_reload_on_change_and_stay_bounded(
+        self, tmp_path, monkeypatch
+    ):
+        """Test the file cache re-reads edited files and evicts old entries."""
+        import os
+
+        from src.pr_agents.config import loader as loader_module
+
+        repos_dir = tmp_path / "repositories"
+        repos_dir.mkdir()
+        config_file = repos_dir / "repo.json"
+        config_file.write_text(json.dumps({"repo_name": "a/b", "repo_type": "v1"}))
+
+        loader = ConfigurationLoader(str(tmp_path))
+        assert loader.load_config().get_repository("a/b").repo_type == "v1"
+
+        config_file.write_text(json.dumps({"repo_name": "a/b", "repo_type": "v2"}))
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert loader.load_config().get_repository("a/b").repo_type == "v2"
+
+        monkeypatch.setattr(loader_module, "LOADED_CONFIG_CACHE_SIZE", 2)
+        for i in range(5):
+            (repos_dir / f"extra{i}.json").write_text(
+                json.dumps({"repo_name": f"x/{i}", "repo_type": "t"})
+            )
+        assert len(loader.load_config().repositories) == 6
+        assert len(loader._loaded_configs) == 2
+
     def test_special_characters_in_paths(self, tmp_path):
         """Test handling of special characters in file paths."""
         # Create directory with special characters
@@ -8,6 +8,7 @@ from pathlib import Path
 
 import pytest
 
+from src.pr_agents.config import loader as loader_module
 from src.pr_agents.config.loader import ConfigurationLoader
 from src.pr_agents.config.models import DetectionStrategy
 from src.pr_agents.config.validator import ConfigurationValidator
@@ -102,6 +103,28 @@ class TestMultiFileConfigLoader:
         assert len(repo.module_categories) == 1
         assert "bid_adapter" in repo.module_categories
 
+    def test_load_large_master_file_in_parallel(self, temp_config_dir):
+        """Test many referenced files load via the parallel path, skipping bad ones."""
+        repos_dir = temp_config_dir / "repositories" / "prebid"
+        repo_files = []
+        for i in range(12):
+            repo_file = repos_dir / f"repo{i}.json"
+            repo_file.write_text(
+                json.dumps({"repo_name": f"org/repo{i}", "repo_type": "test"})
+            )
+            repo_files.append(f"./repositories/prebid/repo{i}.json")
+        (repos_dir / "broken.json").write_text("{ not json")
+        repo_files.append("./repositories/prebid/broken.json")
+
+        master_path = temp_config_dir / "repositories.json"
+        master_path.write_text(json.dumps({"repositories": repo_files}))
+
+        loader = ConfigurationLoader(str(temp_config_dir))
+        config = loader.load_config()
+
+        assert len(config.repositories) == 12
+        assert config.repositories["org/repo11"].repo_type == "test"
+
     def test_inheritance(self, temp_config_dir, base_config, repo_config):
         """Test configuration inheritance."""
         # Create base config with multiple categories
@@ -176,6 +199,33 @@ class TestMultiFileConfigLoader:
         assert ver_config.version_range == ">=10.0"
         assert "bid_adapter" in ver_config.module_categories
 
+    def test_load_ndjson_bundle(self, temp_config_dir):
+        """Test loading inline repository configs from repositories.ndjson."""
+        shared_dir = temp_config_dir / "shared"
+        shared_dir.mkdir()
+        (shared_dir / "js-base.json").write_text(
+            json.dumps({"paths": {"core": ["src/"]}})
+        )
+        lines = [
+            json.dumps(
+                {
+                    "repo_name": "test/one",
+                    "repo_type": "js",
+                    "extends": "shared/js-base.json",
+                }
+            ),
+            "",
+            json.dumps({"repo_name": "test/two", "repo_type": "go"}),
+            "{not json",
+        ]
+        (temp_config_dir / "repositories.ndjson").write_text("\n".join(lines))
+
+        config = ConfigurationLoader(str(temp_config_dir)).load_config()
+
+        assert set(config.repositories) == {"test/one", "test/two"}
+        assert config.repositories["test/one"].core_paths == ["src/"]
+        assert config.repositories["test/two"].core_paths == []
+
     def test_backward_compatibility(self, temp_config_dir):
         """Test loading old single-file format."""
         old_format = {
@@ -206,6 +256,26 @@ class TestMultiFileConfigLoader:
         assert repo.repo_type == "prebid-js"
         assert repo.core_paths == ["src/"]
 
+    def test_single_file_reload_skips_parse(self, temp_config_dir, monkeypatch):
+        """Test an unchanged single file is parsed once across loads."""
+        config_path = temp_config_dir / "old_format.json"
+        config_path.write_text(json.dumps({"prebid/Prebid.js": {"repo_type": "js"}}))
+
+        calls = []
+        real_read = loader_module.read_json_file
+        monkeypatch.setattr(
+            loader_module,
+            "read_json_file",
+            lambda path: calls.append(path) or real_read(path),
+        )
+
+        loader = ConfigurationLoader(str(config_path))
+        loader.load_config()
+        config = loader.load_config()
+
+        assert len(calls) == 1
+        assert "prebid/Prebid.js" in config.repositories
+
     def test_deep_merge(self, temp_config_dir):
         """Test deep merging of configurations."""
         base = {
@@ -252,6 +322,21 @@ class TestMultiFileConfigLoader:
         assert merged["paths"]["core"] == ["src/"]  # Preserved
         assert merged["paths"]["docs"] == ["docs/"]  # Added
 
+    def test_deep_merge_is_memoized(self, temp_config_dir):
+        """Test repeated merges of the same inputs reuse the cached result."""
+        base = {"paths": {"core": ["src/"]}}
+        override = {"paths": {"test": ["test/"]}}
+
+        loader = ConfigurationLoader(str(temp_config_dir))
+        first = loader._deep_merge(base, override)
+        second = loader._deep_merge(base, override)
+
+        assert first is second
+        assert first == {"paths": {"core": ["src/"], "test": ["test/"]}}
+
+        loader.clear_cache()
+        assert loader._deep_merge(base, override) is not first
+
     def test_pattern_parsing(self, temp_config_dir):
         """Test parsing of different pattern formats."""
         config_data = {
@@ -322,6 +407,17 @@ class TestConfigurationValidator:
         validator.validator = Draft7Validator(schema)
         return validator
 
+    def test_compiled_schema_shared_across_instances(self, tmp_path):
+        """Test validators for the same schema file share one compiled validator."""
+        schema_file = tmp_path / "repository.schema.json"
+        schema_file.write_text(json.dumps({"type": "object"}))
+
+        first = ConfigurationValidator(str(schema_file))
+        second = ConfigurationValidator(str(schema_file))
+
+        assert first.validator is not None
+        assert first.validator is second.validator
+
     def test_validate_valid_config(self, validator):
         """Test validation of valid configuration."""
         config = {
@@ -1,12 +1,12 @@
 """Tests for repository knowledge loader."""
 
 import json
-import tempfile
-from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 
+from src.pr_agents.config import knowledge_loader
 from src.pr_agents.config.knowledge_loader import RepositoryKnowledgeLoader
 
 
@@ -14,16 +14,17 @@ class TestRepositoryKnowledgeLoader:
     """Test repository knowledge loading and merging."""
 
     @pytest.fixture
-    def temp_config_dir(self):
-        """Create temporary config directory structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_dir = Path(tmpdir)
+    def temp_config_dir(self, tmp_path):
+        """Create temporary config directory structure.
 
-            # Create directory structure
-            (config_dir / "repositories" / "prebid").mkdir(parents=True)
-            (config_dir / "repository-knowledge").mkdir(parents=True)
+        Uses pytest's tmp_path, which skips the per-test rmtree that a
+        TemporaryDirectory context pays on exit.
+        """
+        # Create directory structure
+        (tmp_path / "repositories" / "prebid").mkdir(parents=True)
+        (tmp_path / "repository-knowledge").mkdir(parents=True)
 
-            yield config_dir
+        return tmp_path
 
     @pytest.fixture
     def sample_json_config(self, temp_config_dir):
@@ -222,3 +223,44 @@ class TestRepositoryKnowledgeLoader:
         # File should be at prebid-js.json (dots replaced with dashes)
         json_path = temp_config_dir / "repositories" / "prebid" / "prebid-js.json"
         assert json_path.exists()
+
+    def test_repeated_loads_use_cache_until_file_changes(self, temp_config_dir):
+        """Test parsed configs are cached and re-read once the file changes."""
+        config_path = temp_config_dir / "prebid" / "prebid-js" / "config.json"
+        config_path.parent.mkdir(parents=True)
+        config_path.write_text(json.dumps({"repo_name": "prebid/Prebid.js"}))
+
+        loader = RepositoryKnowledgeLoader(temp_config_dir)
+        with patch(
+            "src.pr_agents.config.knowledge_loader.read_json_file",
+            wraps=knowledge_loader.read_json_file,
+        ) as read_json:
+            first = loader.load_repository_config("prebid/Prebid.js")
+            first["repo_name"] = "mutated"
+            second = RepositoryKnowledgeLoader(temp_config_dir).load_repository_config(
+                "prebid/Prebid.js"
+            )
+            assert read_json.call_count == 1
+            # Callers get copies, so mutating one result doesn't touch the cache
+            assert second["repo_name"] == "prebid/Prebid.js"
+
+            # A different size changes the cache key even within one mtime tick
+            config_path.write_text(json.dumps({"repo_name": "prebid/Prebid.js v2"}))
+            third = loader.load_repository_config("prebid/Prebid.js")
+            assert read_json.call_count == 2
+            assert third["repo_name"] == "prebid/Prebid.js v2"
+
+    def test_config_paths_resolved_once_per_repo(self, temp_config_dir):
+        """Test repository name normalization is cached per loader."""
+        loader = RepositoryKnowledgeLoader(temp_config_dir)
+
+        with patch.object(
+            loader,
+            "_get_possible_config_paths",
+            wraps=loader._get_possible_config_paths,
+        ) as get_paths:
+            loader.load_repository_config("prebid/Prebid.js")
+            loader.load_repository_config("prebid/Prebid.js")
+            loader.load_repository_config("prebid/prebid-server")
+
+        assert get_paths.call_count == 2
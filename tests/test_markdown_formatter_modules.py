@@ -8,9 +8,9 @@ from src.pr_agents.output import MarkdownFormatter
 class TestMarkdownFormatterModules:
     """Test markdown formatter with modules and file lists."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def formatter(self):
-        """Create formatter instance."""
+        """Create one formatter for the module; format() keeps no state."""
         return MarkdownFormatter()
 
     @pytest.fixture
@@ -1,5 +1,9 @@
 """Tests for module detector strategies."""
 
+from unittest.mock import patch
+
+import pytest
+
 from src.pr_agents.pr_processing.extractors.module_detectors import (
     AnalyticsAdapterDetector,
     BidAdapterDetector,
@@ -7,6 +11,7 @@ from src.pr_agents.pr_processing.extractors.module_detectors import (
     IdSystemDetector,
     ModuleDetectorRegistry,
     RtdModuleDetector,
+    SuffixDetector,
     UserModuleDetector,
     VideoModuleDetector,
 )
@@ -170,14 +175,63 @@ class TestConfigBasedDetector:
             None,
         )
 
+    def test_patterns_compiled_once(self):
+        """Test globs are translated at construction, not on every detect."""
+        config = {
+            "paths": ["modules/*.js", "libraries/*"],
+            "naming_pattern": "endsWith('BidAdapter')",
+        }
+        detector = ConfigBasedDetector("bid_adapter", config)
+
+        with patch(
+            "src.pr_agents.pr_processing.extractors.module_detectors.fnmatch"
+        ) as mock_fnmatch:
+            assert detector.detect(
+                "exampleBidAdapter", "libraries/exampleBidAdapter.js"
+            ) == ("bid_adapter", "adapter")
+            assert detector.detect("exampleBidAdapter", "src/x.js") == (None, None)
+
+        mock_fnmatch.translate.assert_not_called()
+        mock_fnmatch.fnmatch.assert_not_called()
+
+    def test_same_paths_share_compiled_pattern(self):
+        """Test detectors built from the same globs reuse one compiled regex."""
+        config = {"paths": ["modules/*SharedAdapter.js", "shared/*"]}
+        first = ConfigBasedDetector("bid_adapter", config)
+
+        with patch(
+            "src.pr_agents.pr_processing.extractors.module_detectors.fnmatch"
+        ) as mock_fnmatch:
+            second = ConfigBasedDetector("bid_adapter", dict(config))
+
+        mock_fnmatch.translate.assert_not_called()
+        assert first.detect("aSharedAdapter", "modules/aSharedAdapter.js")[0]
+        assert second.detect("utils", "shared/utils.js")[0]
+
+    def test_no_paths_matches_nothing(self):
+        """Test a config without paths never matches."""
+        detector = ConfigBasedDetector("bid_adapter", {"category": "adapter"})
+
+        assert detector.detect("aBidAdapter", "modules/aBidAdapter.js") == (
+            None,
+            None,
+        )
+
+
+@pytest.fixture(scope="module")
+def registry():
+    """Shared registry for read-only tests.
+
+    Tests that load config or register detectors build their own.
+    """
+    return ModuleDetectorRegistry()
+
 
 class TestModuleDetectorRegistry:
     """Test module detector registry."""
 
-    def test_default_detection(self):
+    def test_default_detection(self, registry):
         """Test detection with default detectors."""
-        registry = ModuleDetectorRegistry()
-
         # Test various module types
         assert registry.detect_module_type(
             "exampleBidAdapter", "modules/exampleBidAdapter.js"
@@ -278,3 +332,123 @@ class TestModuleDetectorRegistry:
         assert registry.detect_module_type(
             "exampleBidAdapter", "modules/exampleBidAdapter.js"
         ) == {"type": "bid_adapter", "category": "adapter"}
+
+    def test_default_detection_matches_detectors(self, registry):
+        """Test the registry's combined match agrees with each default detector."""
+        names = [
+            "exampleBidAdapter",
+            "exampleRtdModule",
+            "exampleRtdProvider",
+            "exampleAnalyticsAdapter",
+            "exampleIdSystem",
+            "exampleUserModule",
+            "exampleVideoModule",
+            "BidAdapterUtils",
+            "exampleModule",
+            "",
+        ]
+
+        for name in names:
+            path = f"modules/{name}.js"
+            expected = next(
+                (
+                    {"type": module_type, "category": category}
+                    for detector in registry.default_detectors
+                    for module_type, category in [detector.detect(name, path)]
+                    if module_type
+                ),
+                {"type": "generic", "category": "utility"},
+            )
+            assert registry.detect_module_type(name, path) == expected
+
+    def test_detection_results_are_shared(self):
+        """Test repeated detections return the same read-only mapping."""
+        registry = ModuleDetectorRegistry()
+        registry.load_repository_config(
+            {"module_locations": {"floors_module": {"paths": ["modules/*Floors.js"]}}}
+        )
+
+        first = registry.detect_module_type("aBidAdapter", "modules/aBidAdapter.js")
+        second = registry.detect_module_type("bBidAdapter", "modules/bBidAdapter.js")
+        assert first is second
+        assert registry.detect_module_type(
+            "priceFloors", "modules/priceFloors.js"
+        ) is registry.detect_module_type("otherFloors", "modules/otherFloors.js")
+
+        with pytest.raises(TypeError):
+            first["type"] = "changed"
+
+    def test_config_detection_values(self):
+        """Test config-derived detections carry the configured type, shared."""
+        registry = ModuleDetectorRegistry()
+        registry.load_repository_config(
+            {"module_locations": {"floors_module": {"paths": ["modules/*Floors.js"]}}}
+        )
+
+        first = registry.detect_module_type("priceFloors", "modules/priceFloors.js")
+        second = registry.detect_module_type("otherFloors", "modules/otherFloors.js")
+
+        assert first == {"type": "floors_module", "category": "other"}
+        assert second is first
+
+    def test_register_suffix_detector(self):
+        """Test suffix-declaring detectors are indexed in registration order."""
+        registry = ModuleDetectorRegistry()
+
+        class AdapterDetector(SuffixDetector):
+            SUFFIXES = ("Adapter",)
+            MODULE_TYPE = "adapter"
+            CATEGORY = "other"
+
+        registry.register_detector(AdapterDetector())
+
+        assert registry.detect_module_type(
+            "exampleAdapter", "modules/exampleAdapter.js"
+        ) == {"type": "adapter", "category": "other"}
+        # The built-in BidAdapter suffix was registered first, so it still wins
+        assert registry.detect_module_type(
+            "exampleBidAdapter", "modules/exampleBidAdapter.js"
+        ) == {"type": "bid_adapter", "category": "adapter"}
+
+    def test_detect_many_matches_single_detection(self):
+        """Test batch detection agrees with per-file detection."""
+        registry = ModuleDetectorRegistry()
+        registry.load_repository_config(
+            {
+                "module_locations": {
+                    "custom_adapter": {"paths": ["custom/*"], "category": "custom"}
+                }
+            }
+        )
+        pairs = [
+            ("exampleBidAdapter", "modules/exampleBidAdapter.js"),
+            ("exampleBidAdapter", "custom/exampleBidAdapter.js"),
+            ("id5IdSystem", "modules/id5IdSystem.js"),
+            ("unknownModule", "modules/unknownModule.js"),
+        ]
+        names = [name for name, _ in pairs]
+        paths = [path for _, path in pairs]
+
+        assert registry.detect_many(names, paths) == [
+            registry.detect_module_type(name, path) for name, path in pairs
+        ]
+        with pytest.raises(ValueError):
+            registry.detect_many(names, paths[:1])
+
+    def test_suffix_cache_cleared_on_register(self):
+        """Test a cached miss is dropped when a matching detector is added."""
+        registry = ModuleDetectorRegistry()
+        assert registry.detect_module_type(
+            "exampleFloors", "modules/exampleFloors.js"
+        ) == {"type": "generic", "category": "utility"}
+
+        class FloorsDetector(SuffixDetector):
+            SUFFIXES = ("Floors",)
+            MODULE_TYPE = "floors_module"
+            CATEGORY = "monetization"
+
+        registry.register_detector(FloorsDetector())
+
+        assert registry.detect_module_type(
+            "exampleFloors", "modules/exampleFloors.js"
+        ) == {"type": "floors_module", "category": "monetization"}
@@ -2,38 +2,46 @@
 
 from unittest.mock import Mock
 
+import pytest
+
 from src.pr_agents.pr_processing.extractors.modules import ModuleExtractor
 
+# Sample repository configuration
+REPO_CONFIG = {
+    "module_locations": {
+        "bid_adapter": {
+            "paths": ["modules/*BidAdapter.js"],
+            "naming_pattern": "endsWith('BidAdapter')",
+        },
+        "analytics_adapter": {
+            "paths": ["modules/*AnalyticsAdapter.js"],
+            "naming_pattern": "endsWith('AnalyticsAdapter')",
+        },
+        "rtd_provider": {
+            "paths": ["modules/*RtdProvider.js"],
+            "naming_pattern": "endsWith('RtdProvider')",
+        },
+        "core": {"paths": ["src/*", "src/core/*"], "naming_pattern": ""},
+    }
+}
+
+
+@pytest.fixture(scope="class")
+def extractor():
+    """Extractor configured with REPO_CONFIG, shared by a test class.
+
+    Tests that need a different configuration build their own extractor
+    rather than calling set_repository_config() on this one.
+    """
+    extractor = ModuleExtractor(Mock())
+    extractor.set_repository_config(REPO_CONFIG)
+    return extractor
+
 
 class TestModuleExtractor:
     """Test cases for ModuleExtractor."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        mock_github = Mock()
-        self.extractor = ModuleExtractor(mock_github)
-
-        # Sample repository configuration
-        self.repo_config = {
-            "module_locations": {
-                "bid_adapter": {
-                    "paths": ["modules/*BidAdapter.js"],
-                    "naming_pattern": "endsWith('BidAdapter')",
-                },
-                "analytics_adapter": {
-                    "paths": ["modules/*AnalyticsAdapter.js"],
-                    "naming_pattern": "endsWith('AnalyticsAdapter')",
-                },
-                "rtd_provider": {
-                    "paths": ["modules/*RtdProvider.js"],
-                    "naming_pattern": "endsWith('RtdProvider')",
-                },
-                "core": {"paths": ["src/*", "src/core/*"], "naming_pattern": ""},
-            }
-        }
-        self.extractor.set_repository_config(self.repo_config)
-
-    def test_extract_bid_adapter_module(self):
+    def test_extract_bid_adapter_module(self, extractor):
         """Test extracting bid adapter modules."""
         pr_data = {
             "files": [
@@ -43,7 +51,7 @@ class TestModuleExtractor:
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         assert result["total_modules"] == 1
         assert len(result["modules"]) == 1
@@ -54,7 +62,7 @@ class TestModuleExtractor:
         assert module["category"] == "adapter"
         assert module["path"] == "modules/exampleBidAdapter.js"
 
-    def test_extract_multiple_module_types(self):
+    def test_extract_multiple_module_types(self, extractor):
         """Test extracting different module types."""
         pr_data = {
             "files": [
@@ -67,7 +75,7 @@ class TestModuleExtractor:
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         assert result["total_modules"] == 4
         assert len(result["modules"]) == 4
@@ -80,7 +88,7 @@ class TestModuleExtractor:
         # Check primary type
         assert result["primary_module_type"] == "adapter"
 
-    def test_ignore_test_files(self):
+    def test_ignore_test_files(self, extractor):
         """Test that test files are ignored."""
         pr_data = {
             "files": [
@@ -91,7 +99,7 @@ class TestModuleExtractor:
             "repository": "test/repo",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         assert result["total_modules"] == 0
         assert len(result["modules"]) == 0
@@ -99,14 +107,15 @@ class TestModuleExtractor:
     def test_extract_generic_modules(self):
         """Test extracting generic modules without specific patterns."""
         # Use a different config without patterns
-        self.extractor.set_repository_config({"module_locations": {}})
+        extractor = ModuleExtractor(Mock())
+        extractor.set_repository_config({"module_locations": {}})
 
         pr_data = {
             "files": ["src/utils.js", "lib/helpers.py", "modules/genericModule.js"],
             "repository": "generic/repo",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         # Should find the generic module
         assert result["total_modules"] >= 1
@@ -115,34 +124,35 @@ class TestModuleExtractor:
         module_names = [m["name"] for m in result["modules"]]
         assert "genericModule" in module_names
 
-    def test_module_dependencies(self):
+    def test_module_dependencies(self, extractor):
         """Test module dependency extraction."""
         pr_data = {
             "files": ["modules/exampleBidAdapter.js", "src/core.js"],
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         dependencies = result["module_dependencies"]
         assert "exampleBidAdapter" in dependencies
         # Adapters depend on core
         assert "core" in dependencies["exampleBidAdapter"]
 
-    def test_empty_pr(self):
+    def test_empty_pr(self, extractor):
         """Test handling of PR with no files."""
         pr_data = {"files": [], "repository": "empty/repo"}
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         assert result["total_modules"] == 0
         assert result["modules"] == []
+        assert result["modules_by_type"] == {}
         assert result["module_categories"] == {}
         assert result["primary_module_type"] is None
 
-    def test_invalid_pr_data(self):
+    def test_invalid_pr_data(self, extractor):
         """Test handling of invalid PR data."""
-        result = self.extractor.extract(None)
+        result = extractor.extract(None)
 
         assert result["total_modules"] == 0
         assert result["repository"] == "unknown"
@@ -160,7 +170,7 @@ class TestModuleExtractor:
         assert result is not None
         assert isinstance(result["modules"], list)
 
-    def test_wildcard_pattern_matching(self):
+    def test_wildcard_pattern_matching(self, extractor):
         """Test wildcard pattern matching in paths."""
         pr_data = {
             "files": [
@@ -171,10 +181,10 @@ class TestModuleExtractor:
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         # Should match the two bid adapters
-        bid_adapters = [m for m in result["modules"] if m["type"] == "bid_adapter"]
+        bid_adapters = result["modules_by_type"].get("bid_adapter", [])
         assert len(bid_adapters) == 2
 
         adapter_names = [m["name"] for m in bid_adapters]
@@ -182,7 +192,7 @@ class TestModuleExtractor:
         assert "anotherPrefixBidAdapter" in adapter_names
         assert "notAnAdapter" not in adapter_names
 
-    def test_duplicate_module_handling(self):
+    def test_duplicate_module_handling(self, extractor):
         """Test that duplicate modules are not added multiple times."""
         pr_data = {
             "files": [
@@ -193,10 +203,30 @@ class TestModuleExtractor:
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         # Should only have one instance of the module
         adapter_modules = [
             m for m in result["modules"] if m["name"] == "exampleBidAdapter"
         ]
         assert len(adapter_modules) == 1
+
+    def test_extract_many_matches_extract(self, extractor):
+        """Test batch extraction gives the same results as one PR at a time."""
+        prs = [
+            {
+                "files": ["modules/exampleBidAdapter.js", "src/core.js"],
+                "repository": "prebid/Prebid.js",
+            },
+            {"files": [], "repository": "prebid/Prebid.js"},
+            None,
+            {
+                "files": [
+                    "modules/exampleAnalyticsAdapter.js",
+                    "test/spec/modules/exampleAnalyticsAdapter_spec.js",
+                ],
+                "repository": "prebid/Prebid.js",
+            },
+        ]
+
+        assert extractor.extract_many(prs) == [extractor.extract(pr) for pr in prs]
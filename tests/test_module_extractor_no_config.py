@@ -2,138 +2,52 @@
 
 from unittest.mock import Mock
 
-from src.pr_agents.pr_processing.extractors.modules import ModuleExtractor
-
-
-class TestModuleExtractorNoConfig:
-    """Test module extraction without repository configuration."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        mock_github = Mock()
-        self.extractor = ModuleExtractor(mock_github)
-        # No configuration set - testing detection based on naming patterns
-
-    def test_detect_bid_adapter(self):
-        """Test that bid adapters are detected based on naming pattern alone."""
-        pr_data = {
-            "files": [
-                "modules/seedtagBidAdapter.js",
-                "test/spec/modules/seedtagBidAdapter_spec.js",
-            ],
-            "repository": "prebid/Prebid.js",
-        }
-
-        result = self.extractor.extract(pr_data)
-
-        assert result["total_modules"] == 1
-        assert len(result["modules"]) == 1
-
-        module = result["modules"][0]
-        assert module["name"] == "seedtagBidAdapter"
-        assert module["type"] == "bid_adapter"
-        assert module["category"] == "adapter"
-        assert result["primary_module_type"] == "adapter"
-
-    def test_detect_rtd_module(self):
-        """Test RTD module detection without configuration."""
-        pr_data = {
-            "files": [
-                "modules/exampleRtdModule.js",
-                "modules/anotherRtdProvider.js",
-            ],
-            "repository": "prebid/Prebid.js",
-        }
-
-        result = self.extractor.extract(pr_data)
-
-        assert result["total_modules"] == 2
-
-        # Check both RTD modules are detected
-        rtd_modules = [m for m in result["modules"] if m["type"] == "rtd_module"]
-        assert len(rtd_modules) == 2
-
-        module_names = [m["name"] for m in rtd_modules]
-        assert "exampleRtdModule" in module_names
-        assert "anotherRtdProvider" in module_names
-
-        # All should be categorized as RTD
-        for module in rtd_modules:
-            assert module["category"] == "rtd"
-
-    def test_detect_analytics_adapter(self):
-        """Test analytics adapter detection without configuration."""
-        pr_data = {
-            "files": [
-                "modules/exampleAnalyticsAdapter.js",
-            ],
-            "repository": "prebid/Prebid.js",
-        }
-
-        result = self.extractor.extract(pr_data)
-
-        assert result["total_modules"] == 1
-        module = result["modules"][0]
-        assert module["name"] == "exampleAnalyticsAdapter"
-        assert module["type"] == "analytics_adapter"
-        assert module["category"] == "analytics"
-
-    def test_detect_id_system(self):
-        """Test ID system detection without configuration."""
-        pr_data = {
-            "files": [
-                "modules/sharedIdSystem.js",
-                "modules/unifiedIdSystem.js",
-            ],
-            "repository": "prebid/Prebid.js",
-        }
-
-        result = self.extractor.extract(pr_data)
-
-        assert result["total_modules"] == 2
+import pytest
 
-        id_modules = [m for m in result["modules"] if m["type"] == "id_system"]
-        assert len(id_modules) == 2
+from src.pr_agents.pr_processing.extractors.modules import ModuleExtractor
 
-        for module in id_modules:
-            assert module["category"] == "identity"
-            assert module["name"].endswith("IdSystem")
 
-    def test_detect_user_module(self):
-        """Test user module detection without configuration."""
-        pr_data = {
-            "files": [
-                "modules/exampleUserModule.js",
-            ],
-            "repository": "prebid/Prebid.js",
-        }
+@pytest.fixture(scope="module")
+def extractor():
+    """Shared extractor; no configuration is ever set on it.
 
-        result = self.extractor.extract(pr_data)
+    Detection is based on naming patterns alone, and extract() keeps no
+    per-PR state, so one instance serves the whole module.
+    """
+    return ModuleExtractor(Mock())
 
-        assert result["total_modules"] == 1
-        module = result["modules"][0]
-        assert module["name"] == "exampleUserModule"
-        assert module["type"] == "user_module"
-        assert module["category"] == "user"
 
-    def test_detect_video_module(self):
-        """Test video module detection without configuration."""
-        pr_data = {
-            "files": [
-                "modules/exampleVideoModule.js",
-            ],
-            "repository": "prebid/Prebid.js",
-        }
+class TestModuleExtractorNoConfig:
+    """Test module extraction without repository configuration."""
 
-        result = self.extractor.extract(pr_data)
+    @pytest.mark.parametrize(
+        ("filename", "expected_type", "expected_category"),
+        [
+            ("modules/seedtagBidAdapter.js", "bid_adapter", "adapter"),
+            ("modules/exampleRtdModule.js", "rtd_module", "rtd"),
+            ("modules/anotherRtdProvider.js", "rtd_module", "rtd"),
+            ("modules/exampleAnalyticsAdapter.js", "analytics_adapter", "analytics"),
+            ("modules/sharedIdSystem.js", "id_system", "identity"),
+            ("modules/exampleUserModule.js", "user_module", "user"),
+            ("modules/exampleVideoModule.js", "video_module", "video"),
+        ],
+    )
+    def test_detect_module_type(
+        self, extractor, filename, expected_type, expected_category
+    ):
+        """Test each module type is detected from its naming pattern alone."""
+        pr_data = {"files": [filename], "repository": "prebid/Prebid.js"}
+
+        result = extractor.extract(pr_data)
 
         assert result["total_modules"] == 1
         module = result["modules"][0]
-        assert module["name"] == "exampleVideoModule"
-        assert module["type"] == "video_module"
-        assert module["category"] == "video"
+        assert module["name"] == filename.rsplit("/", 1)[-1].removesuffix(".js")
+        assert module["type"] == expected_type
+        assert module["category"] == expected_category
+        assert result["primary_module_type"] == expected_category
 
-    def test_mixed_modules(self):
+    def test_mixed_modules(self, extractor):
         """Test detection of mixed module types without configuration."""
         pr_data = {
             "files": [
@@ -147,17 +61,18 @@ class TestModuleExtractorNoConfig:
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         assert result["total_modules"] == 5  # Test file should be ignored
 
         # Check module types
-        module_types = {m["type"] for m in result["modules"]}
+        module_types = set(result["modules_by_type"])
         assert "bid_adapter" in module_types
         assert "analytics_adapter" in module_types
         assert "rtd_module" in module_types
         assert "id_system" in module_types
         assert "generic" in module_types
+        assert sum(map(len, result["modules_by_type"].values())) == 5
 
         # Check categories
         categories = result["module_categories"]
@@ -167,7 +82,7 @@ class TestModuleExtractorNoConfig:
         assert categories["identity"] == 1
         assert categories["utility"] == 1  # Generic module
 
-    def test_primary_module_type_calculation(self):
+    def test_primary_module_type_calculation(self, extractor):
         """Test that primary module type is correctly calculated."""
         pr_data = {
             "files": [
@@ -180,13 +95,13 @@ class TestModuleExtractorNoConfig:
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         # Adapter category should have 3 bid adapters, making it primary
         assert result["primary_module_type"] == "adapter"
         assert result["module_categories"]["adapter"] == 3
 
-    def test_case_sensitivity(self):
+    def test_case_sensitivity(self, extractor):
         """Test that module detection is case-sensitive for types."""
         pr_data = {
             "files": [
@@ -197,18 +112,18 @@ class TestModuleExtractorNoConfig:
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         # Only the correctly cased one should be detected as bid_adapter
-        bid_adapters = [m for m in result["modules"] if m["type"] == "bid_adapter"]
+        bid_adapters = result["modules_by_type"].get("bid_adapter", [])
         assert len(bid_adapters) == 1
         assert bid_adapters[0]["name"] == "exampleBidAdapter"
 
         # Others should be generic
-        generic_modules = [m for m in result["modules"] if m["type"] == "generic"]
+        generic_modules = result["modules_by_type"].get("generic", [])
         assert len(generic_modules) == 2
 
-    def test_non_module_files_ignored(self):
+    def test_non_module_files_ignored(self, extractor):
         """Test that non-module files are not detected as modules."""
         pr_data = {
             "files": [
@@ -220,7 +135,7 @@ class TestModuleExtractorNoConfig:
             "repository": "prebid/Prebid.js",
         }
 
-        result = self.extractor.extract(pr_data)
+        result = extractor.extract(pr_data)
 
         # Should not detect any modules from these files
         assert result["total_modules"] == 0
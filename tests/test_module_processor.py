@@ -9,9 +9,9 @@ from src.pr_agents.pr_processing.processors.module_processor import ModuleProces
 class TestModuleProcessor:
     """Test cases for ModuleProcessor."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def processor(self):
-        """Create processor instance."""
+        """Create one processor for the class; it keeps no per-call state."""
         return ModuleProcessor()
 
     def test_process_prebid_js_modules(self, processor):
@@ -168,6 +168,16 @@ class TestJSONFormatter:
         assert parsed["object"] == "custom"
         assert "none_value" not in parsed  # None values are filtered
 
+    def test_save_to_file(self, formatter, tmp_path):
+        """Test saving writes the same UTF-8 document format() returns."""
+        data = {"title": "Añadir adaptador", "metadata": {"score": 85}}
+        file_path = tmp_path / "test.json"
+
+        formatter.save_to_file(data, file_path)
+
+        assert file_path.read_bytes() == formatter.format_bytes(data)
+        assert file_path.read_text(encoding="utf-8") == formatter.format(data)
+
     def test_validate_data(self, formatter):
         """Test data validation."""
         valid_data = {"key": "value", "number": 123}
@@ -28,33 +28,28 @@ class TestOutputManagerRepoStructure:
             },
         }
 
-    def test_repo_structure_enabled(self, manager, sample_pr_data, tmp_path):
+    def test_repo_structure_enabled(
+        self, manager, sample_pr_data, tmp_path, monkeypatch
+    ):
         """Test saving with repository structure enabled."""
-        # Change to tmp_path for testing
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            # Save with repo structure
-            saved_path = manager.save(
-                sample_pr_data,
-                "test-file",
-                format_type="markdown",
-                repo_structure=True,
-            )
-
-            # Check path structure
-            assert saved_path.exists()
-            assert "output/Prebid.js/test-file.md" in str(saved_path)
-
-            # Verify directory structure was created
-            output_dir = Path("output/Prebid.js")
-            assert output_dir.exists()
-            assert output_dir.is_dir()
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(tmp_path)
+
+        # Save with repo structure
+        saved_path = manager.save(
+            sample_pr_data,
+            "test-file",
+            format_type="markdown",
+            repo_structure=True,
+        )
+
+        # Check path structure
+        assert saved_path.exists()
+        assert "output/Prebid.js/test-file.md" in str(saved_path)
+
+        # Verify directory structure was created
+        output_dir = Path("output/Prebid.js")
+        assert output_dir.exists()
+        assert output_dir.is_dir()
 
     def test_repo_structure_disabled(self, manager, sample_pr_data, tmp_path):
         """Test saving with repository structure disabled."""
@@ -70,51 +65,42 @@ class TestOutputManagerRepoStructure:
         assert saved_path == tmp_path / "test-file.md"
         assert saved_path.exists()
 
-    def test_auto_naming_with_pr_number(self, manager, sample_pr_data, tmp_path):
+    def test_auto_naming_with_pr_number(
+        self, manager, sample_pr_data, tmp_path, monkeypatch
+    ):
         """Test auto-naming with PR number."""
-        # Change to tmp_path
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            saved_path = manager.save(
-                sample_pr_data,
-                "analysis",  # Use generic name that should be replaced
-                format_type="markdown",
-                auto_name=True,
-            )
-
-            # Should use PR number and module in filename
-            assert saved_path.name == "PR12440-seedtagBidAdapter.md"
-        finally:
-            os.chdir(original_cwd)
-
-    def test_auto_naming_with_module(self, manager, sample_pr_data, tmp_path):
+        monkeypatch.chdir(tmp_path)
+
+        saved_path = manager.save(
+            sample_pr_data,
+            "analysis",  # Use generic name that should be replaced
+            format_type="markdown",
+            auto_name=True,
+        )
+
+        # Should use PR number and module in filename
+        assert saved_path.name == "PR12440-seedtagBidAdapter.md"
+
+    def test_auto_naming_with_module(
+        self, manager, sample_pr_data, tmp_path, monkeypatch
+    ):
         """Test auto-naming includes module name."""
         # Add module to trigger module naming
         sample_pr_data["modules"]["modules"][0]["name"] = "appnexusBidAdapter"
 
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
-        try:
-            saved_path = manager.save(
-                sample_pr_data,
-                "analysis",  # Use generic name
-                format_type="markdown",
-                auto_name=True,
-            )
+        saved_path = manager.save(
+            sample_pr_data,
+            "analysis",  # Use generic name
+            format_type="markdown",
+            auto_name=True,
+        )
 
-            # Should include PR number and module
-            assert saved_path.name == "PR12440-appnexusBidAdapter.md"
-        finally:
-            os.chdir(original_cwd)
+        # Should include PR number and module
+        assert saved_path.name == "PR12440-appnexusBidAdapter.md"
 
-    def test_auto_naming_multiple_modules(self, manager, tmp_path):
+    def test_auto_naming_multiple_modules(self, manager, tmp_path, monkeypatch):
         """Test auto-naming with multiple modules."""
         data = {
             "pr_number": 123,
@@ -127,23 +113,17 @@ class TestOutputManagerRepoStructure:
             },
         }
 
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
-        try:
-            saved_path = manager.save(
-                data,
-                "analysis",  # Use generic name
-                format_type="markdown",
-                auto_name=True,
-            )
+        saved_path = manager.save(
+            data,
+            "analysis",  # Use generic name
+            format_type="markdown",
+            auto_name=True,
+        )
 
-            # Should show "multiple" when more than 2 modules
-            assert saved_path.name == "PR123-multiple-modules.md"
-        finally:
-            os.chdir(original_cwd)
+        # Should show "multiple" when more than 2 modules
+        assert saved_path.name == "PR123-multiple-modules.md"
 
     def test_auto_naming_no_pr_number(self, manager, tmp_path):
         """Test auto-naming without PR number."""
@@ -194,7 +174,7 @@ class TestOutputManagerRepoStructure:
         # Should save without repo structure when info is missing
         assert saved_path == tmp_path / "test.md"
 
-    def test_special_characters_in_module_names(self, manager, tmp_path):
+    def test_special_characters_in_module_names(self, manager, tmp_path, monkeypatch):
         """Test that special characters are cleaned from module names."""
         data = {
             "pr_number": 123,
@@ -203,44 +183,32 @@ class TestOutputManagerRepoStructure:
             },
         }
 
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
-        try:
-            saved_path = manager.save(
-                data,
-                "analysis",  # Use generic name
-                format_type="markdown",
-                auto_name=True,
-            )
+        saved_path = manager.save(
+            data,
+            "analysis",  # Use generic name
+            format_type="markdown",
+            auto_name=True,
+        )
 
-            # Special characters should be removed
-            assert saved_path.name == "PR123-testmoduleadapter.md"
-        finally:
-            os.chdir(original_cwd)
+        # Special characters should be removed
+        assert saved_path.name == "PR123-testmoduleadapter.md"
 
     def test_combined_repo_structure_and_auto_naming(
-        self, manager, sample_pr_data, tmp_path
+        self, manager, sample_pr_data, tmp_path, monkeypatch
     ):
         """Test using both repository structure and auto-naming together."""
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            saved_path = manager.save(
-                sample_pr_data,
-                "analysis",  # Use generic name
-                format_type="markdown",
-                repo_structure=True,
-                auto_name=True,
-            )
-
-            # Should have both repo structure and auto-generated name
-            assert "output/Prebid.js/PR12440-seedtagBidAdapter.md" in str(saved_path)
-            assert saved_path.exists()
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(tmp_path)
+
+        saved_path = manager.save(
+            sample_pr_data,
+            "analysis",  # Use generic name
+            format_type="markdown",
+            repo_structure=True,
+            auto_name=True,
+        )
+
+        # Should have both repo structure and auto-generated name
+        assert "output/Prebid.js/PR12440-seedtagBidAdapter.md" in str(saved_path)
+        assert saved_path.exists()
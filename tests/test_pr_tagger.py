@@ -143,6 +143,13 @@ class TestPRTaggerProcessor:
         tag3 = HierarchicalTag(primary="dev")
         assert tag3.to_string() == "dev"
 
+    def test_hierarchical_tag_string_shared(self):
+        """Test equal tags render to the same string object."""
+        first = HierarchicalTag("source", "modules", "adapters").to_string()
+        second = HierarchicalTag.from_path(["source", "modules", "adapters"])
+
+        assert second.to_string() is first
+
     def test_file_tag_operations(self):
         """Test FileTag operations."""
         file_tag = FileTag(filepath="modules/testAdapter.js")
@@ -301,14 +308,38 @@ class TestPRTaggerProcessor:
         assert len(file_tags) > 0
 
         # Check if any tags were applied (might not match the exact pattern)
-        all_file_tags = []
-        for file_data in file_tags.values():
-            all_file_tags.extend(file_data.get("tags", []))
+        all_file_tags = {
+            tag for file_data in file_tags.values() for tag in file_data.get("tags", [])
+        }
+        # PR-level tags are the union of every file's tags
+        assert all_file_tags <= set(tagging_data["pr_tags"])
 
         # The processor might apply tags differently than expected
         # Let's just check that some processing happened
         assert tagging_data["stats"]["total_files"] > 0
 
+    def test_prebuilt_registry_skips_yaml_parsing(self):
+        """Test an injected registry is used without parsing YAML files."""
+        from src.pr_agents.pr_processing.tagging_models import YAMLRegistryStructure
+
+        registry = YAMLRegistryStructure(
+            repo_url="https://github.com/prebid/Prebid.js",
+            structure={"docs": "++"},
+        )
+
+        with patch(
+            "src.pr_agents.pr_processing.registry_loader.RegistryLoader._load_registry_file"
+        ) as mock_load_file:
+            processor = PRTaggerProcessor(registry=registry)
+
+        mock_load_file.assert_not_called()
+        assert (
+            processor.registry_loader.get_repo_registry(
+                "https://github.com/prebid/Prebid.js"
+            )
+            is registry
+        )
+
     def test_pattern_evaluator_integration(self, processor):
         """Test pattern evaluator integration."""
         evaluator = PatternEvaluator()
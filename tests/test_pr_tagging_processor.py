@@ -71,6 +71,16 @@ class TestFileTag:
         assert file_tag.hierarchical_tags[0].secondary == "core"
         assert "source.core" in file_tag.flat_tags
 
+    def test_models_use_slots(self):
+        """Test tagging models do not carry a per-instance __dict__."""
+        file_tag = FileTag(filepath="src/core.js")
+        file_tag.add_hierarchical_tag("source", "core")
+
+        assert not hasattr(file_tag, "__dict__")
+        assert not hasattr(file_tag.hierarchical_tags[0], "__dict__")
+        assert not hasattr(YAMLPattern(["source"], "++"), "__dict__")
+        assert not hasattr(TaggingResult(), "__dict__")
+
 
 class TestTaggingResult:
     """Test TaggingResult model."""
@@ -431,6 +441,9 @@ class TestPRTaggerProcessor:
         # Check file tags
         assert len(data["file_tags"]) == 4
 
+        # Registry patterns are parsed once for the PR, not per file
+        mock_registry_loader.return_value.parse_structure_patterns.assert_called_once()
+
         # Check module file
         module_tags = data["file_tags"]["modules/rubiconBidAdapter.js"]
         assert "bid_adapter" in module_tags["module_categories"]
@@ -445,8 +458,12 @@ class TestPRTaggerProcessor:
         assert data["pr_impact_level"] in ["high", "medium", "low", "minimal"]
 
         # Check statistics
-        assert data["stats"]["total_files"] == 4
-        assert data["stats"]["core_files_count"] == 1
-        assert data["stats"]["test_files_count"] == 1
-        assert data["stats"]["doc_files_count"] == 1
-        assert data["stats"]["new_files_count"] == 1
+        stats = data["stats"]
+        expected = {
+            "total_files": 4,
+            "core_files_count": 1,
+            "test_files_count": 1,
+            "doc_files_count": 1,
+            "new_files_count": 1,
+        }
+        assert {key: stats[key] for key in expected} == expected
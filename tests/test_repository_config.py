@@ -2,7 +2,6 @@
 Tests for repository configuration components.
 """
 
-import json
 import tempfile
 from pathlib import Path
 
@@ -18,6 +17,7 @@ from src.pr_agents.config.models import (
     RepositoryStructure,
     VersionConfig,
 )
+from tests.utils import json_bytes
 
 
 class TestRepositoryModels:
@@ -205,8 +205,8 @@ class TestConfigurationLoader:
 
     def test_load_config(self, sample_config):
         """Test loading configuration from JSON."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(sample_config, f)
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".json", delete=False) as f:
+            f.write(json_bytes(sample_config))
             temp_path = f.name
 
         try:
@@ -274,8 +274,8 @@ class TestRepositoryStructureManager:
     @pytest.fixture
     def manager_with_config(self, sample_config):
         """Create manager with test configuration."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(sample_config, f)
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".json", delete=False) as f:
+            f.write(json_bytes(sample_config))
             temp_path = f.name
 
         manager = RepositoryStructureManager(temp_path)
@@ -2,12 +2,15 @@
 Tests for Repository Structure Configuration system.
 """
 
-import json
-
 import pytest
 
+from src.pr_agents.config.exceptions import ConfigurationLoadError
 from src.pr_agents.config.loader import ConfigurationLoader
-from src.pr_agents.config.manager import RepositoryStructureManager
+from src.pr_agents.config.manager import (
+    RepositoryStructureManager,
+    _compile_path_rule,
+    _matches_path_rule,
+)
 from src.pr_agents.config.models import (
     DetectionStrategy,
     FetchStrategy,
@@ -15,6 +18,7 @@ from src.pr_agents.config.models import (
     ModulePattern,
     RepositoryStructure,
 )
+from tests.utils import write_json
 
 
 class TestConfigurationModels:
@@ -34,6 +38,14 @@ class TestConfigurationModels:
         assert pattern.name_extraction == "remove_suffix:BidAdapter"
         assert "test/*" in pattern.exclude_patterns
 
+    def test_models_use_slots(self):
+        """Test config models do not carry a per-instance __dict__."""
+        pattern = ModulePattern("*BidAdapter.js", "suffix")
+        category = ModuleCategory("bid_adapter", "Bid Adapters", [], [pattern])
+
+        assert not hasattr(pattern, "__dict__")
+        assert not hasattr(category, "__dict__")
+
     def test_module_category_creation(self):
         """Test ModuleCategory creation."""
         pattern = ModulePattern("*BidAdapter.js", "suffix")
@@ -127,7 +139,7 @@ class TestConfigurationLoader:
         """Test loading configuration from JSON."""
         # Create temporary config file
         config_file = tmp_path / "test_config.json"
-        config_file.write_text(json.dumps(sample_config))
+        write_json(config_file, sample_config)
 
         # Load configuration
         loader = ConfigurationLoader(str(config_file))
@@ -237,7 +249,7 @@ class TestRepositoryStructureManager:
         }
 
         config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps(config_data))
+        write_json(config_file, config_data)
 
         return RepositoryStructureManager(str(config_file))
 
@@ -253,6 +265,38 @@ class TestRepositoryStructureManager:
         for url, expected in test_cases:
             assert manager_with_config._extract_repo_name(url) == expected
 
+    def test_config_is_loaded_lazily(self, tmp_path):
+        """Test construction defers loading until the config is needed."""
+        manager = RepositoryStructureManager(str(tmp_path / "missing.json"))
+
+        assert manager._config is None
+        assert manager.get_repository("") is None
+        assert manager.get_repository("not-a-url") is None
+        assert manager.categorize_file("not-a-url", "src/a.js")["categories"] == []
+        assert manager._config is None
+
+        with pytest.raises(ConfigurationLoadError):
+            manager.get_repository("https://github.com/prebid/Prebid.js")
+
+    def test_failed_load_raises_on_every_access(self, tmp_path):
+        """Test a failed load is not cached as an empty configuration."""
+        manager = RepositoryStructureManager(str(tmp_path / "missing.json"))
+        url = "https://github.com/prebid/Prebid.js"
+
+        with pytest.raises(ConfigurationLoadError):
+            manager.get_repository(url)
+        with pytest.raises(ConfigurationLoadError):
+            manager.get_repository(url)
+        assert manager._config is None
+
+    def test_get_repository_names(self, manager_with_config):
+        """Test listing repositories from the flat lookup tables."""
+        assert manager_with_config.get_repository_names() == ["prebid/Prebid.js"]
+        assert manager_with_config.get_repository_names("prebid-js") == [
+            "prebid/Prebid.js"
+        ]
+        assert manager_with_config.get_repository_names("prebid-server-go") == []
+
     def test_categorize_file_pre_v10(self, manager_with_config):
         """Test file categorization for pre-v10 files."""
         repo_url = "https://github.com/prebid/Prebid.js"
@@ -281,6 +325,17 @@ class TestRepositoryStructureManager:
         )
         assert result["is_test"] is True
 
+    def test_path_rules_match_is_path_type(self, manager_with_config):
+        """Test precompiled path rules agree with the list-based check."""
+        paths = ["src/", "test/*/spec/*", "docs/"]
+        rule = _compile_path_rule(paths)
+
+        assert rule == (("src/", "docs/"), ("test/*/spec/*",))
+        for filepath in ["src/a.js", "test/unit/spec/a.js", "test/a.js", "lib/x.js"]:
+            assert _matches_path_rule(
+                filepath, rule
+            ) == manager_with_config._is_path_type(filepath, paths)
+
     def test_categorize_file_v10_plus(self, manager_with_config):
         """Test file categorization for v10+ metadata files."""
         repo_url = "https://github.com/prebid/Prebid.js"
@@ -304,6 +359,21 @@ class TestRepositoryStructureManager:
         assert info["module_type"] == "Bid Adapters"
         assert info["repo_type"] == "prebid-js"
 
+    def test_get_module_info_is_memoized(self, manager_with_config):
+        """Test module info is cached per file and dropped on reload."""
+        repo_url = "https://github.com/prebid/Prebid.js"
+        filepath = "modules/appnexusBidAdapter.js"
+
+        first = manager_with_config.get_module_info(repo_url, filepath)
+        first["categories"].append("mutated")
+        second = manager_with_config.get_module_info(repo_url, filepath)
+
+        assert second["categories"] == ["bid_adapter"]
+        assert len(manager_with_config._module_info_cache) == 1
+
+        manager_with_config.reload_config()
+        assert len(manager_with_config._module_info_cache) == 0
+
     def test_pattern_matching(self, manager_with_config):
         """Test various pattern matching scenarios."""
         # Test suffix pattern
@@ -4,9 +4,11 @@ Tests for YAML registry components.
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from src.pr_agents.pr_processing import pattern_evaluator
 from src.pr_agents.pr_processing.pattern_evaluator import PatternEvaluator
 from src.pr_agents.pr_processing.registry_loader import RegistryLoader
 from src.pr_agents.pr_processing.tagging_models import YAMLPattern
@@ -253,6 +255,64 @@ class TestPatternEvaluator:
         matches = evaluator.evaluate_file("package.yml", [pattern], "modified")
         assert len(matches) == 0
 
+    def test_plus_plus_pattern_matches_modified_files(self, evaluator):
+        """Test ++ patterns match any file under their path, not only new ones."""
+        pattern = YAMLPattern(["source", "modules"], "++", None, ["new_module"])
+
+        matches = evaluator.evaluate_file(
+            "source/modules/newModule.js", [pattern], "modified"
+        )
+
+        assert len(matches) == 1
+        assert matches[0][1]["is_new_addition"] is False
+
+    def test_pattern_compiled_once(self, evaluator):
+        """Test a pattern is parsed once and reused for every file."""
+        pattern = YAMLPattern(["modules"], "path", "*BidAdapter.js", ["bid_adapter"])
+        files = ["modules/aBidAdapter.js", "modules/bBidAdapter.js", "src/c.js"]
+
+        with patch.object(
+            pattern_evaluator, "_glob_matcher", wraps=pattern_evaluator._glob_matcher
+        ) as glob_matcher:
+            pattern_evaluator._compile_matcher.cache_clear()
+            matched = [f for f in files if evaluator.evaluate_file(f, [pattern])]
+
+        assert matched == files[:2]
+        glob_matcher.assert_called_once_with("modules/*BidAdapter.js")
+
+    def test_overlapping_patterns_match_in_order(self, evaluator):
+        """Test every matching suffix and substring pattern is returned in order."""
+        patterns = [
+            YAMLPattern(["modules"], "includes", "rubicon", ["rubicon"]),
+            YAMLPattern(["modules"], "endsWith", "Adapter.js", ["adapter"]),
+            YAMLPattern(["modules"], "endsWith", "BidAdapter.js", ["bid_adapter"]),
+            YAMLPattern(["modules"], "endsWith", "RtdProvider.js", ["rtd"]),
+            YAMLPattern(["modules"], "includes", "RUBICON", ["rubicon_upper"]),
+        ]
+
+        matches = evaluator.evaluate_file("modules/rubiconBidAdapter.js", patterns)
+
+        assert [pattern for pattern, _ in matches] == [
+            patterns[0],
+            patterns[1],
+            patterns[2],
+            patterns[4],
+        ]
+
+    def test_nested_prefixes_match_by_component(self, evaluator):
+        """Test patterns at each prefix depth apply, but not partial dir names."""
+        patterns = [
+            YAMLPattern(["src", "core"], "++", None, ["core"]),
+            YAMLPattern([], "endsWith", ".js", ["js"]),
+            YAMLPattern(["src"], "++", None, ["src"]),
+            YAMLPattern(["src", "co"], "++", None, ["partial"]),
+        ]
+
+        matches = evaluator.evaluate_file("src/core/auction.js", patterns)
+
+        assert [pattern for pattern, _ in matches] == patterns[:3]
+        assert evaluator.evaluate_file("lib/core/auction.py", patterns) == []
+
     def test_is_under_path(self, evaluator):
         """Test path hierarchy checking."""
         assert evaluator._is_under_path("src/utils/test.js", "src/utils")
@@ -0,0 +1,71 @@
+"""Tests for knowledge base loading in the enhanced repository provider."""
+
+import json
+
+import pytest
+import yaml
+
+from src.pr_agents.config.io_utils import yaml_to_json
+from src.pr_agents.services.agents.context.enhanced_repository import (
+    EnhancedRepositoryContextProvider,
+)
+
+
+class TestKnowledgeBaseLoading:
+    """Test JSON-first knowledge base loading with YAML fallback."""
+
+    @pytest.fixture
+    def provider(self, tmp_path, monkeypatch):
+        """Create a fresh provider instance rooted at a temp knowledge dir."""
+        monkeypatch.setattr(EnhancedRepositoryContextProvider, "_instance", None)
+        monkeypatch.setattr(EnhancedRepositoryContextProvider, "_initialized", False)
+        return EnhancedRepositoryContextProvider(tmp_path)
+
+    def test_yaml_fallback(self, provider, tmp_path):
+        """Test YAML knowledge is used when there is no JSON copy."""
+        (tmp_path / "prebid-js.yaml").write_text(
+            yaml.safe_dump({"description": "from yaml"})
+        )
+
+        knowledge = provider._load_knowledge_base("prebid-js")
+
+        assert knowledge == {"description": "from yaml"}
+
+    def test_json_preferred_over_yaml(self, provider, tmp_path):
+        """Test a JSON knowledge file wins over the YAML source."""
+        (tmp_path / "prebid-js.yaml").write_text(
+            yaml.safe_dump({"description": "from yaml"})
+        )
+        (tmp_path / "prebid-js.json").write_text(
+            json.dumps({"description": "from json"})
+        )
+
+        knowledge = provider._load_knowledge_base("prebid-js")
+
+        assert knowledge == {"description": "from json"}
+
+    def test_corrupt_json_falls_back_to_yaml(self, provider, tmp_path):
+        """Test an unreadable JSON copy does not hide the YAML source."""
+        (tmp_path / "prebid-js.yaml").write_text(
+            yaml.safe_dump({"description": "from yaml"})
+        )
+        (tmp_path / "prebid-js.json").write_text("{not json")
+
+        knowledge = provider._load_knowledge_base("prebid-js")
+
+        assert knowledge == {"description": "from yaml"}
+
+    def test_yaml_to_json(self, tmp_path):
+        """Test the migration helper writes an equivalent compact JSON file."""
+        knowledge = {
+            "repository": "prebid/Prebid.js",
+            "patterns": {"error_handling": ["try_catch"]},
+        }
+        yaml_path = tmp_path / "prebid-js.yaml"
+        yaml_path.write_text(yaml.safe_dump(knowledge))
+
+        json_path = yaml_to_json(yaml_path)
+
+        assert json_path == tmp_path / "prebid-js.json"
+        assert json.loads(json_path.read_text()) == knowledge
+        assert ": " not in json_path.read_text()
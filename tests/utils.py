@@ -8,6 +8,24 @@ code duplication.
 
 import subprocess
 import sys
+from pathlib import Path
+from typing import Any
+
+from src.pr_agents.config.io_utils import dumps_json
+
+
+def json_bytes(data: Any) -> bytes:
+    """
+    Serialize fixture data to compact JSON bytes.
+
+    The result is written as bytes, so no separate text encode step is needed.
+    """
+    return dumps_json(data)
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write fixture data to a JSON file."""
+    path.write_bytes(json_bytes(data))
 
 
 def verify_pr_urls(pr_urls: dict[str, str]) -> None: